@@ -35,7 +35,7 @@ from autoastro.hyper import hyper_data
 from autolens import simulator
 from autolens import masked
 from autolens.lens.plane import Plane
-from autolens.lens.ray_tracing import Tracer
+from autolens.lens.ray_tracing import DeflectionsInterpolation, Tracer, TracerPlan
 from autolens import util
 from autolens.fit.fit import fit
 from autolens.fit.fit import PositionsFit as fit_positions
@@ -55,6 +55,7 @@ from autolens.pipeline.phase.extensions.inversion_phase import (
 )
 from autolens.pipeline.phase.abstract.phase import AbstractPhase
 from autolens.pipeline.phase.dataset.phase import PhaseDataset
+from autolens.pipeline.phase.dataset.dataset_store import DatasetStore
 from autolens.pipeline.phase.imaging.phase import PhaseImaging
 from autolens.pipeline.phase.interferometer.phase import PhaseInterferometer
 from autolens.pipeline.phase.phase_galaxy import PhaseGalaxy
@@ -62,4 +63,4 @@ from autolens.pipeline.pipeline import PipelineDataset, PipelinePositions
 from autolens.pipeline import setup
 from autolens import plot
 
-__version__ = '0.38.4'
+__version__ = "0.38.4"
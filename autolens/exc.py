@@ -13,6 +13,10 @@ class PhaseException(Exception):
     pass
 
 
+class DelayedAcceptanceException(af.exc.FitException):
+    pass
+
+
 class PixelizationException(af.exc.FitException):
     pass
 
@@ -1,8 +1,10 @@
 import numpy as np
 
 from autoarray.fit import fit as aa_fit
+from autoarray.util import fit_util
 from autoastro.galaxy import galaxy as g
 from autolens.masked import masked_dataset as md
+from autolens.util import lens_util
 
 
 def fit(masked_dataset, tracer, hyper_image_sky=None, hyper_background_noise=None):
@@ -22,7 +24,105 @@ def fit(masked_dataset, tracer, hyper_image_sky=None, hyper_background_noise=Non
         )
 
 
-class ImagingFit(aa_fit.ImagingFit):
+def chi_squared_and_noise_normalization_from_data_noise_map_and_model_data(
+    data, noise_map, model_data
+):
+    """Compute the chi-squared and noise normalization of a model-data fit to data directly from their raw buffers, \
+    where the residuals are computed into a single array which is normalized and squared in-place, such that the \
+    residual-map, normalized residual-map and chi-squared map of the fit are never created.
+
+    The summations are the same as those of *fit_util*, such that the values are identical to those computed from \
+    the maps.
+
+    Parameters
+    -----------
+    data : np.ndarray
+        The observed data that is fitted.
+    noise_map : np.ndarray
+        The noise-map of the observed data.
+    model_data : np.ndarray
+        The model data the data is fitted with.
+    """
+    noise_map = np.asarray(noise_map)
+
+    chi_squared_map = np.subtract(np.asarray(data), np.asarray(model_data))
+    np.divide(chi_squared_map, noise_map, out=chi_squared_map)
+    np.square(chi_squared_map, out=chi_squared_map)
+
+    return (
+        np.sum(chi_squared_map),
+        fit_util.noise_normalization_from_noise_map(noise_map=noise_map),
+    )
+
+
+def figure_of_merit_from_chi_squared_noise_normalization_and_inversion(
+    chi_squared, noise_normalization, inversion
+):
+    """Compute the figure of merit of a fit from its chi-squared and noise normalization, which is the likelihood \
+    if there is no inversion and the Bayesian evidence (which includes the inversion's regularization and \
+    log determinant terms) if there is.
+
+    Parameters
+    -----------
+    chi_squared : float
+        The chi-squared term of the fit.
+    noise_normalization : float
+        The normalization noise-map term of the fit.
+    inversion : inversions.Inversion or None
+        The inversion of the fit, if it has one.
+    """
+    if inversion is None:
+        return fit_util.likelihood_from_chi_squared_and_noise_normalization(
+            chi_squared=chi_squared, noise_normalization=noise_normalization
+        )
+
+    return fit_util.evidence_from_inversion_terms(
+        chi_squared=chi_squared,
+        regularization_term=inversion.regularization_term,
+        log_curvature_regularization_term=inversion.log_det_curvature_reg_matrix_term,
+        log_regularization_term=inversion.log_det_regularization_matrix_term,
+        noise_normalization=noise_normalization,
+    )
+
+
+class AbstractLensFit:
+
+    _chi_squared_and_noise_normalization = None
+
+    @property
+    def chi_squared_and_noise_normalization(self):
+        """The chi-squared and noise normalization of the fit, which are computed once from the raw data, noise-map \
+        and model data buffers (see *chi_squared_and_noise_normalization_from_data_noise_map_and_model_data*).
+
+        The likelihood, evidence and figure of merit of the fit only use these and the inversion's terms, such that \
+        a fit performed by a non-linear search never creates its residual-map, normalized residual-map or \
+        chi-squared map, which are only computed if they are accessed (e.g. for visualization).
+        """
+        if self._chi_squared_and_noise_normalization is None:
+            self._chi_squared_and_noise_normalization = chi_squared_and_noise_normalization_from_data_noise_map_and_model_data(
+                data=self.data, noise_map=self.noise_map, model_data=self.model_data
+            )
+
+        return self._chi_squared_and_noise_normalization
+
+    @property
+    def chi_squared(self):
+        return self.chi_squared_and_noise_normalization[0]
+
+    @property
+    def noise_normalization(self):
+        return self.chi_squared_and_noise_normalization[1]
+
+    @property
+    def figure_of_merit(self):
+        return figure_of_merit_from_chi_squared_noise_normalization_and_inversion(
+            chi_squared=self.chi_squared,
+            noise_normalization=self.noise_normalization,
+            inversion=self.inversion,
+        )
+
+
+class ImagingFit(AbstractLensFit, aa_fit.ImagingFit):
     def __init__(
         self, masked_imaging, tracer, hyper_image_sky=None, hyper_background_noise=None
     ):
@@ -50,11 +150,18 @@ class ImagingFit(aa_fit.ImagingFit):
             hyper_background_noise=hyper_background_noise,
         )
 
-        self.blurred_profile_image = tracer.blurred_profile_image_from_grid_and_convolver(
-            grid=masked_imaging.grid,
-            convolver=masked_imaging.convolver,
-            blurring_grid=masked_imaging.blurring_grid,
-        )
+        if masked_imaging.preloads_apply_to_tracer(tracer=tracer):
+            tracer.cache_traced_grids_of_planes_of_grid(
+                grid=masked_imaging.grid,
+                traced_grids_of_planes=masked_imaging.preload_traced_grids_of_planes,
+            )
+            self.blurred_profile_image = masked_imaging.preload_blurred_profile_image
+        else:
+            self.blurred_profile_image = tracer.blurred_profile_image_from_grid_and_convolver(
+                grid=masked_imaging.grid,
+                convolver=masked_imaging.convolver,
+                blurring_grid=masked_imaging.blurring_grid,
+            )
 
         self.profile_subtracted_image = image - self.blurred_profile_image
 
@@ -101,17 +208,20 @@ class ImagingFit(aa_fit.ImagingFit):
             blurring_grid=self.masked_imaging.blurring_grid,
         )
 
-        # TODO : Extend to multiple inversioons across Planes
+        if self.inversion is not None:
 
-        for plane_index in self.tracer.plane_indexes_with_pixelizations:
+            for plane_index, mapped_reconstructed_image in zip(
+                self.tracer.plane_indexes_with_pixelizations,
+                self.inversion.mapped_reconstructed_images_of_mappers,
+            ):
 
-            galaxy_model_image_dict.update(
-                {
-                    self.tracer.planes[plane_index].galaxies[
-                        0
-                    ]: self.inversion.mapped_reconstructed_image
-                }
-            )
+                galaxy_model_image_dict.update(
+                    {
+                        self.tracer.planes[plane_index].galaxies[
+                            0
+                        ]: mapped_reconstructed_image
+                    }
+                )
 
         return galaxy_model_image_dict
 
@@ -124,11 +234,14 @@ class ImagingFit(aa_fit.ImagingFit):
             blurring_grid=self.masked_imaging.blurring_grid,
         )
 
-        for plane_index in self.tracer.plane_indexes_with_pixelizations:
+        if self.inversion is not None:
+
+            for plane_index, mapped_reconstructed_image in zip(
+                self.tracer.plane_indexes_with_pixelizations,
+                self.inversion.mapped_reconstructed_images_of_mappers,
+            ):
 
-            model_images_of_planes[
-                plane_index
-            ] += self.inversion.mapped_reconstructed_image
+                model_images_of_planes[plane_index] += mapped_reconstructed_image
 
         return model_images_of_planes
 
@@ -155,7 +268,7 @@ class ImagingFit(aa_fit.ImagingFit):
         return len(list(filter(None, self.tracer.regularizations_of_planes)))
 
 
-class InterferometerFit(aa_fit.InterferometerFit):
+class InterferometerFit(AbstractLensFit, aa_fit.InterferometerFit):
     def __init__(self, masked_interferometer, tracer, hyper_background_noise=None):
         """ An  lens fitter, which contains the tracer's used to perform the fit and functions to manipulate \
         the lens dataset's hyper_galaxies.
@@ -232,17 +345,20 @@ class InterferometerFit(aa_fit.InterferometerFit):
             if hasattr(image, "in_1d_binned"):
                 galaxy_model_image_dict[path] = image.in_1d_binned
 
-        # TODO : Extend to multiple inversioons across Planes
+        if self.inversion is not None:
 
-        for plane_index in self.tracer.plane_indexes_with_pixelizations:
+            for plane_index, mapped_reconstructed_image in zip(
+                self.tracer.plane_indexes_with_pixelizations,
+                self.inversion.mapped_reconstructed_images_of_mappers,
+            ):
 
-            galaxy_model_image_dict.update(
-                {
-                    self.tracer.planes[plane_index].galaxies[
-                        0
-                    ]: self.inversion.mapped_reconstructed_image
-                }
-            )
+                galaxy_model_image_dict.update(
+                    {
+                        self.tracer.planes[plane_index].galaxies[
+                            0
+                        ]: mapped_reconstructed_image
+                    }
+                )
 
         return galaxy_model_image_dict
 
@@ -256,17 +372,20 @@ class InterferometerFit(aa_fit.InterferometerFit):
             transformer=self.masked_interferometer.transformer,
         )
 
-        # TODO : Extend to multiple inversioons across Planes
+        if self.inversion is not None:
 
-        for plane_index in self.tracer.plane_indexes_with_pixelizations:
+            for plane_index, mapped_reconstructed_visibilities in zip(
+                self.tracer.plane_indexes_with_pixelizations,
+                self.inversion.mapped_reconstructed_visibilities_of_mappers,
+            ):
 
-            galaxy_model_visibilities_dict.update(
-                {
-                    self.tracer.planes[plane_index].galaxies[
-                        0
-                    ]: self.inversion.mapped_reconstructed_visibilities
-                }
-            )
+                galaxy_model_visibilities_dict.update(
+                    {
+                        self.tracer.planes[plane_index].galaxies[
+                            0
+                        ]: mapped_reconstructed_visibilities
+                    }
+                )
 
         return galaxy_model_visibilities_dict
 
@@ -277,11 +396,16 @@ class InterferometerFit(aa_fit.InterferometerFit):
             transformer=self.masked_interferometer.transformer,
         )
 
-        for plane_index in self.tracer.plane_indexes_with_pixelizations:
+        if self.inversion is not None:
 
-            model_visibilities_of_planes[
-                plane_index
-            ] += self.inversion.mapped_reconstructed_image
+            for plane_index, mapped_reconstructed_visibilities in zip(
+                self.tracer.plane_indexes_with_pixelizations,
+                self.inversion.mapped_reconstructed_visibilities_of_mappers,
+            ):
+
+                model_visibilities_of_planes[
+                    plane_index
+                ] += mapped_reconstructed_visibilities
 
         return model_visibilities_of_planes
 
@@ -309,23 +433,34 @@ class PositionsFit:
         self.noise_map = noise_map
 
     def maximum_separation_within_threshold(self, threshold):
-        return max(self.maximum_separations) <= threshold
+        """Whether the maximum separation of every set of positions is within the threshold, which stops computing \
+        separations as soon as any pair of positions exceeds it."""
+        return lens_util.positions_within_threshold_from_grid_1d_and_set_sizes(
+            grid_1d=self.source_plane_positions.in_1d,
+            set_sizes=np.array(
+                [len(positions) for positions in self.source_plane_positions]
+            ),
+            threshold=threshold,
+        )
 
     @property
     def maximum_separations(self):
-        return [
-            self.max_separation_of_grid(grid=position_list)
-            for position_list in self.source_plane_positions.list_in_1d
-        ]
+        return list(self.maximum_separations_from_threshold(threshold=np.inf))
+
+    def maximum_separations_from_threshold(self, threshold):
+        return lens_util.maximum_separations_from_grid_1d_and_set_sizes(
+            grid_1d=np.asarray(self.source_plane_positions.in_1d),
+            set_sizes=np.array(
+                [len(positions) for positions in self.source_plane_positions]
+            ),
+            threshold=threshold,
+        )
 
     @staticmethod
     def max_separation_of_grid(grid):
-        rdist_max = np.zeros((grid.sub_shape_1d))
-        for i in range(grid.sub_shape_1d):
-            xdists = np.square(np.subtract(grid[i, 0], grid[:, 0]))
-            ydists = np.square(np.subtract(grid[i, 1], grid[:, 1]))
-            rdist_max[i] = np.max(np.add(xdists, ydists))
-        return np.max(np.sqrt(rdist_max))
+        return lens_util.maximum_separations_from_grid_1d_and_set_sizes(
+            grid_1d=np.asarray(grid), set_sizes=np.array([len(grid)]), threshold=np.inf
+        )[0]
 
     @property
     def chi_squared_map(self):
@@ -348,7 +483,10 @@ def hyper_noise_map_from_noise_map_tracer_and_hyper_backkground_noise(
     noise_map, tracer, hyper_background_noise
 ):
 
-    hyper_noise_map = tracer.hyper_noise_map_from_noise_map(noise_map=noise_map)
+    if tracer.has_hyper_galaxy:
+        hyper_noise_map = tracer.hyper_noise_map_from_noise_map(noise_map=noise_map)
+    else:
+        hyper_noise_map = None
 
     if hyper_background_noise is not None:
         noise_map = hyper_background_noise.hyper_noise_map_from_noise_map(
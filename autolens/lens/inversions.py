@@ -0,0 +1,365 @@
+import numpy as np
+from scipy import sparse
+
+from autoarray.operators.inversion import inversions as inv
+from autoarray.structures import visibilities as vis
+from autoarray.util import inversion_util
+
+
+def mapping_matrix_from_mappers(mappers):
+    """Stack the mapping matrices of every mapper horizontally, such that the first *pixels* columns describe the \
+    first mapper's pixelization, the next columns the second mapper's and so on.
+
+    Every mapper must share the same image-plane (sub-)grid, which is the case for the mappers of a tracer's planes.
+
+    Parameters
+    -----------
+    mappers : [inversion.mappers.Mapper]
+        The mappers of every plane with a pixelization, in ascending redshift order.
+    """
+    return np.hstack([mapper.mapping_matrix for mapper in mappers])
+
+
+def regularization_matrix_from_mappers_and_regularizations(mappers, regularizations):
+    """Compute the regularization matrix of a joint inversion, which is block diagonal with one block per mapper \
+    because pixels of different source-planes are never regularized with one another.
+
+    The blocks are assembled with *scipy.sparse.block_diag* and the matrix returned dense, as it is added to the \
+    dense curvature matrix by the inversion.
+
+    Parameters
+    -----------
+    mappers : [inversion.mappers.Mapper]
+        The mappers of every plane with a pixelization, in ascending redshift order.
+    regularizations : [inversion.regularization.Regularization]
+        The regularization scheme of each mapper's pixelization.
+    """
+    return sparse.block_diag(
+        [
+            regularization.regularization_matrix_from_mapper(mapper=mapper)
+            for mapper, regularization in zip(mappers, regularizations)
+        ],
+        format="csr",
+    ).toarray()
+
+
+class StackedMapper:
+    def __init__(self, mappers):
+        """The mappers of every pixelized plane of a tracer presented to autoarray's inversions as one mapper, whose \
+        mapping matrix is the mappers' mapping matrices stacked horizontally (see *mapping_matrix_from_mappers*).
+
+        Parameters
+        -----------
+        mappers : [inversion.mappers.Mapper]
+            The mappers of every plane with a pixelization, in ascending redshift order.
+        """
+        self.mappers = mappers
+        self.mapping_matrix = mapping_matrix_from_mappers(mappers=mappers)
+
+    @property
+    def pixels(self):
+        return sum([mapper.pixels for mapper in self.mappers])
+
+    @property
+    def grid(self):
+        return self.mappers[-1].grid
+
+
+class StackedRegularization:
+    def __init__(self, regularizations):
+        """The regularizations of every pixelized plane of a tracer presented to autoarray's inversions as one \
+        regularization, whose regularization matrix for a *StackedMapper* is block diagonal (see \
+        *regularization_matrix_from_mappers_and_regularizations*).
+
+        Parameters
+        -----------
+        regularizations : [inversion.regularization.Regularization]
+            The regularization scheme of each mapper's pixelization, in ascending redshift order.
+        """
+        self.regularizations = regularizations
+
+    def regularization_matrix_from_mapper(self, mapper):
+        return regularization_matrix_from_mappers_and_regularizations(
+            mappers=mapper.mappers, regularizations=self.regularizations
+        )
+
+
+class AbstractJointInversion:
+    def __init__(self, mappers, regularizations):
+        """Behaviour shared by inversions which reconstruct the pixelizations of multiple planes simultaneously.
+
+        The reconstruction of a joint inversion is the concatenation of every mapper's reconstruction. The \
+        inherited *mapper* and *regularization* attributes refer to the final (highest redshift) pixelized plane, \
+        such that plotting and interpolation behave as they do for a single-plane inversion.
+
+        Parameters
+        -----------
+        mappers : [inversion.mappers.Mapper]
+            The mappers of every plane with a pixelization, in ascending redshift order.
+        regularizations : [inversion.regularization.Regularization]
+            The regularization scheme of each mapper's pixelization.
+        """
+        self.mappers = mappers
+        self.regularizations = regularizations
+
+    @property
+    def pixel_slices_of_mappers(self):
+        """The slice of the joint reconstruction (and the columns of the stacked mapping matrix) belonging to each \
+        mapper."""
+        pixels = np.cumsum([0] + [mapper.pixels for mapper in self.mappers])
+        return [slice(pixels[i], pixels[i + 1]) for i in range(len(self.mappers))]
+
+    @property
+    def reconstructions_of_mappers(self):
+        return [
+            self.reconstruction[pixel_slice]
+            for pixel_slice in self.pixel_slices_of_mappers
+        ]
+
+    def interpolated_values_from_shape_2d(self, values, shape_2d=None):
+        return super().interpolated_values_from_shape_2d(
+            values=values[self.pixel_slices_of_mappers[-1]], shape_2d=shape_2d
+        )
+
+
+class JointInversionImaging(AbstractJointInversion, inv.InversionImaging):
+    def __init__(
+        self,
+        image,
+        noise_map,
+        mappers,
+        regularizations,
+        blurred_mapping_matrix,
+        regularization_matrix,
+        curvature_reg_matrix,
+        reconstruction,
+    ):
+        """ An inversion which reconstructs the pixelizations of every pixelized plane of a tracer in one linear \
+        inversion, including a convolution that accounts for blurring.
+
+        The linear system is built and solved by autoarray's *InversionImaging* for a *StackedMapper* and \
+        *StackedRegularization*, such that the curvature matrix contains the cross terms between planes which \
+        account for the sources' light overlapping in the image.
+
+        For a single mapper the residual, normalized residual and chi-squared maps are those of autoarray's \
+        inversion, with one value per pixelization pixel. For multiple mappers the reconstructed pixels of different \
+        planes overlap in the image, therefore these maps are computed in the image-plane and have the shape of the \
+        masked data.
+
+        Parameters
+        -----------
+        image : ndarray
+            Flattened 1D array of the observed image the inversion is fitting.
+        noise_map : ndarray
+            Flattened 1D array of the noise-map used by the inversion during the fit.
+        mappers : [inversion.mappers.Mapper]
+            The mappers of every plane with a pixelization, in ascending redshift order.
+        regularizations : [inversion.regularization.Regularization]
+            The regularization scheme of each mapper's pixelization.
+        blurred_mapping_matrix : ndarray
+            The blurred mapping matrices of every mapper, stacked horizontally.
+        """
+        AbstractJointInversion.__init__(
+            self, mappers=mappers, regularizations=regularizations
+        )
+
+        inv.InversionImaging.__init__(
+            self,
+            image=image,
+            noise_map=noise_map,
+            mapper=mappers[-1],
+            regularization=regularizations[-1],
+            blurred_mapping_matrix=blurred_mapping_matrix,
+            regularization_matrix=regularization_matrix,
+            curvature_reg_matrix=curvature_reg_matrix,
+            reconstruction=reconstruction,
+        )
+
+    @classmethod
+    def from_data_mappers_and_regularizations(
+        cls, image, noise_map, convolver, mappers, regularizations
+    ):
+
+        inversion = inv.InversionImaging.from_data_mapper_and_regularization(
+            image=image,
+            noise_map=noise_map,
+            convolver=convolver,
+            mapper=StackedMapper(mappers=mappers),
+            regularization=StackedRegularization(regularizations=regularizations),
+        )
+
+        return JointInversionImaging(
+            image=image,
+            noise_map=noise_map,
+            mappers=mappers,
+            regularizations=regularizations,
+            blurred_mapping_matrix=inversion.blurred_mapping_matrix,
+            regularization_matrix=inversion.regularization_matrix,
+            curvature_reg_matrix=inversion.curvature_reg_matrix,
+            reconstruction=inversion.reconstruction,
+        )
+
+    @property
+    def mapped_reconstructed_images_of_mappers(self):
+        return [
+            self.mapper.grid.mapping.array_stored_1d_from_array_1d(
+                array_1d=inversion_util.mapped_reconstructed_data_from_mapping_matrix_and_reconstruction(
+                    mapping_matrix=self.blurred_mapping_matrix[:, pixel_slice],
+                    reconstruction=self.reconstruction[pixel_slice],
+                )
+            )
+            for pixel_slice in self.pixel_slices_of_mappers
+        ]
+
+    @property
+    def residual_map(self):
+        if len(self.mappers) == 1:
+            return super().residual_map
+
+        return self.mapper.grid.mapping.array_stored_1d_from_array_1d(
+            array_1d=np.subtract(self.image, self.mapped_reconstructed_image)
+        )
+
+    @property
+    def normalized_residual_map(self):
+        if len(self.mappers) == 1:
+            return super().normalized_residual_map
+
+        return self.mapper.grid.mapping.array_stored_1d_from_array_1d(
+            array_1d=np.divide(self.residual_map, self.noise_map)
+        )
+
+    @property
+    def chi_squared_map(self):
+        if len(self.mappers) == 1:
+            return super().chi_squared_map
+
+        return self.mapper.grid.mapping.array_stored_1d_from_array_1d(
+            array_1d=np.square(self.normalized_residual_map)
+        )
+
+
+class JointInversionInterferometer(AbstractJointInversion, inv.InversionInterferometer):
+    def __init__(
+        self,
+        visibilities,
+        noise_map,
+        mappers,
+        regularizations,
+        mapping_matrix,
+        transformed_mapping_matrices,
+        regularization_matrix,
+        curvature_reg_matrix,
+        reconstruction,
+    ):
+        """ An inversion which reconstructs the pixelizations of every pixelized plane of a tracer in one linear \
+        inversion of interferometer visibilities.
+
+        The linear system is built and solved by autoarray's *InversionInterferometer* for a *StackedMapper* and \
+        *StackedRegularization*, whose stacked mapping matrix is Fourier transformed once.
+
+        Parameters
+        -----------
+        visibilities : ndarray
+            The observed visibilities the inversion is fitting.
+        noise_map : ndarray
+            The noise-map of the visibilities used by the inversion during the fit.
+        mappers : [inversion.mappers.Mapper]
+            The mappers of every plane with a pixelization, in ascending redshift order.
+        regularizations : [inversion.regularization.Regularization]
+            The regularization scheme of each mapper's pixelization.
+        mapping_matrix : ndarray
+            The mapping matrices of every mapper, stacked horizontally.
+        """
+        AbstractJointInversion.__init__(
+            self, mappers=mappers, regularizations=regularizations
+        )
+
+        inv.InversionInterferometer.__init__(
+            self,
+            visibilities=visibilities,
+            noise_map=noise_map,
+            mapper=mappers[-1],
+            regularization=regularizations[-1],
+            transformed_mapping_matrices=transformed_mapping_matrices,
+            regularization_matrix=regularization_matrix,
+            curvature_reg_matrix=curvature_reg_matrix,
+            reconstruction=reconstruction,
+        )
+
+        self.mapping_matrix = mapping_matrix
+
+    @classmethod
+    def from_data_mappers_and_regularizations(
+        cls, visibilities, noise_map, transformer, mappers, regularizations
+    ):
+
+        mapper = StackedMapper(mappers=mappers)
+
+        inversion = inv.InversionInterferometer.from_data_mapper_and_regularization(
+            visibilities=visibilities,
+            noise_map=noise_map,
+            transformer=transformer,
+            mapper=mapper,
+            regularization=StackedRegularization(regularizations=regularizations),
+        )
+
+        return JointInversionInterferometer(
+            visibilities=visibilities,
+            noise_map=noise_map,
+            mappers=mappers,
+            regularizations=regularizations,
+            mapping_matrix=mapper.mapping_matrix,
+            transformed_mapping_matrices=inversion.transformed_mapping_matrices,
+            regularization_matrix=inversion.regularization_matrix,
+            curvature_reg_matrix=inversion.curvature_reg_matrix,
+            reconstruction=inversion.reconstruction,
+        )
+
+    @property
+    def mapped_reconstructed_image(self):
+        mapped_reconstructed_image = inversion_util.mapped_reconstructed_data_from_mapping_matrix_and_reconstruction(
+            mapping_matrix=self.mapping_matrix, reconstruction=self.reconstruction
+        )
+
+        return self.mapper.grid.mapping.array_stored_1d_from_array_1d(
+            array_1d=mapped_reconstructed_image
+        )
+
+    @property
+    def mapped_reconstructed_images_of_mappers(self):
+        return [
+            self.mapper.grid.mapping.array_stored_1d_from_array_1d(
+                array_1d=inversion_util.mapped_reconstructed_data_from_mapping_matrix_and_reconstruction(
+                    mapping_matrix=self.mapping_matrix[:, pixel_slice],
+                    reconstruction=self.reconstruction[pixel_slice],
+                )
+            )
+            for pixel_slice in self.pixel_slices_of_mappers
+        ]
+
+    @property
+    def mapped_reconstructed_visibilities_of_mappers(self):
+        mapped_reconstructed_visibilities_of_mappers = []
+
+        for pixel_slice in self.pixel_slices_of_mappers:
+
+            real_visibilities = inversion_util.mapped_reconstructed_data_from_mapping_matrix_and_reconstruction(
+                mapping_matrix=self.transformed_mapping_matrices[0][:, pixel_slice],
+                reconstruction=self.reconstruction[pixel_slice],
+            )
+
+            imag_visibilities = inversion_util.mapped_reconstructed_data_from_mapping_matrix_and_reconstruction(
+                mapping_matrix=self.transformed_mapping_matrices[1][:, pixel_slice],
+                reconstruction=self.reconstruction[pixel_slice],
+            )
+
+            mapped_reconstructed_visibilities_of_mappers.append(
+                vis.Visibilities(
+                    visibilities_1d=np.stack(
+                        (real_visibilities, imag_visibilities), axis=-1
+                    )
+                )
+            )
+
+        return mapped_reconstructed_visibilities_of_mappers
@@ -1,3 +1,8 @@
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from astropy import cosmology as cosmo
 
@@ -11,8 +16,220 @@ from autoastro import dimensions as dim
 from autolens.util import lens_util
 
 
+def profiles_key_from_profiles(profiles):
+    """A hashable key of the types and parameters of a list of profiles, such that two lists of profiles have the \
+    same key if (and only if) they compute the same quantities."""
+    return tuple(
+        (type(profile), tuple(sorted(profile.__dict__.items()))) for profile in profiles
+    )
+
+
+def quantity_cache_from_maxsize(maxsize):
+    """The cache the profile images, convergences, potentials and deflection angles of the galaxies of a plane are \
+    memoized in, such that the quantities of a galaxy whose profile parameters do not change between tracers (e.g. \
+    the fixed lens galaxies of an inversion or hyper phase) are computed once instead of for every model that is \
+    fitted. This is *None* (and every quantity computed) for a maxsize of 0.
+
+    Parameters
+    -----------
+    maxsize : int
+        The maximum number of quantities stored in the cache.
+    """
+    return QuantityCache(maxsize=maxsize) if maxsize > 0 else None
+
+
+class QuantityCache:
+    def __init__(self, maxsize):
+        """A bounded least-recently-used cache of the quantities computed for galaxies on grids, keyed on the name \
+        of the quantity, the types and parameters of the profiles used to compute it and the identity of the grid.
+
+        A weak reference is held to every grid, whose deletion removes the quantities computed on it, such that a \
+        quantity is never returned for a new grid which reuses the id of a deleted grid. Grids must therefore not be \
+        modified in-place after a quantity is computed on them, and the cached quantities must not be modified \
+        in-place by their users.
+
+        A copied (or unpickled) cache is empty.
+
+        Parameters
+        -----------
+        maxsize : int
+            The maximum number of quantities stored, above which the least recently used quantity is removed.
+        """
+        self.maxsize = maxsize
+        self.quantities = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.RLock()
+
+    def __getstate__(self):
+        return {"maxsize": self.maxsize}
+
+    def __setstate__(self, state):
+        self.__init__(maxsize=state["maxsize"])
+
+    def remove_quantity(self, key, grid_reference):
+        """Remove the quantity stored for a key, if it was computed on the grid of the (dead) reference."""
+        with self.lock:
+            entry = self.quantities.get(key)
+            if entry is not None and entry[0] is grid_reference:
+                del self.quantities[key]
+
+    def quantity_from_func(self, func, galaxy, name, profiles, grid):
+        """Compute a quantity of a galaxy on a grid or return it from the cache.
+
+        Parameters
+        -----------
+        func : func
+            The function computing the quantity of an input galaxy.
+        galaxy : Galaxy
+            The galaxy whose quantity is computed.
+        name : str
+            The name of the quantity (e.g. "deflections").
+        profiles : [Profile]
+            The profiles of the galaxy the quantity depends on.
+        grid : aa.Grid
+            The grid the quantity is computed on.
+        """
+        try:
+            key = (name, type(galaxy), profiles_key_from_profiles(profiles), id(grid))
+            hash(key)
+        except TypeError:
+            return func(galaxy)
+
+        with self.lock:
+            if key in self.quantities:
+                grid_reference, quantity = self.quantities[key]
+                if grid_reference() is grid:
+                    self.quantities.move_to_end(key)
+                    self.hits += 1
+                    return quantity
+
+        quantity = func(galaxy)
+
+        cache_reference = weakref.ref(self)
+
+        def remove_quantity(grid_reference):
+            cache = cache_reference()
+            if cache is not None:
+                cache.remove_quantity(key=key, grid_reference=grid_reference)
+
+        try:
+            grid_reference = weakref.ref(grid, remove_quantity)
+        except TypeError:
+            return quantity
+
+        with self.lock:
+            self.misses += 1
+            self.quantities[key] = (grid_reference, quantity)
+            self.quantities.move_to_end(key)
+            while len(self.quantities) > self.maxsize:
+                self.quantities.popitem(last=False)
+
+        return quantity
+
+
+def quantity_of_galaxy_from_func(func, galaxy, name, profiles, grid, quantity_cache):
+    """Compute a quantity of a galaxy on a grid, using the quantity cache if one is input (see \
+    *quantity_cache_from_maxsize*)."""
+    if quantity_cache is None:
+        return func(galaxy)
+
+    return quantity_cache.quantity_from_func(
+        func=func, galaxy=galaxy, name=name, profiles=profiles, grid=grid
+    )
+
+
+def thread_pool_from_threads(threads):
+    """The pool of threads the galaxies of a plane are evaluated on in parallel, which is *None* (and the galaxies \
+    evaluated in serial) for 1 thread.
+
+    The profile calculations are dominated by NumPy and numba calls that release the GIL, therefore a plane with \
+    many galaxies (e.g. line-of-sight halos) is evaluated on multiple cores.
+
+    Parameters
+    -----------
+    threads : int
+        The number of threads in the pool.
+    """
+    return ThreadPoolExecutor(max_workers=threads) if threads > 1 else None
+
+
+def summed_quantity_of_galaxies_from_func(func, galaxies, shape, thread_pool=None):
+    """Sum a quantity (e.g. the profile image) computed for every galaxy in a list into a single array, which is \
+    allocated once (as a copy of the first galaxy's quantity, with its dtype) and added to in-place, instead of \
+    creating a new array for every galaxy that is summed.
+
+    If a thread pool is input the galaxies are evaluated in parallel. Their quantities are always summed in the \
+    order of the galaxies, such that the result does not depend on the number of threads.
+
+    Parameters
+    -----------
+    func : func
+        The function computing the quantity of an input galaxy.
+    galaxies : [Galaxy]
+        The galaxies whose quantities are summed.
+    shape : (int,)
+        The shape of the array of zeros returned if there are no galaxies.
+    thread_pool : ThreadPoolExecutor or None
+        The pool of threads the galaxies are evaluated on (see *thread_pool_from_threads*).
+    """
+    if thread_pool is not None and len(galaxies) > 1:
+        quantities = thread_pool.map(func, galaxies)
+    else:
+        quantities = map(func, galaxies)
+
+    summed_quantity = None
+
+    for quantity in quantities:
+        if summed_quantity is None:
+            summed_quantity = np.array(quantity)
+        else:
+            summed_quantity += quantity
+
+    if summed_quantity is None:
+        return np.zeros(shape=shape)
+
+    return summed_quantity
+
+
+def hyper_noise_map_from_galaxies_and_noise_map(galaxies, noise_map):
+    """Sum the hyper noise-maps of galaxies with hyper-galaxies into a single hyper noise-map.
+
+    The hyper noise-map of the first galaxy is added to in-place by every other galaxy, such that no array is \
+    allocated beyond each galaxy's own hyper noise-map. An array of zeros is only created if there are no galaxies.
+
+    Parameters
+    -----------
+    galaxies : [Galaxy]
+        The galaxies whose hyper noise-maps are summed, which must all have a hyper-galaxy.
+    noise_map : imaging.NoiseMap or ndarray
+        An arrays describing the RMS standard deviation error in each pixel.
+    """
+    hyper_noise_map = None
+
+    for galaxy in galaxies:
+
+        hyper_noise_map_of_galaxy = galaxy.hyper_galaxy.hyper_noise_map_from_hyper_images_and_noise_map(
+            noise_map=noise_map,
+            hyper_model_image=galaxy.hyper_model_image,
+            hyper_galaxy_image=galaxy.hyper_galaxy_image,
+        )
+
+        if hyper_noise_map is None:
+            hyper_noise_map = hyper_noise_map_of_galaxy
+        else:
+            hyper_noise_map += hyper_noise_map_of_galaxy
+
+    if hyper_noise_map is None:
+        return masked_structures.MaskedArray.zeros(mask=noise_map.mask)
+
+    return hyper_noise_map
+
+
 class AbstractPlane(lensing.LensingObject):
-    def __init__(self, redshift, galaxies, cosmology):
+    def __init__(
+        self, redshift, galaxies, cosmology, thread_pool=None, quantity_cache=None
+    ):
         """A plane of galaxies where all galaxies are at the same redshift.
 
         Parameters
@@ -23,6 +240,12 @@ class AbstractPlane(lensing.LensingObject):
             The list of galaxies in this plane.
         cosmology : astropy.cosmology
             The cosmology associated with the plane, used to convert arc-second coordinates to physical values.
+        thread_pool : ThreadPoolExecutor or None
+            If input, the galaxies of the plane are evaluated in parallel on this pool of threads (see \
+            *thread_pool_from_threads*).
+        quantity_cache : QuantityCache or None
+            If input, the quantities of the galaxies of the plane are memoized in this cache (see \
+            *quantity_cache_from_maxsize*).
         """
 
         if redshift is None:
@@ -45,6 +268,16 @@ class AbstractPlane(lensing.LensingObject):
         self.redshift = redshift
         self.galaxies = galaxies
         self.cosmology = cosmology
+        self.thread_pool = thread_pool
+        self.quantity_cache = quantity_cache
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["thread_pool"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
 
     @property
     def galaxy_redshifts(self):
@@ -72,10 +305,14 @@ class AbstractPlane(lensing.LensingObject):
 
     @property
     def galaxies_with_light_profile(self):
+        if self.galaxies is None:
+            return []
         return list(filter(lambda galaxy: galaxy.has_light_profile, self.galaxies))
 
     @property
     def galaxies_with_mass_profile(self):
+        if self.galaxies is None:
+            return []
         return list(filter(lambda galaxy: galaxy.has_mass_profile, self.galaxies))
 
     @property
@@ -86,6 +323,10 @@ class AbstractPlane(lensing.LensingObject):
     def galaxies_with_regularization(self):
         return list(filter(lambda galaxy: galaxy.has_regularization, self.galaxies))
 
+    @property
+    def galaxies_with_hyper_galaxy(self):
+        return list(filter(lambda galaxy: galaxy.has_hyper_galaxy, self.galaxies))
+
     @property
     def pixelization(self):
 
@@ -238,10 +479,16 @@ class AbstractPlane(lensing.LensingObject):
 
 
 class AbstractPlaneCosmology(AbstractPlane):
-    def __init__(self, redshift, galaxies, cosmology):
+    def __init__(
+        self, redshift, galaxies, cosmology, thread_pool=None, quantity_cache=None
+    ):
 
         super(AbstractPlaneCosmology, self).__init__(
-            redshift=redshift, galaxies=galaxies, cosmology=cosmology
+            redshift=redshift,
+            galaxies=galaxies,
+            cosmology=cosmology,
+            thread_pool=thread_pool,
+            quantity_cache=quantity_cache,
         )
 
     @property
@@ -271,9 +518,15 @@ class AbstractPlaneCosmology(AbstractPlane):
 
 
 class AbstractPlaneLensing(AbstractPlaneCosmology):
-    def __init__(self, redshift, galaxies, cosmology):
+    def __init__(
+        self, redshift, galaxies, cosmology, thread_pool=None, quantity_cache=None
+    ):
         super(AbstractPlaneCosmology, self).__init__(
-            redshift=redshift, galaxies=galaxies, cosmology=cosmology
+            redshift=redshift,
+            galaxies=galaxies,
+            cosmology=cosmology,
+            thread_pool=thread_pool,
+            quantity_cache=quantity_cache,
         )
 
     @grids.convert_coordinates_to_grid
@@ -291,20 +544,22 @@ class AbstractPlaneLensing(AbstractPlaneCosmology):
         -----------
 
         """
-        if self.galaxies:
-            profile_image = sum(
-                map(
-                    lambda galaxy: galaxy.profile_image_from_grid(grid=grid),
-                    self.galaxies,
-                )
-            )
-            return grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=profile_image
-            )
-        else:
-            return grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=np.zeros((grid.sub_shape_1d,))
-            )
+        profile_image = summed_quantity_of_galaxies_from_func(
+            func=lambda galaxy: quantity_of_galaxy_from_func(
+                func=lambda galaxy: galaxy.profile_image_from_grid(grid=grid),
+                galaxy=galaxy,
+                name="profile_image",
+                profiles=galaxy.light_profiles,
+                grid=grid,
+                quantity_cache=self.quantity_cache,
+            ),
+            galaxies=self.galaxies_with_light_profile,
+            shape=(grid.sub_shape_1d,),
+            thread_pool=self.thread_pool,
+        )
+        return grid.mapping.array_stored_1d_from_sub_array_1d(
+            sub_array_1d=profile_image
+        )
 
     def profile_images_of_galaxies_from_grid(self, grid):
         return list(
@@ -330,17 +585,20 @@ class AbstractPlaneLensing(AbstractPlaneCosmology):
         galaxies : [g.Galaxy]
             The galaxies whose mass profiles are used to compute the surface densities.
         """
-        if self.galaxies:
-            convergence = sum(
-                map(lambda g: g.convergence_from_grid(grid=grid), self.galaxies)
-            )
-            return grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=convergence
-            )
-        else:
-            return grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=np.full((grid.sub_shape_1d), 0.0)
-            )
+        convergence = summed_quantity_of_galaxies_from_func(
+            func=lambda galaxy: quantity_of_galaxy_from_func(
+                func=lambda galaxy: galaxy.convergence_from_grid(grid=grid),
+                galaxy=galaxy,
+                name="convergence",
+                profiles=galaxy.mass_profiles,
+                grid=grid,
+                quantity_cache=self.quantity_cache,
+            ),
+            galaxies=self.galaxies_with_mass_profile,
+            shape=(grid.sub_shape_1d,),
+            thread_pool=self.thread_pool,
+        )
+        return grid.mapping.array_stored_1d_from_sub_array_1d(sub_array_1d=convergence)
 
     @grids.convert_coordinates_to_grid
     def potential_from_grid(self, grid):
@@ -361,29 +619,37 @@ class AbstractPlaneLensing(AbstractPlaneCosmology):
         galaxies : [g.Galaxy]
             The galaxies whose mass profiles are used to compute the surface densities.
         """
-        if self.galaxies:
-            potential = sum(
-                map(lambda g: g.potential_from_grid(grid=grid), self.galaxies)
-            )
-            return grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=potential
-            )
-        else:
-            return grid.mapping.array_stored_1d_from_sub_array_1d(
-                sub_array_1d=np.full((grid.sub_shape_1d), 0.0)
-            )
+        potential = summed_quantity_of_galaxies_from_func(
+            func=lambda galaxy: quantity_of_galaxy_from_func(
+                func=lambda galaxy: galaxy.potential_from_grid(grid=grid),
+                galaxy=galaxy,
+                name="potential",
+                profiles=galaxy.mass_profiles,
+                grid=grid,
+                quantity_cache=self.quantity_cache,
+            ),
+            galaxies=self.galaxies_with_mass_profile,
+            shape=(grid.sub_shape_1d,),
+            thread_pool=self.thread_pool,
+        )
+        return grid.mapping.array_stored_1d_from_sub_array_1d(sub_array_1d=potential)
 
     @grids.convert_coordinates_to_grid
     def deflections_from_grid(self, grid):
-        if self.galaxies:
-            deflections = sum(
-                map(lambda g: g.deflections_from_grid(grid=grid), self.galaxies)
-            )
-            return grid.mapping.grid_stored_1d_from_sub_grid_1d(sub_grid_1d=deflections)
-        else:
-            return grid.mapping.grid_stored_1d_from_sub_grid_1d(
-                sub_grid_1d=np.full((grid.sub_shape_1d, 2), 0.0)
-            )
+        deflections = summed_quantity_of_galaxies_from_func(
+            func=lambda galaxy: quantity_of_galaxy_from_func(
+                func=lambda galaxy: galaxy.deflections_from_grid(grid=grid),
+                galaxy=galaxy,
+                name="deflections",
+                profiles=galaxy.mass_profiles,
+                grid=grid,
+                quantity_cache=self.quantity_cache,
+            ),
+            galaxies=self.galaxies_with_mass_profile,
+            shape=(grid.sub_shape_1d, 2),
+            thread_pool=self.thread_pool,
+        )
+        return grid.mapping.grid_stored_1d_from_sub_grid_1d(sub_grid_1d=deflections)
 
     @grids.convert_coordinates_to_grid
     def traced_grid_from_grid(self, grid):
@@ -452,10 +718,16 @@ class AbstractPlaneLensing(AbstractPlaneCosmology):
 
 
 class AbstractPlaneData(AbstractPlaneLensing):
-    def __init__(self, redshift, galaxies, cosmology):
+    def __init__(
+        self, redshift, galaxies, cosmology, thread_pool=None, quantity_cache=None
+    ):
 
         super(AbstractPlaneData, self).__init__(
-            redshift=redshift, galaxies=galaxies, cosmology=cosmology
+            redshift=redshift,
+            galaxies=galaxies,
+            cosmology=cosmology,
+            thread_pool=thread_pool,
+            quantity_cache=quantity_cache,
         )
 
     def blurred_profile_image_from_grid_and_psf(self, grid, psf, blurring_grid):
@@ -566,10 +838,9 @@ class AbstractPlaneData(AbstractPlaneLensing):
         )
 
     def hyper_noise_map_from_noise_map(self, noise_map):
-        hyper_noise_maps = self.hyper_noise_maps_of_galaxies_from_noise_map(
-            noise_map=noise_map
+        return hyper_noise_map_from_galaxies_and_noise_map(
+            galaxies=self.galaxies_with_hyper_galaxy, noise_map=noise_map
         )
-        return sum(hyper_noise_maps)
 
     def hyper_noise_maps_of_galaxies_from_noise_map(self, noise_map):
         """For a contribution map and noise-map, use the model hyper_galaxy galaxies to compute a hyper noise-map.
@@ -644,10 +915,21 @@ class AbstractPlaneData(AbstractPlaneLensing):
 
 
 class Plane(AbstractPlaneData):
-    def __init__(self, redshift=None, galaxies=None, cosmology=cosmo.Planck15):
+    def __init__(
+        self,
+        redshift=None,
+        galaxies=None,
+        cosmology=cosmo.Planck15,
+        thread_pool=None,
+        quantity_cache=None,
+    ):
 
         super(Plane, self).__init__(
-            redshift=redshift, galaxies=galaxies, cosmology=cosmology
+            redshift=redshift,
+            galaxies=galaxies,
+            cosmology=cosmology,
+            thread_pool=thread_pool,
+            quantity_cache=quantity_cache,
         )
 
     # noinspection PyUnusedLocal
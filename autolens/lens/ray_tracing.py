@@ -1,4 +1,6 @@
+import weakref
 from abc import ABC
+from collections import OrderedDict
 
 import numpy as np
 from astropy import cosmology as cosmo
@@ -8,15 +10,182 @@ from autoarray.util import array_util, grid_util
 from autoarray.mask import mask as msk
 from autoarray.structures import grids
 from autoarray.masked.masked_structures import MaskedArray
-from autoarray.operators.inversion import inversions as inv
 from autoastro.galaxy import galaxy as g
 from autoastro.util import cosmology_util
+from autolens import exc
+from autolens.lens import inversions as inv
 from autolens.lens import plane as pl
 from autolens.util import lens_util
 
 
+class CombinedGridCache:
+    def __init__(self):
+        """A cache of the coordinates of image-plane grids and their blurring grids concatenated into one irregular \
+        grid, which are ray-traced and have their light profiles evaluated together (see \
+        *combined_grid_from_grid_and_blurring_grid*).
+
+        A *TracerPlan* shares one cache with every tracer it creates, such that the combined grid of a dataset's \
+        grid and blurring grid is the same grid for every model fitted to it and the quantities of galaxies \
+        computed on it can be memoized (see *plane.QuantityCache*). Weak references are held to both grids of every \
+        entry, whose deletion removes it. A copied (or unpickled) cache is empty.
+        """
+        self.combined_grids = {}
+
+    def __getstate__(self):
+        return {}
+
+    def __setstate__(self, state):
+        self.__init__()
+
+    def combined_grid_from_grid_and_blurring_grid(self, grid, blurring_grid):
+        """The coordinates of an image-plane grid and its blurring grid concatenated into one irregular grid, which \
+        is computed once for every pair of grids and stored with weak references to both."""
+
+        key = (id(grid), id(blurring_grid))
+
+        if key in self.combined_grids:
+
+            grid_reference, blurring_grid_reference, combined_grid = self.combined_grids[
+                key
+            ]
+
+            if grid_reference() is grid and blurring_grid_reference() is blurring_grid:
+                return combined_grid
+
+        combined_grid = grids.GridIrregular(
+            grid=np.concatenate((np.asarray(grid), np.asarray(blurring_grid)))
+        )
+
+        cache_reference = weakref.ref(self)
+
+        def remove_combined_grid(reference):
+            cache = cache_reference()
+            if cache is not None:
+                cache.combined_grids.pop(key, None)
+
+        try:
+            grid_reference = weakref.ref(grid, remove_combined_grid)
+            blurring_grid_reference = weakref.ref(blurring_grid, remove_combined_grid)
+        except TypeError:
+            return combined_grid
+
+        self.combined_grids[key] = (
+            grid_reference,
+            blurring_grid_reference,
+            combined_grid,
+        )
+
+        return combined_grid
+
+
+def mapper_cache_from_maxsize(maxsize):
+    """The cache the mappers of the pixelized planes of tracers are memoized in, such that a model whose mass \
+    profiles, pixelization and hyper images are the same as a previous model (e.g. when only the regularization \
+    coefficients of an inversion change) reuses that model's mapper instead of ray-tracing its grids and \
+    constructing its mapper. This is *None* (and every mapper computed) for a maxsize of 0.
+
+    Parameters
+    -----------
+    maxsize : int
+        The maximum number of mappers stored in the cache.
+    """
+    return MapperCache(maxsize=maxsize) if maxsize > 0 else None
+
+
+class MapperCache:
+    def __init__(self, maxsize):
+        """A bounded least-recently-used cache of the mappers of the planes of tracers (see \
+        *AbstractTracerData.mapper_key_and_references_of_plane_from_grid* for their keys).
+
+        Weak references are held to the objects whose identity a key depends on, whose deletion removes the mapper. \
+        A copied (or unpickled) cache is empty.
+
+        Parameters
+        -----------
+        maxsize : int
+            The maximum number of mappers stored, above which the least recently used mapper is removed.
+        """
+        self.maxsize = maxsize
+        self.mappers = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        return {"maxsize": self.maxsize}
+
+    def __setstate__(self, state):
+        self.__init__(maxsize=state["maxsize"])
+
+    def mapper_from_key(self, key, references):
+        """The mapper stored for a key whose references are the input objects, or *None* if there is no mapper \
+        stored for them."""
+
+        try:
+            entry = self.mappers.get(key)
+        except TypeError:
+            return None
+
+        if entry is not None:
+
+            stored_references, mapper = entry
+
+            if len(stored_references) == len(references) and all(
+                stored_reference() is reference
+                for stored_reference, reference in zip(stored_references, references)
+            ):
+                self.mappers.move_to_end(key)
+                self.hits += 1
+                return mapper
+
+        self.misses += 1
+
+        return None
+
+    def remove_mapper(self, key, reference):
+        """Remove the mapper stored for a key, if it holds the (dead) reference."""
+        entry = self.mappers.get(key)
+        if entry is not None and any(
+            stored_reference is reference for stored_reference in entry[0]
+        ):
+            del self.mappers[key]
+
+    def add_mapper(self, key, references, mapper):
+        """Store the mapper computed for a key, holding weak references to the objects whose identity the key \
+        depends on. Mappers whose key or references cannot be stored are not cached."""
+
+        cache_reference = weakref.ref(self)
+
+        def remove_mapper(reference):
+            cache = cache_reference()
+            if cache is not None:
+                cache.remove_mapper(key=key, reference=reference)
+
+        try:
+            hash(key)
+            stored_references = [
+                weakref.ref(reference, remove_mapper) for reference in references
+            ]
+        except TypeError:
+            return
+
+        self.mappers[key] = (stored_references, mapper)
+        self.mappers.move_to_end(key)
+
+        while len(self.mappers) > self.maxsize:
+            self.mappers.popitem(last=False)
+
+
 class AbstractTracer(lensing.LensingObject, ABC):
-    def __init__(self, planes, cosmology):
+    def __init__(
+        self,
+        planes,
+        cosmology,
+        plan=None,
+        deflections_interpolation=None,
+        precision=None,
+        mapper_cache=None,
+        combined_grid_cache=None,
+    ):
         """Ray-tracer for a lens system with any number of planes.
 
         The redshift of these planes are specified by the redshits of the galaxies; there is a unique plane redshift \
@@ -39,15 +208,59 @@ class AbstractTracer(lensing.LensingObject, ABC):
             source-plane borders.
         cosmology : astropy.cosmology
             The cosmology of the ray-tracing calculation.
+        plan : TracerPlan or None
+            The plan the tracer was created from, if any, which stores which planes have light profiles, mass \
+            profiles and pixelizations such that these are not recomputed from the galaxies.
+        deflections_interpolation : DeflectionsInterpolation or None
+            If input, grids are ray-traced using deflection angles computed on an adaptive coarse grid and \
+            interpolated to every coordinate of the grid (see *DeflectionsInterpolation*).
+        precision : str or None
+            If input (e.g. *float32*), the traced grids and profile images the tracer computes are stored at this \
+            precision. Otherwise they are stored at the precision of the grid they are computed from (see \
+            *MaskedImaging.precision*).
+        mapper_cache : MapperCache or None
+            If input, the mappers of the pixelized planes are memoized in this cache (see \
+            *mapper_cache_from_maxsize*).
+        combined_grid_cache : CombinedGridCache or None
+            The cache the concatenated grids and blurring grids ray-traced by the tracer are stored in, which is \
+            shared by the tracers of a *TracerPlan*. If *None*, the tracer has its own cache.
         """
         self.planes = planes
         self.plane_redshifts = [plane.redshift for plane in planes]
         self.cosmology = cosmology
+        self.plan = plan
+        self.deflections_interpolation = deflections_interpolation
+        self.deflections_interpolation_error = None
+        self.precision = precision
+        self.mapper_cache = mapper_cache
+        self._scaling_factors_of_planes = None
+        self.combined_grid_cache = (
+            combined_grid_cache
+            if combined_grid_cache is not None
+            else CombinedGridCache()
+        )
+
+        self._traced_grids_of_planes_cache = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_traced_grids_of_planes_cache"] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
 
     @property
     def total_planes(self):
         return len(self.plane_redshifts)
 
+    def dtype_from_grid(self, grid):
+        """The dtype of the traced grids and profile images computed from a grid, which is the tracer's precision \
+        if it has one and the grid's otherwise."""
+        if self.precision is not None:
+            return np.dtype(self.precision)
+        return np.asarray(grid).dtype
+
     @property
     def image_plane(self):
         return self.planes[0]
@@ -60,20 +273,44 @@ class AbstractTracer(lensing.LensingObject, ABC):
     def galaxies(self):
         return list([galaxy for plane in self.planes for galaxy in plane.galaxies])
 
+    @property
+    def profiles_key(self):
+        """A key of the redshifts of the tracer's planes and the types and parameters of the light and mass \
+        profiles of their galaxies, such that two tracers have the same key if (and only if) they compute the same \
+        profile images and traced grids (see *MaskedImaging.preload_profile_quantities_from_tracer*)."""
+        return tuple(
+            (
+                plane.redshift,
+                tuple(
+                    pl.profiles_key_from_profiles(
+                        galaxy.light_profiles + galaxy.mass_profiles
+                    )
+                    for galaxy in plane.galaxies
+                ),
+            )
+            for plane in self.planes
+        )
+
     @property
     def all_planes_have_redshifts(self):
         return None not in self.plane_redshifts
 
     @property
     def has_light_profile(self):
+        if self.plan is not None:
+            return len(self.plan.plane_indexes_with_light_profile) > 0
         return any(list(map(lambda plane: plane.has_light_profile, self.planes)))
 
     @property
     def has_mass_profile(self):
+        if self.plan is not None:
+            return len(self.plan.plane_indexes_with_mass_profile) > 0
         return any(list(map(lambda plane: plane.has_mass_profile, self.planes)))
 
     @property
     def has_pixelization(self):
+        if self.plan is not None:
+            return len(self.plan.plane_indexes_with_pixelizations) > 0
         return any(list(map(lambda plane: plane.has_pixelization, self.planes)))
 
     @property
@@ -82,6 +319,8 @@ class AbstractTracer(lensing.LensingObject, ABC):
 
     @property
     def has_hyper_galaxy(self):
+        if self.plan is not None:
+            return len(self.plan.plane_indexes_with_hyper_galaxy) > 0
         return any(list(map(lambda plane: plane.has_hyper_galaxy, self.planes)))
 
     @property
@@ -145,8 +384,30 @@ class AbstractTracer(lensing.LensingObject, ABC):
             if plane.has_mass_profile
         ]
 
+    @property
+    def plane_indexes_with_light_profile(self):
+        if self.plan is not None:
+            return self.plan.plane_indexes_with_light_profile
+        return [
+            plane_index
+            for (plane_index, plane) in enumerate(self.planes)
+            if plane.has_light_profile
+        ]
+
+    @property
+    def plane_indexes_with_mass_profile(self):
+        if self.plan is not None:
+            return self.plan.plane_indexes_with_mass_profile
+        return [
+            plane_index
+            for (plane_index, plane) in enumerate(self.planes)
+            if plane.has_mass_profile
+        ]
+
     @property
     def plane_indexes_with_pixelizations(self):
+        if self.plan is not None:
+            return self.plan.plane_indexes_with_pixelizations
         plane_indexes_with_inversions = [
             plane_index if plane.has_pixelization else None
             for (plane_index, plane) in enumerate(self.planes)
@@ -157,6 +418,24 @@ class AbstractTracer(lensing.LensingObject, ABC):
             if plane_index is not None
         ]
 
+    @property
+    def plane_indexes_with_hyper_galaxy(self):
+        if self.plan is not None:
+            return self.plan.plane_indexes_with_hyper_galaxy
+        return [
+            plane_index
+            for (plane_index, plane) in enumerate(self.planes)
+            if plane.has_hyper_galaxy
+        ]
+
+    @property
+    def galaxies_with_hyper_galaxy(self):
+        return [
+            galaxy
+            for plane_index in self.plane_indexes_with_hyper_galaxy
+            for galaxy in self.planes[plane_index].galaxies_with_hyper_galaxy
+        ]
+
     @property
     def pixelizations_of_planes(self):
         return [plane.pixelization for plane in self.planes]
@@ -288,45 +567,329 @@ class AbstractTracerCosmology(AbstractTracer, ABC):
             i=0, j=-1, unit_length=unit_length
         )
 
+    @property
+    def scaling_factors_of_planes(self):
+        """The matrix of multi-plane scaling factors between every pair of planes, where entry [i, j] is the scaling \
+        factor of plane i's deflection angles when ray-tracing to plane j (see \
+        *lens_util.scaling_factors_of_planes_from_plane_redshifts_and_cosmology*).
+
+        The matrix of a tracer created from a *TracerPlan* is computed once by the plan and shared by all of its \
+        tracers, and the matrix of any other tracer is computed once by the tracer."""
+        if self.plan is not None:
+            return self.plan.scaling_factors_of_planes
+
+        if self._scaling_factors_of_planes is None:
+            self._scaling_factors_of_planes = lens_util.scaling_factors_of_planes_from_plane_redshifts_and_cosmology(
+                plane_redshifts=self.plane_redshifts, cosmology=self.cosmology
+            )
+
+        return self._scaling_factors_of_planes
+
 
 class AbstractTracerLensing(AbstractTracerCosmology, ABC):
     @grids.convert_coordinates_to_grid
     def traced_grids_of_planes_from_grid(self, grid, plane_index_limit=None):
+        """Ray-trace an image-plane grid of (y,x) arc-second coordinates to every plane of the tracer.
 
-        grid_calc = grid.copy()  # TODO looks unnecessary? Probably pretty expensive too
+        The traced grids are cached on the tracer, keyed on the identity of the input grid, such that a grid which \
+        is used multiple times by the same tracer (e.g. the grid and blurring grid of a fit, which are used to \
+        compute the profile image, mappers and images of every galaxy) is only ray-traced once. The cache is \
+        discarded with the tracer and an entry is removed when its grid is deleted. Grids must therefore not be \
+        modified in-place after being ray-traced by a tracer.
 
-        traced_grids = []
-        traced_deflections = []
+        Parameters
+        ----------
+        grid : aa.Grid
+            The image-plane grid which is ray-traced.
+        plane_index_limit : int or None
+            If input, only the planes up to and including this index are ray-traced.
+        """
 
-        for (plane_index, plane) in enumerate(self.planes):
+        if plane_index_limit is None:
+            total_planes = len(self.planes)
+        else:
+            total_planes = plane_index_limit + 1
 
-            scaled_grid = grid_calc.copy()
+        traced_grids_of_planes = self.cached_traced_grids_of_planes_from_grid(
+            grid=grid, total_planes=total_planes
+        )
 
-            if plane_index > 0:
-                for previous_plane_index in range(plane_index):
-                    scaling_factor = cosmology_util.scaling_factor_between_redshifts_from_redshifts_and_cosmology(
-                        redshift_0=self.plane_redshifts[previous_plane_index],
-                        redshift_1=plane.redshift,
-                        redshift_final=self.plane_redshifts[-1],
-                        cosmology=self.cosmology,
-                    )
+        if traced_grids_of_planes is not None:
+            return traced_grids_of_planes
 
-                    scaled_deflections = (
-                        scaling_factor * traced_deflections[previous_plane_index]
-                    )
+        if self.deflections_interpolation_applies_to_grid(grid=grid):
+            traced_grids_of_planes = self.traced_grids_of_planes_via_interpolation_from_grid(
+                grid=grid, total_planes=total_planes
+            )
+        else:
+            traced_grids_of_planes = self.traced_grids_of_planes_via_recursion_from_grid(
+                grid=grid, total_planes=total_planes
+            )
+
+        self.cache_traced_grids_of_planes_of_grid(
+            grid=grid, traced_grids_of_planes=traced_grids_of_planes
+        )
+
+        return traced_grids_of_planes
 
-                    scaled_grid -= scaled_deflections
+    def traced_grid_of_plane_from_grid(self, grid, plane_index):
+        """Ray-trace a small set of image-plane (y,x) arc-second coordinates (e.g. the positions of a lensed \
+        source's multiple images) to one plane of the tracer.
 
-            traced_grids.append(scaled_grid)
+        Only the planes in front of the plane are ray-traced and the traced grid cache and deflection angle \
+        interpolation are bypassed, as their bookkeeping costs more than ray-tracing a handful of coordinates. \
+        This makes checks which reject a tracer based on its traced positions (e.g. \
+        *check_positions_trace_within_threshold_via_tracer*) inexpensive.
 
-            if plane_index_limit is not None:
-                if plane_index == plane_index_limit:
-                    return traced_grids
+        Parameters
+        ----------
+        grid : aa.GridIrregular
+            The image-plane coordinates which are ray-traced.
+        plane_index : int
+            The index of the plane the coordinates are ray-traced to, where negative indexes count back from the \
+            final plane.
+        """
+        if plane_index < 0:
+            plane_index += len(self.planes)
+
+        return self.traced_grids_of_planes_via_recursion_from_grid(
+            grid=grid, total_planes=plane_index + 1
+        )[plane_index]
+
+    def traced_grids_of_planes_from_grid_and_blurring_grid(
+        self, grid, blurring_grid, plane_index_limit=None
+    ):
+        """Ray-trace an image-plane grid and its blurring grid to every plane of the tracer in a single pass, \
+        returning the traced grids of the grid and of the blurring grid.
 
-            traced_deflections.append(plane.deflections_from_grid(grid=scaled_grid))
+        The two grids are concatenated into one coordinate buffer, such that every plane's deflection angles are \
+        computed once for both grids rather than in two separate passes. The traced grids of each grid are views \
+        of the traced buffer, which are stored in the traced grid cache for their grid exactly as if each grid had \
+        been ray-traced by *traced_grids_of_planes_from_grid*.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The image-plane (sub-)grid which is ray-traced.
+        blurring_grid : aa.Grid
+            The image-plane blurring grid which is ray-traced.
+        plane_index_limit : int or None
+            If input, only the planes up to and including this index are ray-traced.
+        """
+
+        if plane_index_limit is None:
+            total_planes = len(self.planes)
+        else:
+            total_planes = plane_index_limit + 1
+
+        traced_grids_of_planes = self.cached_traced_grids_of_planes_from_grid(
+            grid=grid, total_planes=total_planes
+        )
+        traced_blurring_grids_of_planes = self.cached_traced_grids_of_planes_from_grid(
+            grid=blurring_grid, total_planes=total_planes
+        )
+
+        if traced_grids_of_planes is None or traced_blurring_grids_of_planes is None:
+
+            combined_grid = self.combined_grid_cache.combined_grid_from_grid_and_blurring_grid(
+                grid=grid, blurring_grid=blurring_grid
+            )
+
+            if self.deflections_interpolation_applies_to_grid(grid=grid):
+                traced_combined_grids_of_planes = self.traced_grids_of_planes_via_interpolation_from_grid(
+                    grid=combined_grid, total_planes=total_planes
+                )
+            else:
+                traced_combined_grids_of_planes = self.traced_grids_of_planes_via_recursion_from_grid(
+                    grid=combined_grid, total_planes=total_planes
+                )
+
+            total_coordinates = grid.shape[0]
+
+            traced_grids_of_planes = [grid] + [
+                grids.Grid(
+                    grid=np.asarray(traced_combined_grid)[:total_coordinates],
+                    mask=grid.mask,
+                )
+                for traced_combined_grid in traced_combined_grids_of_planes[1:]
+            ]
+            traced_blurring_grids_of_planes = [blurring_grid] + [
+                grids.Grid(
+                    grid=np.asarray(traced_combined_grid)[total_coordinates:],
+                    mask=blurring_grid.mask,
+                )
+                for traced_combined_grid in traced_combined_grids_of_planes[1:]
+            ]
+
+            self.cache_traced_grids_of_planes_of_grid(
+                grid=grid, traced_grids_of_planes=traced_grids_of_planes
+            )
+            self.cache_traced_grids_of_planes_of_grid(
+                grid=blurring_grid,
+                traced_grids_of_planes=traced_blurring_grids_of_planes,
+            )
+
+        return traced_grids_of_planes, traced_blurring_grids_of_planes
+
+    def cached_traced_grids_of_planes_from_grid(self, grid, total_planes):
+        """The traced grids of the first *total_planes* planes of an image-plane grid stored in the traced grid \
+        cache, or *None* if the grid has not been ray-traced to these planes by the tracer."""
+
+        if id(grid) in self._traced_grids_of_planes_cache:
+
+            grid_reference, traced_grids = self._traced_grids_of_planes_cache[id(grid)]
+
+            if grid_reference() is grid and len(traced_grids) >= total_planes - 1:
+                return [grid] + traced_grids[0 : total_planes - 1]
+
+        return None
+
+    def deflections_interpolation_applies_to_grid(self, grid):
+        """Whether an image-plane grid is ray-traced using the tracer's deflection angle interpolation, which is \
+        only used for a (sub-)grid of a mask and when the tracer has a mass profile."""
+        return (
+            self.deflections_interpolation is not None
+            and isinstance(grid, grids.Grid)
+            and bool(self.plane_indexes_with_mass_profile)
+        )
+
+    def traced_grids_of_planes_via_recursion_from_grid(self, grid, total_planes):
+        """Ray-trace an image-plane grid of (y,x) arc-second coordinates to the first *total_planes* planes of the \
+        tracer, without using the traced grid cache.
+
+        The traced grids of all planes are allocated before ray-tracing begins and each is computed in one pass \
+        using the recursive multi-plane lens equation (see \
+        *lens_util.multi_plane_recursion_factors_from_scaling_factors*), which only requires the traced grids of the \
+        two planes before it and the deflection angles of the previous plane. The input grid is not copied and is \
+        returned as the image-plane's traced grid.
+        """
+
+        scaling_factors = self.scaling_factors_of_planes
+        recursion_factors = lens_util.multi_plane_recursion_factors_from_scaling_factors(
+            scaling_factors=scaling_factors
+        )
+
+        plane_indexes_with_mass_profile = self.plane_indexes_with_mass_profile
+
+        dtype = self.dtype_from_grid(grid=grid)
+
+        traced_grids = [grid] + [
+            np.empty_like(grid, dtype=dtype) for plane_index in range(1, total_planes)
+        ]
+
+        for plane_index in range(1, total_planes):
+
+            previous_plane_index = plane_index - 1
+
+            if (
+                not plane_indexes_with_mass_profile
+                or plane_indexes_with_mass_profile[0] >= plane_index
+            ):
+                np.copyto(traced_grids[plane_index], grid)
+                continue
+
+            if previous_plane_index in plane_indexes_with_mass_profile:
+                deflections = self.planes[previous_plane_index].deflections_from_grid(
+                    grid=traced_grids[previous_plane_index]
+                )
+                scaling_factor = scaling_factors[previous_plane_index, plane_index]
+            else:
+                deflections = traced_grids[previous_plane_index]
+                scaling_factor = 0.0
+
+            lens_util.traced_grid_1d_via_multi_plane_recursion(
+                grid_1d_of_plane_before_previous=traced_grids[max(plane_index - 2, 0)],
+                grid_1d_of_previous_plane=traced_grids[previous_plane_index],
+                deflections_1d_of_previous_plane=deflections,
+                recursion_factor=recursion_factors[plane_index],
+                scaling_factor=scaling_factor,
+                traced_grid_1d=traced_grids[plane_index],
+            )
 
         return traced_grids
 
+    def traced_grids_of_planes_via_interpolation_from_grid(self, grid, total_planes):
+        """Ray-trace an image-plane grid of (y,x) arc-second coordinates to the first *total_planes* planes of the \
+        tracer, using the tracer's deflection angle interpolation (see *DeflectionsInterpolation*).
+
+        The displacement of every plane's traced grid from the image-plane grid (the sum of the rescaled deflection \
+        angles of every plane in front of it) is computed exactly on an adaptive lattice covering the grid and \
+        interpolated to every coordinate of the grid (see \
+        *lens_util.interpolated_values_and_error_from_grid_and_func_via_adaptive_lattice*). The lattice is refined \
+        where the displacements change rapidly, for example near the centres of mass profiles and critical curves.
+
+        The interpolation error measured for the grid is stored as the tracer's *deflections_interpolation_error* \
+        if it is the largest error of any grid ray-traced by the tracer.
+        """
+
+        if total_planes == 1:
+            return [grid]
+
+        displacements_of_grid, error = lens_util.interpolated_values_and_error_from_grid_and_func_via_adaptive_lattice(
+            grid=grid,
+            func=lambda grid_1d: self.displacements_of_planes_from_grid_1d(
+                grid_1d=grid_1d, total_planes=total_planes
+            ),
+            pixel_scale=self.deflections_interpolation.pixel_scale,
+            tolerance=self.deflections_interpolation.tolerance,
+            refinements=self.deflections_interpolation.refinements,
+        )
+
+        if (
+            self.deflections_interpolation_error is None
+            or error > self.deflections_interpolation_error
+        ):
+            self.deflections_interpolation_error = error
+
+        traced_grids = [grid]
+
+        for plane_index in range(1, total_planes):
+            traced_grid = np.empty_like(grid, dtype=self.dtype_from_grid(grid=grid))
+            np.subtract(
+                np.asarray(grid),
+                displacements_of_grid[:, 2 * (plane_index - 1) : 2 * plane_index],
+                out=np.asarray(traced_grid),
+            )
+            traced_grids.append(traced_grid)
+
+        return traced_grids
+
+    def displacements_of_planes_from_grid_1d(self, grid_1d, total_planes):
+        """The exact displacement of the traced grid of every plane after the image-plane from an input grid, as an \
+        ndarray of shape [total_coordinates, 2 * (total_planes - 1)], where columns 2j and 2j + 1 are the (y,x) \
+        displacements of plane j + 1."""
+
+        traced_grids_of_planes = self.traced_grids_of_planes_via_recursion_from_grid(
+            grid=grids.GridIrregular(grid=grid_1d), total_planes=total_planes
+        )
+
+        return np.hstack(
+            [
+                grid_1d - np.asarray(traced_grid)
+                for traced_grid in traced_grids_of_planes[1:]
+            ]
+        )
+
+    def cache_traced_grids_of_planes_of_grid(self, grid, traced_grids_of_planes):
+        """Store the traced grids of an image-plane grid in the tracer's traced grid cache.
+
+        The cache holds a weak reference to the image-plane grid, whose deletion removes the entry, so the cache \
+        never keeps a grid alive and an entry cannot be matched to a new grid that reuses the deleted grid's id. \
+        Grids which cannot be weakly referenced (e.g. a plain ndarray) are not cached.
+        """
+
+        cache = self._traced_grids_of_planes_cache
+        grid_id = id(grid)
+
+        try:
+            grid_reference = weakref.ref(
+                grid, lambda reference: cache.pop(grid_id, None)
+            )
+        except TypeError:
+            return
+
+        cache[grid_id] = (grid_reference, traced_grids_of_planes[1:])
+
     @grids.convert_coordinates_to_grid
     def deflections_between_planes_from_grid(self, grid, plane_i=0, plane_j=-1):
 
@@ -336,31 +899,62 @@ class AbstractTracerLensing(AbstractTracerCosmology, ABC):
 
     @grids.convert_coordinates_to_grid
     def profile_image_from_grid(self, grid):
-        profile_image = sum(self.profile_images_of_planes_from_grid(grid=grid))
+
+        profile_images_of_planes = self.profile_images_of_planes_from_grid(grid=grid)
+
+        plane_indexes_with_light_profile = self.plane_indexes_with_light_profile
+
+        if plane_indexes_with_light_profile:
+            profile_image = sum(
+                [
+                    profile_images_of_planes[plane_index]
+                    for plane_index in plane_indexes_with_light_profile
+                ]
+            )
+        else:
+            profile_image = profile_images_of_planes[0]
+
         return grid.mapping.array_stored_1d_from_sub_array_1d(
             sub_array_1d=profile_image
         )
 
     @grids.convert_coordinates_to_grid
     def profile_images_of_planes_from_grid(self, grid):
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(
-            grid=grid, plane_index_limit=self.upper_plane_index_with_light_profile
-        )
+        """Compute the profile image of every plane, using the grid ray-traced to that plane.
 
-        profile_images_of_planes = [
-            self.planes[plane_index].profile_image_from_grid(
-                grid=traced_grids_of_planes[plane_index]
+        Only planes up to the highest plane with a light profile are ray-traced and only planes with a light profile \
+        have their image computed. Every plane without a light profile is given its own image of zeros.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The image-plane grid which is ray-traced to every plane.
+        """
+
+        plane_indexes_with_light_profile = self.plane_indexes_with_light_profile
+
+        if plane_indexes_with_light_profile:
+            traced_grids_of_planes = self.traced_grids_of_planes_from_grid(
+                grid=grid, plane_index_limit=plane_indexes_with_light_profile[-1]
             )
-            for plane_index in range(len(traced_grids_of_planes))
-        ]
 
-        if self.upper_plane_index_with_light_profile < self.total_planes - 1:
-            for plane_index in range(
-                self.upper_plane_index_with_light_profile, self.total_planes - 1
-            ):
+        profile_images_of_planes = []
+
+        for (plane_index, plane) in enumerate(self.planes):
+
+            if plane_index in plane_indexes_with_light_profile:
+
+                profile_images_of_planes.append(
+                    plane.profile_image_from_grid(
+                        grid=traced_grids_of_planes[plane_index]
+                    )
+                )
+
+            else:
+
                 profile_images_of_planes.append(
                     grid.mapping.array_stored_1d_from_sub_array_1d(
-                        sub_array_1d=np.zeros(shape=profile_images_of_planes[0].shape)
+                        sub_array_1d=np.zeros(shape=(grid.sub_shape_1d,))
                     )
                 )
 
@@ -410,52 +1004,326 @@ class AbstractTracerLensing(AbstractTracerCosmology, ABC):
         redshift : float
             The redshift the image-plane grid is traced to.
         """
+        return self.grids_at_redshifts_from_grid_and_redshifts(
+            grid=grid, redshifts=[redshift]
+        )[0]
+
+    def grids_at_redshifts_from_grid_and_redshifts(self, grid, redshifts):
+        """For an input grid of (y,x) arc-second image-plane coordinates, ray-trace the coordinates to every redshift \
+        in a list of redshifts (e.g. to build a cube of the grid over redshift for line-of-sight studies).
 
-        if redshift <= self.plane_redshifts[0]:
-            return grid.copy()
+        The grid is ray-traced through the tracer's planes once, and the deflection angles of every plane are \
+        recovered from its traced grids (see *deflections_of_planes_from_traced_grids_of_planes*), such that no \
+        deflection angles are recomputed. The grid at every redshift is then the image-plane grid minus the sum of \
+        the deflection angles of every plane in front of it, rescaled to that redshift, which is computed for all \
+        redshifts in one pass. The tracer is not changed: a grid at the redshift of a plane is a copy of the \
+        plane's traced grid (which the tracer stores and reuses), such that it can be modified in-place.
 
-        plane_index_with_redshift = [
+        Parameters
+        ----------
+        grid : ndsrray or aa.Grid
+            The image-plane grid which is traced to the redshifts.
+        redshifts : [float]
+            The redshifts the image-plane grid is traced to.
+        """
+
+        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
+
+        grids_at_redshifts = [None] * len(redshifts)
+        redshift_indexes_between_planes = []
+
+        for redshift_index, redshift in enumerate(redshifts):
+
+            if redshift <= self.plane_redshifts[0]:
+                grids_at_redshifts[redshift_index] = grid.copy()
+            elif redshift in self.plane_redshifts:
+                grids_at_redshifts[redshift_index] = traced_grids_of_planes[
+                    self.plane_redshifts.index(redshift)
+                ].copy()
+            else:
+                redshift_indexes_between_planes.append(redshift_index)
+
+        if not redshift_indexes_between_planes:
+            return grids_at_redshifts
+
+        if (
+            self.total_planes - 1 in self.plane_indexes_with_mass_profile
+            and max(redshifts) > self.plane_redshifts[-1]
+        ):
+            raise exc.RayTracingException(
+                "A grid cannot be traced to a redshift above the final plane when the final plane has a mass "
+                "profile, as its deflection angles are defined for ray-tracing to itself"
+            )
+
+        deflections_of_planes = self.deflections_of_planes_from_traced_grids_of_planes(
+            traced_grids_of_planes=traced_grids_of_planes
+        )
+
+        plane_indexes = [
             plane_index
-            for plane_index, plane in enumerate(self.planes)
-            if plane.redshift == redshift
+            for plane_index, deflections in enumerate(deflections_of_planes)
+            if deflections is not None
         ]
 
-        if plane_index_with_redshift:
-            return self.traced_grids_of_planes_from_grid(grid=grid)[
-                plane_index_with_redshift[0]
-            ]
+        if not plane_indexes:
+            for redshift_index in redshift_indexes_between_planes:
+                grids_at_redshifts[redshift_index] = grid.copy()
+            return grids_at_redshifts
+
+        scaling_factors = lens_util.scaling_factors_of_planes_to_redshifts_from_plane_redshifts_and_cosmology(
+            plane_redshifts=self.plane_redshifts,
+            redshifts=[
+                redshifts[redshift_index]
+                for redshift_index in redshift_indexes_between_planes
+            ],
+            cosmology=self.cosmology,
+        )
 
-        for plane_index, plane_redshift in enumerate(self.plane_redshifts):
+        deflections_at_redshifts = np.einsum(
+            "rp,pnk->rnk",
+            scaling_factors[:, plane_indexes],
+            np.stack(
+                [
+                    np.asarray(deflections_of_planes[plane_index])
+                    for plane_index in plane_indexes
+                ]
+            ),
+        )
+
+        for index, redshift_index in enumerate(redshift_indexes_between_planes):
+
+            grid_at_redshift = grid.copy()
+            np.subtract(
+                np.asarray(grid),
+                deflections_at_redshifts[index],
+                out=np.asarray(grid_at_redshift),
+            )
+            grids_at_redshifts[redshift_index] = grid_at_redshift
+
+        return grids_at_redshifts
+
+    def deflections_of_planes_from_traced_grids_of_planes(self, traced_grids_of_planes):
+        """Recover the deflection angles of every plane from the traced grids of every plane, by inverting the \
+        recursive multi-plane lens equation (see *lens_util.multi_plane_recursion_factors_from_scaling_factors*):
 
-            if redshift < plane_redshift:
-                plane_index_insert = plane_index
+        deflections_(j-1) = ((1 - factor_j) * grid_(j-2) + factor_j * grid_(j-1) - grid_j) / scaling_factor_(j-1, j)
 
-        planes = self.planes
-        planes.insert(
-            plane_index_insert,
-            pl.Plane(redshift=redshift, galaxies=[], cosmology=self.cosmology),
+        This requires no evaluation of the mass profiles. Planes without a mass profile and the final plane (whose \
+        deflection angles do not change any traced grid) have deflection angles of None.
+        """
+
+        scaling_factors = self.scaling_factors_of_planes
+        recursion_factors = lens_util.multi_plane_recursion_factors_from_scaling_factors(
+            scaling_factors=scaling_factors
         )
 
-        tracer = Tracer(planes=planes, cosmology=self.cosmology)
+        plane_indexes_with_mass_profile = self.plane_indexes_with_mass_profile
 
-        return tracer.traced_grids_of_planes_from_grid(grid=grid)[plane_index_insert]
+        deflections_of_planes = [None] * self.total_planes
 
-    def image_plane_multiple_image_positions_of_galaxies(self, grid):
-        return [
-            self.image_plane_multiple_image_positions(
-                grid=grid, source_plane_coordinate=light_profile_centre
+        for plane_index in plane_indexes_with_mass_profile:
+
+            if plane_index == self.total_planes - 1:
+                continue
+
+            next_plane_index = plane_index + 1
+
+            deflections_of_planes[plane_index] = (
+                (1.0 - recursion_factors[next_plane_index])
+                * np.asarray(traced_grids_of_planes[max(plane_index - 1, 0)])
+                + recursion_factors[next_plane_index]
+                * np.asarray(traced_grids_of_planes[plane_index])
+                - np.asarray(traced_grids_of_planes[next_plane_index])
+            ) / scaling_factors[plane_index, next_plane_index]
+
+        return deflections_of_planes
+
+    def image_plane_multiple_image_positions_of_galaxies(
+        self, grid, pixel_scale_precision=None, upscale_factor=5
+    ):
+        """Compute the image-plane multiple image positions of the light profile centres of the galaxies in the \
+        source plane, which are located to the nearest pixel of the grid or, if a precision is input, refined to \
+        this precision in arc-seconds (see *image_plane_multiple_image_positions_of_source_plane_coordinates*)."""
+        return self.image_plane_multiple_image_positions_of_source_plane_coordinates(
+            grid=grid,
+            source_plane_coordinates=self.light_profile_centres_of_planes[-1],
+            pixel_scale_precision=pixel_scale_precision,
+            upscale_factor=upscale_factor,
+        )
+
+    def image_plane_multiple_image_positions_of_source_plane_coordinates(
+        self,
+        grid,
+        source_plane_coordinates,
+        pixel_scale_precision=None,
+        upscale_factor=5,
+    ):
+        """Compute the image-plane multiple image positions of a list of source-plane (y,x) coordinates, to a \
+        precision in arc-seconds far below the pixel scale of the input grid.
+
+        The multiple images of every coordinate are first located to the nearest pixel of the grid (see \
+        *image_plane_multiple_image_positions*), where the grid is ray-traced only once for all coordinates. Every \
+        multiple image is then refined iteratively, by ray-tracing a window of upscale_factor x upscale_factor \
+        coordinates around it and moving it to the coordinate whose traced position is closest to its source-plane \
+        coordinate. The window then shrinks to one spacing of its coordinates around this position and the \
+        process is repeated until the spacing is below the requested precision. The windows of all multiple images \
+        of all coordinates are ray-traced together, such that every iteration performs one ray-tracing calculation.
+
+        Parameters
+        -----------
+        grid : Grid
+            The grid of (y,x) arc-second coordinates on which the multiple images are initially located.
+        source_plane_coordinates : [(float, float)]
+            The source-plane (y,x) coordinates whose multiple images are computed.
+        pixel_scale_precision : float or None
+            The precision in arc-seconds to which multiple images are located. If None, the multiple images are \
+            located to the nearest pixel of the grid and not refined.
+        upscale_factor : int
+            The number of coordinates in the y and x directions of the window ray-traced to refine a multiple \
+            image.
+
+        Raises
+        ------
+        exc.RayTracingException
+            If the upscale_factor is below 4. The spacing of the coordinates of a window of half-width h is \
+            2h / (upscale_factor - 1), which the next window's half-width is set to, such that the window only \
+            shrinks every iteration (by a factor 2 / (upscale_factor - 1)) if the upscale_factor is 4 or above.
+        """
+
+        if upscale_factor < 4:
+            raise exc.RayTracingException(
+                "The upscale_factor of the multiple image refinement must be 4 or above"
             )
-            for light_profile_centre in self.light_profile_centres_of_planes[-1]
+
+        if grid.sub_size > 1:
+            grid = grid.in_1d_binned
+
+        source_plane_grid = self.traced_grids_of_planes_from_grid(grid=grid)[-1]
+
+        coordinates_of_source_plane_coordinates = [
+            self.image_plane_multiple_image_positions_from_source_plane_grid(
+                grid=grid,
+                source_plane_grid=source_plane_grid,
+                source_plane_coordinate=source_plane_coordinate,
+            )
+            for source_plane_coordinate in source_plane_coordinates
         ]
 
+        if pixel_scale_precision is None:
+            return coordinates_of_source_plane_coordinates
+
+        image_plane_coordinates = []
+        source_plane_coordinates_of_images = []
+
+        for source_plane_coordinate, coordinates in zip(
+            source_plane_coordinates, coordinates_of_source_plane_coordinates
+        ):
+            for coordinate in coordinates[0]:
+                image_plane_coordinates.append(coordinate)
+                source_plane_coordinates_of_images.append(source_plane_coordinate)
+
+        if not image_plane_coordinates:
+            return coordinates_of_source_plane_coordinates
+
+        image_plane_coordinates = np.asarray(image_plane_coordinates)
+        source_plane_coordinates_of_images = np.asarray(
+            source_plane_coordinates_of_images
+        )
+
+        total_images = image_plane_coordinates.shape[0]
+        total_window_coordinates = upscale_factor ** 2
+
+        half_width = max(grid.pixel_scales)
+
+        while True:
+
+            spacing = 2.0 * half_width / (upscale_factor - 1)
+
+            window_grid = lens_util.grid_1d_of_windows_from_centres_half_width_and_upscale_factor(
+                centres=image_plane_coordinates,
+                half_width=half_width,
+                upscale_factor=upscale_factor,
+            )
+
+            traced_window_grid = self.traced_grids_of_planes_from_grid(
+                grid=grids.GridIrregular(grid=window_grid)
+            )[-1]
+
+            squared_distances = np.sum(
+                np.square(
+                    np.asarray(traced_window_grid).reshape(
+                        total_images, total_window_coordinates, 2
+                    )
+                    - source_plane_coordinates_of_images[:, None, :]
+                ),
+                axis=2,
+            )
+
+            image_plane_coordinates = window_grid.reshape(
+                total_images, total_window_coordinates, 2
+            )[np.arange(total_images), np.argmin(squared_distances, axis=1)]
+
+            if spacing <= pixel_scale_precision:
+                break
+
+            half_width = spacing
+
+        refined_coordinates_of_source_plane_coordinates = []
+        image_index = 0
+
+        for coordinates in coordinates_of_source_plane_coordinates:
+
+            refined_coordinates = []
+
+            for image_plane_coordinate in image_plane_coordinates[
+                image_index : image_index + len(coordinates[0])
+            ]:
+
+                # Neighbouring pixels of the grid may locate the same multiple image, which converge to it.
+
+                if all(
+                    [
+                        np.sum(
+                            np.square(image_plane_coordinate - np.asarray(coordinate))
+                        )
+                        > (2.0 * spacing) ** 2
+                        for coordinate in refined_coordinates
+                    ]
+                ):
+                    refined_coordinates.append(tuple(image_plane_coordinate.tolist()))
+
+            image_index += len(coordinates[0])
+
+            refined_coordinates_of_source_plane_coordinates.append(
+                grids.Coordinates(coordinates=[refined_coordinates])
+            )
+
+        return refined_coordinates_of_source_plane_coordinates
+
     def image_plane_multiple_image_positions(self, grid, source_plane_coordinate):
+        """Compute the image-plane multiple image positions of a source-plane (y,x) coordinate to the nearest pixel \
+        of a grid, by finding the pixels at troughs of the distance of the traced grid from the coordinate which \
+        the coordinate is traced within.
 
-        # TODO : This should not input as a grid but use a iterative adaptive grid.
+        To locate multiple images to a higher precision, see \
+        *image_plane_multiple_image_positions_of_source_plane_coordinates*.
+        """
 
         if grid.sub_size > 1:
             grid = grid.in_1d_binned
 
-        source_plane_grid = self.traced_grids_of_planes_from_grid(grid=grid)[-1]
+        return self.image_plane_multiple_image_positions_from_source_plane_grid(
+            grid=grid,
+            source_plane_grid=self.traced_grids_of_planes_from_grid(grid=grid)[-1],
+            source_plane_coordinate=source_plane_coordinate,
+        )
+
+    def image_plane_multiple_image_positions_from_source_plane_grid(
+        self, grid, source_plane_grid, source_plane_coordinate
+    ):
+        """Compute the image-plane multiple image positions of a source-plane (y,x) coordinate to the nearest pixel \
+        of a grid (see *image_plane_multiple_image_positions*) from the grid traced to the source plane, such that \
+        the grid is traced once for the multiple images of many coordinates."""
 
         source_plane_squared_distances = source_plane_grid.squared_distances_from_coordinate(
             coordinate=source_plane_coordinate
@@ -515,6 +1383,79 @@ class AbstractTracerLensing(AbstractTracerCosmology, ABC):
 
 
 class AbstractTracerData(AbstractTracerLensing, ABC):
+    def profile_image_and_blurring_image_from_grid_and_blurring_grid(
+        self, grid, blurring_grid
+    ):
+        """Compute the profile image of a grid and of its blurring grid in a single pass.
+
+        The grid and blurring grid are ray-traced together (see \
+        *traced_grids_of_planes_from_grid_and_blurring_grid*) and the traced coordinates of both are concatenated \
+        for every plane with a light profile, such that every light profile is evaluated once on one contiguous \
+        coordinate buffer. The summed image is then split back into the (binned) profile image of the grid and of \
+        the blurring grid, as required by a convolver.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The image-plane (sub-)grid the profile image is computed on.
+        blurring_grid : aa.Grid
+            The image-plane blurring grid the blurring image is computed on.
+        """
+
+        plane_indexes_with_light_profile = self.plane_indexes_with_light_profile
+
+        if not plane_indexes_with_light_profile:
+            return (
+                self.profile_image_from_grid(grid=grid),
+                self.profile_image_from_grid(grid=blurring_grid),
+            )
+
+        traced_grids_of_planes, traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid_and_blurring_grid(
+            grid=grid,
+            blurring_grid=blurring_grid,
+            plane_index_limit=plane_indexes_with_light_profile[-1],
+        )
+
+        total_coordinates = grid.shape[0]
+
+        profile_image = None
+
+        for plane_index in plane_indexes_with_light_profile:
+
+            if plane_index == 0:
+                combined_grid = self.combined_grid_cache.combined_grid_from_grid_and_blurring_grid(
+                    grid=grid, blurring_grid=blurring_grid
+                )
+            else:
+                combined_grid = grids.GridIrregular(
+                    grid=np.concatenate(
+                        (
+                            np.asarray(traced_grids_of_planes[plane_index]),
+                            np.asarray(traced_blurring_grids_of_planes[plane_index]),
+                        )
+                    )
+                )
+
+            profile_image_of_plane = self.planes[plane_index].profile_image_from_grid(
+                grid=combined_grid
+            )
+
+            if profile_image is None:
+                profile_image = np.array(
+                    profile_image_of_plane, dtype=self.dtype_from_grid(grid=grid)
+                )
+            else:
+                profile_image += profile_image_of_plane
+
+        return (
+            grid.mapping.array_stored_1d_from_sub_array_1d(
+                sub_array_1d=profile_image[:total_coordinates]
+            ),
+            blurring_grid.mapping.array_stored_1d_from_sub_array_1d(
+                sub_array_1d=profile_image[total_coordinates:]
+            ),
+        )
+
     def blurred_profile_image_from_grid_and_psf(self, grid, psf, blurring_grid):
         """Extract the 1D image and 1D blurring image of every plane and blur each with the \
         PSF using a psf (see imaging.convolution).
@@ -527,9 +1468,9 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             Class which performs the PSF convolution of a masked image in 1D.
         """
 
-        profile_image = self.profile_image_from_grid(grid=grid)
-
-        blurring_image = self.profile_image_from_grid(grid=blurring_grid)
+        profile_image, blurring_image = self.profile_image_and_blurring_image_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
+        )
 
         return psf.convolved_array_from_array_2d_and_mask(
             array_2d=profile_image.in_2d_binned + blurring_image.in_2d_binned,
@@ -550,9 +1491,8 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             Class which performs the PSF convolution of a masked image in 1D.
         """
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
-        traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
-            grid=blurring_grid
+        traced_grids_of_planes, traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
         )
 
         return [
@@ -578,9 +1518,9 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             Class which performs the PSF convolution of a masked image in 1D.
         """
 
-        profile_image = self.profile_image_from_grid(grid=grid)
-
-        blurring_image = self.profile_image_from_grid(grid=blurring_grid)
+        profile_image, blurring_image = self.profile_image_and_blurring_image_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
+        )
 
         return convolver.convolved_image_from_image_and_blurring_image(
             image=profile_image, blurring_image=blurring_image
@@ -600,9 +1540,8 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             Class which performs the PSF convolution of a masked image in 1D.
         """
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
-        traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
-            grid=blurring_grid
+        traced_grids_of_planes, traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
         )
 
         return [
@@ -731,29 +1670,127 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
     def mappers_of_planes_from_grid(
         self, grid, inversion_uses_border=False, preload_sparse_grids_of_planes=None
     ):
+        """Compute the mapper of every plane with a pixelization, which is *None* for every other plane.
 
-        mappers_of_planes = []
+        If the tracer has a mapper cache (see *mapper_cache_from_maxsize*) a plane's mapper is returned from the \
+        cache if it was computed for the same mass profiles and redshifts of the planes in front of it, the same \
+        pixelization and hyper image and the same grids. The grids are then not ray-traced and the pixelization's \
+        mapper (e.g. its Voronoi tessellation) is not constructed.
+        """
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
+        mappers_of_planes = []
 
-        traced_sparse_grids_of_planes = self.traced_sparse_grids_of_planes_from_grid(
-            grid=grid, preload_sparse_grids_of_planes=preload_sparse_grids_of_planes
-        )
+        traced_grids_of_planes = None
+        traced_sparse_grids_of_planes = None
 
         for (plane_index, plane) in enumerate(self.planes):
 
             if not plane.has_pixelization:
                 mappers_of_planes.append(None)
+                continue
+
+            if self.mapper_cache is not None:
+                key, references = self.mapper_key_and_references_of_plane_from_grid(
+                    plane_index=plane_index,
+                    grid=grid,
+                    inversion_uses_border=inversion_uses_border,
+                    preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
+                )
+                mapper = self.mapper_cache.mapper_from_key(
+                    key=key, references=references
+                )
             else:
+                mapper = None
+
+            if mapper is None:
+
+                if traced_grids_of_planes is None:
+                    traced_grids_of_planes = self.traced_grids_of_planes_from_grid(
+                        grid=grid
+                    )
+                    traced_sparse_grids_of_planes = self.traced_sparse_grids_of_planes_from_grid(
+                        grid=grid,
+                        preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
+                    )
+
+                # The border relocation of a pixelization moves the coordinates of the grids it is passed in-place,
+                # therefore copies are passed so the cached traced grids (and image-plane grid) are not changed.
+
+                traced_grid = traced_grids_of_planes[plane_index]
+                traced_sparse_grid = traced_sparse_grids_of_planes[plane_index]
+
+                if inversion_uses_border:
+                    traced_grid = traced_grid.copy()
+                    if traced_sparse_grid is not None:
+                        traced_sparse_grid = traced_sparse_grid.copy()
+
                 mapper = plane.mapper_from_grid_and_sparse_grid(
-                    grid=traced_grids_of_planes[plane_index],
-                    sparse_grid=traced_sparse_grids_of_planes[plane_index],
+                    grid=traced_grid,
+                    sparse_grid=traced_sparse_grid,
                     inversion_uses_border=inversion_uses_border,
                 )
-                mappers_of_planes.append(mapper)
+
+                if self.mapper_cache is not None:
+                    self.mapper_cache.add_mapper(
+                        key=key, references=references, mapper=mapper
+                    )
+
+            mappers_of_planes.append(mapper)
 
         return mappers_of_planes
 
+    def mapper_key_and_references_of_plane_from_grid(
+        self, plane_index, grid, inversion_uses_border, preload_sparse_grids_of_planes
+    ):
+        """The key of the mapper of a plane in the mapper cache and the objects whose identity it depends on.
+
+        The key contains the types and parameters of the mass profiles of every plane in front of the plane and \
+        the scaling factors between the planes (which determine the plane's traced grids), the type and \
+        parameters of the plane's pixelization and the identities of its galaxy's hyper image, the image-plane \
+        grid and the preloaded sparse grid (if used). The cache holds weak references to the latter, such that a \
+        mapper is never returned for new objects which reuse the ids of deleted ones.
+        """
+
+        plane = self.planes[plane_index]
+
+        galaxy_with_pixelization = [
+            galaxy for galaxy in plane.galaxies if galaxy.pixelization is not None
+        ][0]
+
+        if preload_sparse_grids_of_planes is not None:
+            preload_sparse_grid = preload_sparse_grids_of_planes[plane_index]
+        else:
+            preload_sparse_grid = None
+
+        references = [
+            reference
+            for reference in (
+                grid,
+                galaxy_with_pixelization.hyper_galaxy_image,
+                preload_sparse_grid,
+            )
+            if reference is not None
+        ]
+
+        key = (
+            tuple(
+                tuple(
+                    pl.profiles_key_from_profiles(profiles=galaxy.mass_profiles)
+                    for galaxy in self.planes[mass_plane_index].galaxies
+                )
+                for mass_plane_index in range(plane_index)
+            ),
+            tuple(map(tuple, np.asarray(self.scaling_factors_of_planes))),
+            pl.profiles_key_from_profiles(
+                profiles=[galaxy_with_pixelization.pixelization]
+            ),
+            inversion_uses_border,
+            tuple(id(reference) for reference in references),
+            tuple(map(type, references)),
+        )
+
+        return key, references
+
     def inversion_imaging_from_grid_and_data(
         self,
         grid,
@@ -763,19 +1800,23 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         inversion_uses_border=False,
         preload_sparse_grids_of_planes=None,
     ):
+        """Reconstruct the image using the pixelizations of every plane with a pixelization.
 
+        The mapping matrices of all pixelized planes are stacked into one linear system, such that lenses with \
+        multiple source-planes are reconstructed simultaneously by a single inversion.
+        """
         mappers_of_planes = self.mappers_of_planes_from_grid(
             grid=grid,
             inversion_uses_border=inversion_uses_border,
             preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
         )
 
-        return inv.InversionImaging.from_data_mapper_and_regularization(
+        return inv.JointInversionImaging.from_data_mappers_and_regularizations(
             image=image,
             noise_map=noise_map,
             convolver=convolver,
-            mapper=mappers_of_planes[-1],
-            regularization=self.regularizations_of_planes[-1],
+            mappers=list(filter(None, mappers_of_planes)),
+            regularizations=list(filter(None, self.regularizations_of_planes)),
         )
 
     def inversion_interferometer_from_grid_and_data(
@@ -793,19 +1834,21 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
         )
 
-        return inv.InversionInterferometer.from_data_mapper_and_regularization(
+        return inv.JointInversionInterferometer.from_data_mappers_and_regularizations(
             visibilities=visibilities,
             noise_map=noise_map,
             transformer=transformer,
-            mapper=mappers_of_planes[-1],
-            regularization=self.regularizations_of_planes[-1],
+            mappers=list(filter(None, mappers_of_planes)),
+            regularizations=list(filter(None, self.regularizations_of_planes)),
         )
 
     def hyper_noise_map_from_noise_map(self, noise_map):
-        hyper_noise_maps = self.hyper_noise_maps_of_planes_from_noise_map(
-            noise_map=noise_map
+        """The summed hyper noise-map of every galaxy with a hyper-galaxy, which is computed by accumulating each \
+        galaxy's hyper noise-map in-place (see *plane.hyper_noise_map_from_galaxies_and_noise_map*) and only \
+        evaluates the planes with hyper-galaxies."""
+        return pl.hyper_noise_map_from_galaxies_and_noise_map(
+            galaxies=self.galaxies_with_hyper_galaxy, noise_map=noise_map
         )
-        return sum(hyper_noise_maps)
 
     def hyper_noise_maps_of_planes_from_noise_map(self, noise_map):
         return [
@@ -842,10 +1885,8 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
 
         galaxy_blurred_profile_image_dict = dict()
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
-
-        traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
-            grid=blurring_grid
+        traced_grids_of_planes, traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
         )
 
         for (plane_index, plane) in enumerate(self.planes):
@@ -886,7 +1927,17 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
 
 class Tracer(AbstractTracerData):
     @classmethod
-    def from_galaxies(cls, galaxies, cosmology=cosmo.Planck15):
+    def from_galaxies(
+        cls,
+        galaxies,
+        cosmology=cosmo.Planck15,
+        deflections_interpolation=None,
+        precision=None,
+        thread_pool=None,
+        quantity_cache=None,
+        mapper_cache=None,
+        combined_grid_cache=None,
+    ):
 
         plane_redshifts = lens_util.ordered_plane_redshifts_from_galaxies(
             galaxies=galaxies
@@ -900,10 +1951,22 @@ class Tracer(AbstractTracerData):
 
         for plane_index in range(0, len(plane_redshifts)):
             planes.append(
-                pl.Plane(galaxies=galaxies_in_planes[plane_index], cosmology=cosmology)
+                pl.Plane(
+                    galaxies=galaxies_in_planes[plane_index],
+                    cosmology=cosmology,
+                    thread_pool=thread_pool,
+                    quantity_cache=quantity_cache,
+                )
             )
 
-        return Tracer(planes=planes, cosmology=cosmology)
+        return Tracer(
+            planes=planes,
+            cosmology=cosmology,
+            deflections_interpolation=deflections_interpolation,
+            precision=precision,
+            mapper_cache=mapper_cache,
+            combined_grid_cache=combined_grid_cache,
+        )
 
     @classmethod
     def sliced_tracer_from_lens_line_of_sight_and_source_galaxies(
@@ -972,3 +2035,200 @@ class Tracer(AbstractTracerData):
             )
 
         return Tracer(planes=planes, cosmology=cosmology)
+
+
+class DeflectionsInterpolation:
+    def __init__(self, pixel_scale, tolerance=1.0e-3, refinements=5):
+        """The settings of a tracer's deflection angle interpolation, where the displacements of every plane's \
+        traced grid are computed exactly on an adaptive coarse lattice and bilinearly interpolated to every \
+        coordinate of a grid (see *AbstractTracerLensing.traced_grids_of_planes_via_interpolation_from_grid*).
+
+        This is used for mass profiles whose deflection angles are computed via numerical integration (e.g. Sersic \
+        and NFW profiles), where computing them exactly for every coordinate of a sub-grid dominates the run time.
+
+        Parameters
+        ----------
+        pixel_scale : float
+            The arc-second spacing of the coarsest lattice.
+        tolerance : float
+            The maximum difference in arc-seconds between the exact and interpolated displacements at the centre \
+            of a lattice cell, above which the cell is split into four.
+        refinements : int
+            The maximum number of times a cell of the coarsest lattice is split.
+        """
+        self.pixel_scale = pixel_scale
+        self.tolerance = tolerance
+        self.refinements = refinements
+
+
+class TracerPlan:
+    def __init__(
+        self,
+        plane_redshifts,
+        plane_indexes_of_galaxies,
+        galaxy_redshifts,
+        plane_indexes_with_light_profile,
+        plane_indexes_with_mass_profile,
+        plane_indexes_with_pixelizations,
+        plane_indexes_with_hyper_galaxy,
+        cosmology,
+        threads=1,
+        quantity_cache_maxsize=0,
+        mapper_cache_maxsize=0,
+    ):
+        """The execution plan of a tracer, which stores everything about a tracer that depends only on the \
+        structure of its galaxies (their redshifts and which galaxies have light profiles, mass profiles, \
+        pixelizations and hyper-galaxies) and not on the parameters of their profiles.
+
+        A non-linear search creates a tracer for every model it evaluates, all of which share the same structure. \
+        A plan is therefore computed once from the galaxies of the first model, after which the tracer of every \
+        model is created by placing its galaxies in their pre-computed planes. This avoids sorting and binning the \
+        galaxies into planes and recomputing which planes have light profiles, mass profiles and pixelizations \
+        for every model.
+
+        If the redshifts of the galaxies input to the plan differ from those it was computed from (e.g. because the \
+        galaxy redshifts are free parameters of the model) the tracer is created from the galaxies without the plan.
+
+        The tracers created from a plan share its thread pool and caches, including the cache of the concatenated \
+        grids and blurring grids they ray-trace (see *CombinedGridCache*).
+
+        Parameters
+        ----------
+        plane_redshifts : [float]
+            The redshifts of the planes of the tracer, in ascending redshift order.
+        plane_indexes_of_galaxies : [int]
+            The index of the plane every galaxy is placed in, in the order the galaxies are input to the plan.
+        galaxy_redshifts : (float)
+            The redshifts of the galaxies the plan was computed from, used to check it applies to input galaxies.
+        plane_indexes_with_light_profile : [int]
+            The indexes of the planes containing a galaxy with a light profile.
+        plane_indexes_with_mass_profile : [int]
+            The indexes of the planes containing a galaxy with a mass profile.
+        plane_indexes_with_pixelizations : [int]
+            The indexes of the planes containing a galaxy with a pixelization.
+        plane_indexes_with_hyper_galaxy : [int]
+            The indexes of the planes containing a galaxy with a hyper-galaxy.
+        cosmology : astropy.cosmology
+            The cosmology of the ray-tracing calculation.
+        threads : int
+            The number of threads the galaxies of every plane of the tracers created from the plan are evaluated on \
+            in parallel (see *plane.thread_pool_from_threads*).
+        quantity_cache_maxsize : int
+            The maximum number of galaxy quantities memoized in the cache shared by every plane of the tracers \
+            created from the plan (see *plane.quantity_cache_from_maxsize*), which is switched off for 0.
+        mapper_cache_maxsize : int
+            The maximum number of mappers memoized in the cache shared by the tracers created from the plan (see \
+            *mapper_cache_from_maxsize*), which is switched off for 0.
+        """
+        self.plane_redshifts = plane_redshifts
+        self.plane_indexes_of_galaxies = plane_indexes_of_galaxies
+        self.galaxy_redshifts = galaxy_redshifts
+        self.plane_indexes_with_light_profile = plane_indexes_with_light_profile
+        self.plane_indexes_with_mass_profile = plane_indexes_with_mass_profile
+        self.plane_indexes_with_pixelizations = plane_indexes_with_pixelizations
+        self.plane_indexes_with_hyper_galaxy = plane_indexes_with_hyper_galaxy
+        self.cosmology = cosmology
+        self.threads = threads
+        self.thread_pool = pl.thread_pool_from_threads(threads=threads)
+        self.quantity_cache = pl.quantity_cache_from_maxsize(
+            maxsize=quantity_cache_maxsize
+        )
+        self.mapper_cache = mapper_cache_from_maxsize(maxsize=mapper_cache_maxsize)
+        self.combined_grid_cache = CombinedGridCache()
+
+        self._scaling_factors_of_planes = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["thread_pool"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.thread_pool = pl.thread_pool_from_threads(threads=self.threads)
+
+    @classmethod
+    def from_galaxies(
+        cls,
+        galaxies,
+        cosmology=cosmo.Planck15,
+        threads=1,
+        quantity_cache_maxsize=0,
+        mapper_cache_maxsize=0,
+    ):
+
+        tracer = Tracer.from_galaxies(galaxies=galaxies, cosmology=cosmology)
+
+        return cls(
+            plane_redshifts=tracer.plane_redshifts,
+            plane_indexes_of_galaxies=lens_util.plane_indexes_of_galaxies_from_galaxies(
+                galaxies=galaxies, plane_redshifts=tracer.plane_redshifts
+            ),
+            galaxy_redshifts=tuple([galaxy.redshift for galaxy in galaxies]),
+            plane_indexes_with_light_profile=tracer.plane_indexes_with_light_profile,
+            plane_indexes_with_mass_profile=tracer.plane_indexes_with_mass_profile,
+            plane_indexes_with_pixelizations=tracer.plane_indexes_with_pixelizations,
+            plane_indexes_with_hyper_galaxy=tracer.plane_indexes_with_hyper_galaxy,
+            cosmology=cosmology,
+            threads=threads,
+            quantity_cache_maxsize=quantity_cache_maxsize,
+            mapper_cache_maxsize=mapper_cache_maxsize,
+        )
+
+    @property
+    def total_planes(self):
+        return len(self.plane_redshifts)
+
+    @property
+    def scaling_factors_of_planes(self):
+        """The matrix of multi-plane scaling factors between every pair of planes of the plan (see \
+        *lens_util.scaling_factors_of_planes_from_plane_redshifts_and_cosmology*), which is computed once and \
+        shared by every tracer created from the plan, such that the cosmological distances are not recomputed for \
+        every model."""
+        if self._scaling_factors_of_planes is None:
+            self._scaling_factors_of_planes = lens_util.scaling_factors_of_planes_from_plane_redshifts_and_cosmology(
+                plane_redshifts=self.plane_redshifts, cosmology=self.cosmology
+            )
+
+        return self._scaling_factors_of_planes
+
+    def applies_to_galaxies(self, galaxies):
+        return tuple([galaxy.redshift for galaxy in galaxies]) == self.galaxy_redshifts
+
+    def tracer_from_galaxies(self, galaxies):
+
+        if not self.applies_to_galaxies(galaxies=galaxies):
+            return Tracer.from_galaxies(
+                galaxies=galaxies,
+                cosmology=self.cosmology,
+                thread_pool=self.thread_pool,
+                quantity_cache=self.quantity_cache,
+                mapper_cache=self.mapper_cache,
+                combined_grid_cache=self.combined_grid_cache,
+            )
+
+        galaxies_in_planes = [[] for i in range(self.total_planes)]
+
+        for galaxy, plane_index in zip(galaxies, self.plane_indexes_of_galaxies):
+            galaxies_in_planes[plane_index].append(galaxy)
+
+        planes = [
+            pl.Plane(
+                redshift=plane_redshift,
+                galaxies=galaxies_of_plane,
+                cosmology=self.cosmology,
+                thread_pool=self.thread_pool,
+                quantity_cache=self.quantity_cache,
+            )
+            for plane_redshift, galaxies_of_plane in zip(
+                self.plane_redshifts, galaxies_in_planes
+            )
+        ]
+
+        return Tracer(
+            planes=planes,
+            cosmology=self.cosmology,
+            plan=self,
+            mapper_cache=self.mapper_cache,
+            combined_grid_cache=self.combined_grid_cache,
+        )
@@ -3,4 +3,5 @@ from autoastro.galaxy.masked.galaxy_data import MaskedGalaxyData as masked_galax
 from autolens.masked.masked_dataset import (
     MaskedImaging as imaging,
     MaskedInterferometer as interferometer,
+    PreprocessingCache as preprocessing_cache,
 )
@@ -1,7 +1,280 @@
-from autoarray.structures import grids
-from autoarray.masked import masked_dataset
-from autolens.fit import fit
+import copy
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+
+import numpy as np
+
+from autoarray.dataset import imaging as im
+from autoarray.structures import grids, kernel
+from autoarray.masked import masked_dataset, masked_structures
+from autoarray.operators import convolver as conv
 from autolens import exc
+from autolens.util import lens_util
+
+
+def preprocessing_key_from_psf_and_mask(
+    psf, mask, psf_shape_2d, pixel_scale_interpolation_grid
+):
+    """A hex digest of the contents of the PSF and mask and the settings of masked imaging, such that two masked \
+    imaging have the same key if (and only if) they have the same grids, blurring grid, trimmed PSF and convolver.
+
+    The image and noise-map are not included, as none of these depend on them."""
+    digest = hashlib.sha1()
+
+    for value in (
+        mask.shape,
+        mask.pixel_scales,
+        mask.sub_size,
+        mask.origin,
+        psf.shape_2d,
+        psf_shape_2d,
+        pixel_scale_interpolation_grid,
+    ):
+        digest.update(repr(value).encode())
+
+    digest.update(np.ascontiguousarray(mask, dtype="bool").tobytes())
+    digest.update(np.ascontiguousarray(psf.in_2d, dtype="float64").tobytes())
+
+    return digest.hexdigest()
+
+
+class MaskedImagingPreprocessing:
+    def __init__(self, grid, blurring_grid, psf, convolver):
+        """The grids, blurring grid, trimmed PSF and convolver of masked imaging, which depend only on its mask, \
+        PSF and settings and not on its image and noise-map."""
+        self.grid = grid
+        self.blurring_grid = blurring_grid
+        self.psf = psf
+        self.convolver = convolver
+
+    @classmethod
+    def from_masked_imaging(cls, masked_imaging):
+        return cls(
+            grid=masked_imaging.grid,
+            blurring_grid=getattr(masked_imaging, "blurring_grid", None),
+            psf=getattr(masked_imaging, "psf", None),
+            convolver=getattr(masked_imaging, "convolver", None),
+        )
+
+    @classmethod
+    def from_psf_and_mask(cls, psf, mask, psf_shape_2d, pixel_scale_interpolation_grid):
+        """Compute the preprocessing of masked imaging with a mask and the PSF trimmed to a shape, which is used \
+        for masked imaging that is derived from another (e.g. binned up, see *MaskedImaging.binned_from_bin_up_factor*) \
+        rather than built by the constructor."""
+        psf = kernel.Kernel.manual_2d(
+            array=psf.resized_from_new_shape(new_shape=psf_shape_2d).in_2d
+        )
+
+        grid = masked_structures.MaskedGrid.from_mask(mask=mask)
+        blurring_grid = grid.blurring_grid_from_kernel_shape(
+            kernel_shape_2d=psf_shape_2d
+        )
+
+        if pixel_scale_interpolation_grid is not None:
+
+            grid = grid.new_grid_with_interpolator(
+                pixel_scale_interpolation_grid=pixel_scale_interpolation_grid
+            )
+            blurring_grid = blurring_grid.new_grid_with_interpolator(
+                pixel_scale_interpolation_grid=pixel_scale_interpolation_grid
+            )
+
+        return cls(
+            grid=grid,
+            blurring_grid=blurring_grid,
+            psf=psf,
+            convolver=conv.Convolver(mask=mask, kernel=psf),
+        )
+
+    def set_read_only(self):
+        """Make the grids, PSF and the arrays of the convolver read-only, such that the masked imaging which share \
+        them (e.g. via a *PreprocessingCache* or a signal-to-noise limited masked imaging) cannot modify them \
+        in-place for one another.
+
+        Returns
+        -------
+        MaskedImagingPreprocessing
+            This preprocessing, such that the method can be chained.
+        """
+        arrays = [self.grid, self.blurring_grid, self.psf]
+        arrays += [
+            value
+            for value in getattr(self.convolver, "__dict__", {}).values()
+            if isinstance(value, np.ndarray)
+        ]
+
+        for array in arrays:
+            if isinstance(array, np.ndarray):
+                array.setflags(write=False)
+
+        return self
+
+    def read_only_view(self):
+        """A preprocessing whose grids, PSF and convolver arrays are read-only views of this preprocessing's, such \
+        that masked imaging which shares them with the masked imaging this preprocessing is from (e.g. its \
+        signal-to-noise limited masked imaging) cannot modify them in-place, without this preprocessing being made \
+        read-only."""
+        convolver = copy.copy(self.convolver)
+
+        if convolver is not None:
+            convolver.__dict__.update(
+                {
+                    name: read_only_view_from_array(array=value)
+                    for name, value in convolver.__dict__.items()
+                    if isinstance(value, np.ndarray)
+                }
+            )
+
+        return MaskedImagingPreprocessing(
+            grid=read_only_view_from_array(array=self.grid),
+            blurring_grid=read_only_view_from_array(array=self.blurring_grid),
+            psf=read_only_view_from_array(array=self.psf),
+            convolver=convolver,
+        )
+
+
+def read_only_view_from_array(array):
+    """A read-only view of an array (which keeps the attributes of an autoarray structure, e.g. its mask), or the \
+    input if it is not an array."""
+    if not isinstance(array, np.ndarray):
+        return array
+
+    view = array.view()
+    view.setflags(write=False)
+
+    return view
+
+
+def preprocessing_from_psf_and_mask(
+    psf, mask, psf_shape_2d, pixel_scale_interpolation_grid, preprocessing_cache=None
+):
+    """The preprocessing of masked imaging with a mask and the PSF trimmed to a shape, which is reused from (or \
+    stored in) a preprocessing cache if one is input, or computed otherwise (see \
+    *MaskedImagingPreprocessing.from_psf_and_mask*)."""
+    if preprocessing_cache is None:
+        return MaskedImagingPreprocessing.from_psf_and_mask(
+            psf=psf,
+            mask=mask,
+            psf_shape_2d=psf_shape_2d,
+            pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
+        )
+
+    key = preprocessing_key_from_psf_and_mask(
+        psf=psf,
+        mask=mask,
+        psf_shape_2d=psf_shape_2d,
+        pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
+    )
+
+    preprocessing = preprocessing_cache.preprocessing_from_key(key=key)
+
+    if preprocessing is None:
+
+        preprocessing = MaskedImagingPreprocessing.from_psf_and_mask(
+            psf=psf,
+            mask=mask,
+            psf_shape_2d=psf_shape_2d,
+            pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
+        ).set_read_only()
+
+        preprocessing_cache.add_preprocessing(key=key, preprocessing=preprocessing)
+
+    return preprocessing
+
+
+class PreprocessingCache:
+    def __init__(self, maxsize, path=None):
+        """A bounded least-recently-used cache of the preprocessing of masked imaging (see \
+        *MaskedImagingPreprocessing*), keyed on a hash of the contents of its PSF, mask and settings (see \
+        *preprocessing_key_from_psf_and_mask*).
+
+        The cache is a setting of the imaging phases of a pipeline, such that the masked imaging built by every \
+        phase (and its hyper phases) from the same mask, PSF and settings reuses the grids and convolver of the \
+        first instead of recomputing them. Copies of a phase share its cache, whereas a pickled cache is restored \
+        empty.
+
+        The preprocessing is stored in memory and, if a path is input, is also pickled to a file in the path named \
+        by its key, from which a preprocessing missing from memory is loaded (e.g. by a later run of the pipeline).
+
+        The cached grids and convolver are shared by every masked imaging built from them, and must therefore not \
+        be modified in-place.
+
+        Parameters
+        -----------
+        maxsize : int
+            The maximum number of preprocessings stored in memory, above which the least recently used is removed.
+        path : str or None
+            The directory the preprocessings are written to and loaded from, if any.
+        """
+        self.maxsize = maxsize
+        self.path = path
+        self.preprocessings = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __getstate__(self):
+        return {"maxsize": self.maxsize, "path": self.path}
+
+    def __setstate__(self, state):
+        self.__init__(maxsize=state["maxsize"], path=state["path"])
+
+    def file_path_from_key(self, key):
+        return os.path.join(self.path, f"{key}.pickle")
+
+    def preprocessing_from_key(self, key):
+        """The preprocessing of a key, which is returned from memory or loaded from disk, in that order of \
+        preference, or None if it is in neither."""
+        if key in self.preprocessings:
+            self.preprocessings.move_to_end(key)
+            self.hits += 1
+            return self.preprocessings[key]
+
+        if self.path is not None and os.path.isfile(self.file_path_from_key(key)):
+
+            with open(self.file_path_from_key(key), "rb") as f:
+                preprocessing = pickle.load(f)
+
+            self.disk_hits += 1
+            self.add_preprocessing_to_memory(key=key, preprocessing=preprocessing)
+
+            return preprocessing
+
+        self.misses += 1
+
+    def add_preprocessing(self, key, preprocessing):
+        """Store the preprocessing of a key in memory and, if the cache has a path, write it to disk via a \
+        temporary file which is renamed once written, such that a partially written file is never loaded by \
+        another process."""
+        self.add_preprocessing_to_memory(key=key, preprocessing=preprocessing)
+
+        if self.path is not None:
+
+            file_path = self.file_path_from_key(key)
+            temporary_file_path = f"{file_path}.{os.getpid()}.tmp"
+
+            with open(temporary_file_path, "wb") as f:
+                pickle.dump(preprocessing, f)
+
+            os.replace(temporary_file_path, file_path)
+
+    def add_preprocessing_to_memory(self, key, preprocessing):
+
+        self.preprocessings[key] = preprocessing
+
+        while len(self.preprocessings) > self.maxsize:
+            self.preprocessings.popitem(last=False)
 
 
 class AbstractLensMasked:
@@ -9,25 +282,38 @@ class AbstractLensMasked:
 
         if positions is not None:
             self.positions = grids.Coordinates(coordinates=positions)
+            self.positions_grid_1d = self.positions.in_1d
+            self.positions_set_sizes = np.array(
+                [len(coordinate_set) for coordinate_set in self.positions]
+            )
         else:
             self.positions = None
+            self.positions_grid_1d = None
+            self.positions_set_sizes = None
 
         self.positions_threshold = positions_threshold
 
         self.preload_sparse_grids_of_planes = preload_sparse_grids_of_planes
 
     def check_positions_trace_within_threshold_via_tracer(self, tracer):
+        """Raise a *RayTracingException* if the positions of any set trace to source-plane coordinates which are \
+        further apart than the positions threshold.
 
+        Only the positions are ray-traced, to the final plane of the tracer, and their separations are checked by \
+        the same kernel as a *PositionsFit* (see *lens_util.positions_within_threshold_from_grid_1d_and_set_sizes*), \
+        which exits as soon as one exceeds the threshold, such that a tracer is rejected before anything else is \
+        computed for its fit.
+        """
         if self.positions is not None and self.positions_threshold is not None:
 
-            positions_fit = fit.PositionsFit(
-                positions=self.positions,
-                tracer=tracer,
-                noise_map=self.imaging.pixel_scales,
+            source_plane_positions = tracer.traced_grid_of_plane_from_grid(
+                grid=self.positions_grid_1d, plane_index=-1
             )
 
-            if not positions_fit.maximum_separation_within_threshold(
-                self.positions_threshold
+            if not lens_util.positions_within_threshold_from_grid_1d_and_set_sizes(
+                grid_1d=source_plane_positions,
+                set_sizes=self.positions_set_sizes,
+                threshold=self.positions_threshold,
             ):
                 raise exc.RayTracingException
 
@@ -53,6 +339,8 @@ class MaskedImaging(masked_dataset.MaskedImaging, AbstractLensMasked):
         positions=None,
         positions_threshold=None,
         preload_sparse_grids_of_planes=None,
+        precision="float64",
+        preprocessing_cache=None,
     ):
         """
         The lens dataset is the collection of data_type (image, noise-map, PSF), a mask, grid, convolver \
@@ -61,6 +349,9 @@ class MaskedImaging(masked_dataset.MaskedImaging, AbstractLensMasked):
         Whilst the image, noise-map, etc. are loaded in 2D, the lens dataset creates reduced 1D arrays of each \
         for lens calculations.
 
+        If a preprocessing cache is input, the grids, blurring grid, PSF and convolver are reused from (or stored in) \
+        the cache instead of being computed for every masked imaging.
+
         Parameters
         ----------
         imaging: im.Imaging
@@ -82,16 +373,70 @@ class MaskedImaging(masked_dataset.MaskedImaging, AbstractLensMasked):
         inversion_pixel_limit : int or None
             The maximum number of pixels that can be used by an inversion, with the limit placed primarily to speed \
             up run.
+        precision : str
+            The precision the grid and blurring grid are stored in. If *float32*, the grids, their traced grids and \
+            the profile images computed from them are stored in single precision, halving their memory use, whereas \
+            the likelihood and inversion are still computed in double precision.
+        preprocessing_cache : PreprocessingCache or None
+            The cache the grids, blurring grid, PSF and convolver are reused from (or stored in), if any.
         """
 
-        super(MaskedImaging, self).__init__(
-            imaging=imaging,
-            mask=mask,
-            psf_shape_2d=psf_shape_2d,
-            pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
-            inversion_pixel_limit=inversion_pixel_limit,
-            inversion_uses_border=inversion_uses_border,
-        )
+        if (
+            preprocessing_cache is None
+            or imaging.psf is None
+            or mask.pixel_scales is None
+        ):
+            key = None
+            preprocessing = None
+        else:
+            key = preprocessing_key_from_psf_and_mask(
+                psf=imaging.psf,
+                mask=mask,
+                psf_shape_2d=imaging.psf.shape_2d
+                if psf_shape_2d is None
+                else psf_shape_2d,
+                pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
+            )
+            preprocessing = preprocessing_cache.preprocessing_from_key(key=key)
+
+        if preprocessing is None:
+
+            super(MaskedImaging, self).__init__(
+                imaging=imaging,
+                mask=mask,
+                psf_shape_2d=psf_shape_2d,
+                pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
+                inversion_pixel_limit=inversion_pixel_limit,
+                inversion_uses_border=inversion_uses_border,
+            )
+
+            if key is not None:
+                preprocessing_cache.add_preprocessing(
+                    key=key,
+                    preprocessing=MaskedImagingPreprocessing.from_masked_imaging(
+                        masked_imaging=self
+                    ).set_read_only(),
+                )
+
+        else:
+
+            # The imaging is passed without its PSF, such that the convolver and blurring grid are not recomputed,
+            # and the interpolation grid is not computed for the grid which the cached grid replaces.
+
+            super(MaskedImaging, self).__init__(
+                imaging=im.Imaging(image=imaging.image, noise_map=imaging.noise_map),
+                mask=mask,
+                inversion_pixel_limit=inversion_pixel_limit,
+                inversion_uses_border=inversion_uses_border,
+            )
+
+            self.imaging = imaging
+            self.pixel_scale_interpolation_grid = pixel_scale_interpolation_grid
+            self.psf_shape_2d = preprocessing.psf.shape_2d
+            self.grid = preprocessing.grid
+            self.blurring_grid = preprocessing.blurring_grid
+            self.psf = preprocessing.psf
+            self.convolver = preprocessing.convolver
 
         AbstractLensMasked.__init__(
             self=self,
@@ -100,7 +445,98 @@ class MaskedImaging(masked_dataset.MaskedImaging, AbstractLensMasked):
             preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
         )
 
+        self.precision = precision
+        self.preprocessing_cache = preprocessing_cache
+
+        if self.grid is not None:
+            self.grid = self.grid.astype(precision, copy=False)
+
+        if getattr(self, "blurring_grid", None) is not None:
+            self.blurring_grid = self.blurring_grid.astype(precision, copy=False)
+
+        self.preload_blurred_profile_image = None
+        self.preload_traced_grids_of_planes = None
+        self.preload_profiles_key = None
+
+        self._binned_cache = {}
+        self._signal_to_noise_limited_cache = {}
+
+    def preload_profile_quantities_from_tracer(self, tracer):
+        """Compute the blurred profile image and the traced grids of the masked imaging's grid for a tracer whose \
+        galaxies' redshifts, light profiles and mass profiles are the same for every model fitted by a phase (see \
+        *MetaDatasetFit.profiles_are_fixed*).
+
+        Every fit to the masked imaging of a tracer with the same galaxy redshifts and light and mass profiles (see \
+        *Tracer.profiles_key* and *preloads_apply_to_tracer*) then reuses these instead of ray-tracing its grids \
+        and computing its profile image, including the source-plane grids used by its mappers. Fits of every other \
+        tracer compute their own.
+
+        Parameters
+        ----------
+        tracer : ray_tracing.Tracer
+            The tracer whose blurred profile image and traced grids are preloaded.
+        """
+        self.preload_traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+            grid=self.grid
+        )
+        self.preload_blurred_profile_image = tracer.blurred_profile_image_from_grid_and_convolver(
+            grid=self.grid, convolver=self.convolver, blurring_grid=self.blurring_grid
+        )
+        self.preload_profiles_key = tracer.profiles_key
+
+    def preloads_apply_to_tracer(self, tracer):
+        """Whether the preloaded blurred profile image and traced grids were computed for a tracer with the same \
+        galaxy redshifts and light and mass profiles as the input tracer, such that its fit can reuse them."""
+        if self.preload_profiles_key is None:
+            return False
+
+        try:
+            return bool(tracer.profiles_key == self.preload_profiles_key)
+        except ValueError:
+            return False
+
+    def masked_imaging_from_imaging_and_mask(self, imaging, mask):
+        """A copy of this masked imaging for new imaging and a mask, whose image and noise-map are masked from the \
+        new imaging and whose profile preloads and cached views are reset, but which shares every other attribute \
+        (including its grids, blurring grid, PSF and convolver) with this masked imaging.
+
+        This is used to derive masked imaging (e.g. binned up or signal-to-noise limited) from this masked imaging \
+        without rebuilding it via the constructor, with the derived masked imaging replacing what changes for it.
+        """
+        masked_imaging = copy.copy(self)
+
+        masked_imaging.imaging = imaging
+        masked_imaging.mask = mask
+        masked_imaging.image = mask.mapping.array_stored_1d_from_array_2d(
+            array_2d=imaging.image.in_2d
+        )
+        masked_imaging.noise_map = mask.mapping.array_stored_1d_from_array_2d(
+            array_2d=imaging.noise_map.in_2d
+        )
+        masked_imaging.preload_blurred_profile_image = None
+        masked_imaging.preload_traced_grids_of_planes = None
+        masked_imaging.preload_profiles_key = None
+        masked_imaging._binned_cache = {}
+        masked_imaging._signal_to_noise_limited_cache = {}
+
+        return masked_imaging
+
     def binned_from_bin_up_factor(self, bin_up_factor):
+        """The masked imaging of this masked imaging's imaging and mask binned up by a factor, which is cached for \
+        every factor such that it is only computed once.
+
+        The binned mask is derived from this masked imaging's mask (via its mapping) and the binned masked imaging \
+        from this masked imaging, without rebuilding it via the constructor. Only the grids, blurring grid, PSF and \
+        convolver of the binned mask are computed for it (or reused from the preprocessing cache, if this masked \
+        imaging has one), and every other attribute is shared.
+
+        Parameters
+        ----------
+        bin_up_factor : int
+            The factor the imaging and mask are binned up by.
+        """
+        if bin_up_factor in self._binned_cache:
+            return self._binned_cache[bin_up_factor]
 
         binned_imaging = self.imaging.binned_from_bin_up_factor(
             bin_up_factor=bin_up_factor
@@ -109,36 +545,66 @@ class MaskedImaging(masked_dataset.MaskedImaging, AbstractLensMasked):
             bin_up_factor=bin_up_factor
         )
 
-        return self.__class__(
-            imaging=binned_imaging,
+        masked_imaging = self.masked_imaging_from_imaging_and_mask(
+            imaging=binned_imaging, mask=binned_mask
+        )
+
+        preprocessing = preprocessing_from_psf_and_mask(
+            psf=binned_imaging.psf,
             mask=binned_mask,
             psf_shape_2d=self.psf_shape_2d,
             pixel_scale_interpolation_grid=self.pixel_scale_interpolation_grid,
-            inversion_pixel_limit=self.inversion_pixel_limit,
-            inversion_uses_border=self.inversion_uses_border,
-            positions=self.positions,
-            positions_threshold=self.positions_threshold,
-            preload_sparse_grids_of_planes=self.preload_sparse_grids_of_planes,
+            preprocessing_cache=self.preprocessing_cache,
+        )
+
+        masked_imaging.grid = preprocessing.grid.astype(self.precision, copy=False)
+        masked_imaging.blurring_grid = preprocessing.blurring_grid.astype(
+            self.precision, copy=False
         )
+        masked_imaging.psf = preprocessing.psf
+        masked_imaging.convolver = preprocessing.convolver
+
+        self._binned_cache[bin_up_factor] = masked_imaging
+
+        return masked_imaging
 
     def signal_to_noise_limited_from_signal_to_noise_limit(self, signal_to_noise_limit):
+        """The masked imaging of this masked imaging's imaging with its noise-map increased such that no pixel has a \
+        signal-to-noise above a limit, which is cached for every limit such that it is only computed once.
 
-        imaging_with_signal_to_noise_limit = self.imaging.signal_to_noise_limited_from_signal_to_noise_limit(
-            signal_to_noise_limit=signal_to_noise_limit
-        )
+        The mask is unchanged, so the grids, blurring grid, PSF and convolver of this masked imaging are shared with \
+        the signal-to-noise limited masked imaging instead of being recomputed, and only its imaging and noise-map \
+        are new. The signal-to-noise limited masked imaging shares them via read-only views (see \
+        *MaskedImagingPreprocessing.read_only_view*), such that it cannot modify them for this masked imaging.
+
+        Parameters
+        ----------
+        signal_to_noise_limit : float
+            The maximum signal-to-noise of any pixel.
+        """
+        if signal_to_noise_limit in self._signal_to_noise_limited_cache:
+            return self._signal_to_noise_limited_cache[signal_to_noise_limit]
 
-        return self.__class__(
-            imaging=imaging_with_signal_to_noise_limit,
+        masked_imaging = self.masked_imaging_from_imaging_and_mask(
+            imaging=self.imaging.signal_to_noise_limited_from_signal_to_noise_limit(
+                signal_to_noise_limit=signal_to_noise_limit
+            ),
             mask=self.mask,
-            psf_shape_2d=self.psf_shape_2d,
-            pixel_scale_interpolation_grid=self.pixel_scale_interpolation_grid,
-            inversion_pixel_limit=self.inversion_pixel_limit,
-            inversion_uses_border=self.inversion_uses_border,
-            positions=self.positions,
-            positions_threshold=self.positions_threshold,
-            preload_sparse_grids_of_planes=self.preload_sparse_grids_of_planes,
         )
 
+        preprocessing = MaskedImagingPreprocessing.from_masked_imaging(
+            masked_imaging=self
+        ).read_only_view()
+
+        masked_imaging.grid = preprocessing.grid
+        masked_imaging.blurring_grid = preprocessing.blurring_grid
+        masked_imaging.psf = preprocessing.psf
+        masked_imaging.convolver = preprocessing.convolver
+
+        self._signal_to_noise_limited_cache[signal_to_noise_limit] = masked_imaging
+
+        return masked_imaging
+
 
 class MaskedInterferometer(masked_dataset.MaskedInterferometer, AbstractLensMasked):
     def __init__(
@@ -1,12 +1,162 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
 import autofit as af
 from autoastro.galaxy import galaxy as g
 from autolens.lens import ray_tracing
 
 
-class Analysis(af.Analysis):
-    def __init__(self, cosmology, results):
+def value_from_instance_and_path(instance, path):
+    """The value at a path of a model instance (see *af.ModelMapper.unique_prior_paths*), where the name of each \
+    element of a tuple parameter (e.g. *centre_0* of a *centre*) is its index in the tuple."""
+    value = instance
+
+    for name in path:
+        if isinstance(name, int):
+            value = value[name]
+        elif isinstance(value, tuple):
+            value = value[int(name.rsplit("_", 1)[1])]
+        else:
+            value = getattr(value, name)
+
+    return value
+
+
+class LikelihoodCache:
+    def __init__(self, maxsize, model):
+        """A bounded least-recently-used cache of the figures of merit of the model instances fitted by an analysis, \
+        keyed on their physical parameter vectors (see *parameter_vector_from_instance*), such that an instance \
+        whose parameters are fitted again (e.g. a point re-queried by the non-linear search) is not refitted.
+
+        The fit with the highest figure of merit computed by the analysis is also stored with its parameter vector, \
+        as the best fit instance is the only instance whose fit is requested (by its visualization during the \
+        non-linear search and by the result of the phase). Only this one fit is stored, as a fit holds arrays the \
+        size of the masked dataset.
+
+        Parameters
+        -----------
+        maxsize : int
+            The maximum number of figures of merit stored, above which the least recently used is removed.
+        model : af.ModelMapper
+            The model whose instances are fitted by the analysis.
+        """
+        self.maxsize = maxsize
+        self.model = model
+        self.prior_paths = None
+        self.figures_of_merit = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        self.fit_parameter_vector = None
+        self.fit = None
+
+    def parameter_vector_from_instance(self, instance):
+        """The physical parameter vector of an instance of the model, i.e. the values of its free parameters in the \
+        order of the vector sampled by the non-linear search, which are read from the instance at the paths of the \
+        priors of the model.
+
+        Every other attribute of the instances of the model is fixed, such that two instances have the same \
+        parameter vector if (and only if) they have the same parameters. The paths are found the first time an \
+        instance is fitted, once the priors of the phase are customized.
+
+        *None* is returned if a parameter is not an attribute of the instance (e.g. of a profile which converts it \
+        to a different parameter), in which case the instance is not cached.
+        """
+        if self.prior_paths is None:
+            self.prior_paths = self.model.unique_prior_paths
+
+        try:
+            return tuple(
+                value_from_instance_and_path(instance=instance, path=path)
+                for path in self.prior_paths
+            )
+        except (AttributeError, IndexError):
+            return None
+
+    def figure_of_merit_for_parameter_vector(self, parameter_vector):
+        """The figure of merit of a parameter vector, which is *None* if it is not in the cache."""
+        if parameter_vector in self.figures_of_merit:
+            self.figures_of_merit.move_to_end(parameter_vector)
+            self.hits += 1
+            return self.figures_of_merit[parameter_vector]
+
+        self.misses += 1
+
+    def add_figure_of_merit(self, parameter_vector, figure_of_merit):
+
+        self.figures_of_merit[parameter_vector] = figure_of_merit
+        self.figures_of_merit.move_to_end(parameter_vector)
+
+        while len(self.figures_of_merit) > self.maxsize:
+            self.figures_of_merit.popitem(last=False)
+
+    def fit_for_instance(self, instance):
+        """The best fit stored, if the input instance has the same parameter vector, and otherwise *None*."""
+        if self.fit is not None and self.fit_parameter_vector is not None:
+            if (
+                self.parameter_vector_from_instance(instance=instance)
+                == self.fit_parameter_vector
+            ):
+                self.hits += 1
+                return self.fit
+
+        self.misses += 1
+
+    def add_fit(self, instance, fit):
+        """Store the fit of an instance if its figure of merit is higher than that of the best fit stored, whose \
+        parameter vector is only computed if it is."""
+        if self.fit is None or fit.figure_of_merit > self.fit.figure_of_merit:
+            self.fit_parameter_vector = self.parameter_vector_from_instance(
+                instance=instance
+            )
+            self.fit = fit
 
+
+class Analysis(af.Analysis, ABC):
+    def __init__(
+        self,
+        cosmology,
+        results,
+        model=None,
+        likelihood_cache_maxsize=None,
+        threads=1,
+        quantity_cache_maxsize=0,
+        mapper_cache_maxsize=0,
+    ):
+        """
+        Parameters
+        ----------
+        cosmology : astropy.cosmology
+            The cosmology the tracers of the model instances are created using.
+        results : af.ResultsCollection
+            The results of the previous phases of the pipeline.
+        model : af.ModelMapper or None
+            The model fitted by the analysis, whose physical parameter vectors key the *LikelihoodCache*, which must \
+            be input with a *likelihood_cache_maxsize*.
+        likelihood_cache_maxsize : int or None
+            If input, the figures of merit of up to this many model instances are stored in a *LikelihoodCache*, \
+            such that an instance with the same parameters as one already fitted is not refitted.
+        threads : int
+            The number of threads the galaxies of every plane of the tracers are evaluated on in parallel (see \
+            *ray_tracing.TracerPlan*).
+        quantity_cache_maxsize : int
+            The maximum number of galaxy quantities memoized by the planes of the tracers (see \
+            *plane.QuantityCache*), which is switched off for 0.
+        mapper_cache_maxsize : int
+            The maximum number of mappers memoized by the tracers (see *ray_tracing.MapperCache*), which is \
+            switched off for 0.
+        """
         self.cosmology = cosmology
+        self.threads = threads
+        self.quantity_cache_maxsize = quantity_cache_maxsize
+        self.mapper_cache_maxsize = mapper_cache_maxsize
+        self.tracer_plan = None
+
+        self.likelihood_cache = (
+            LikelihoodCache(maxsize=likelihood_cache_maxsize, model=model)
+            if likelihood_cache_maxsize is not None
+            else None
+        )
 
         # TODO : This if loop is because of an OptimizerGridSeach, where the 'best_result' we do not want to update
         # TODO: the hyper images using.
@@ -43,11 +193,100 @@ class Analysis(af.Analysis):
         else:
             return None
 
+    def tracer_plan_for_instance(self, instance):
+        """The plan used to create the tracer of every instance, which is computed from the galaxies of the first \
+        instance fitted and reused for all subsequent instances (see *ray_tracing.TracerPlan*)."""
+
+        if self.tracer_plan is None:
+            self.tracer_plan = ray_tracing.TracerPlan.from_galaxies(
+                galaxies=instance.galaxies,
+                cosmology=self.cosmology,
+                threads=self.threads,
+                quantity_cache_maxsize=self.quantity_cache_maxsize,
+                mapper_cache_maxsize=self.mapper_cache_maxsize,
+            )
+
+        return self.tracer_plan
+
     def tracer_for_instance(self, instance):
-        return ray_tracing.Tracer.from_galaxies(
-            galaxies=instance.galaxies, cosmology=self.cosmology
+        return self.tracer_plan_for_instance(instance=instance).tracer_from_galaxies(
+            galaxies=instance.galaxies
+        )
+
+    def fit(self, instance):
+        """
+        Determine the fit of a lens galaxy and source galaxy to the masked dataset in this lens, which is returned \
+        from the likelihood cache (if there is one) if an instance with the same parameters was already fitted.
+
+        Parameters
+        ----------
+        instance
+            A model instance with attributes
+
+        Returns
+        -------
+        fit : Fit
+            A fractional value indicating how well this model fit and the model masked dataset itself
+        """
+
+        if self.likelihood_cache is None:
+            return self.figure_of_merit_for_instance(instance=instance)
+
+        parameter_vector = self.likelihood_cache.parameter_vector_from_instance(
+            instance=instance
+        )
+
+        if parameter_vector is None:
+            return self.figure_of_merit_for_instance(instance=instance)
+
+        figure_of_merit = self.likelihood_cache.figure_of_merit_for_parameter_vector(
+            parameter_vector=parameter_vector
+        )
+
+        if figure_of_merit is None:
+
+            figure_of_merit = self.figure_of_merit_for_instance(instance=instance)
+
+            self.likelihood_cache.add_figure_of_merit(
+                parameter_vector=parameter_vector, figure_of_merit=figure_of_merit
+            )
+
+        return figure_of_merit
+
+    def figure_of_merit_for_instance(self, instance):
+
+        self.associate_hyper_images(instance=instance)
+        tracer = self.tracer_for_instance(instance=instance)
+
+        return self.figure_of_merit_for_instance_and_tracer(
+            instance=instance, tracer=tracer
         )
 
+    @abstractmethod
+    def figure_of_merit_for_instance_and_tracer(self, instance, tracer):
+        """The figure of merit of the fit of a model instance and its tracer to the masked dataset, which is \
+        implemented by the analysis of every type of dataset."""
+
+    def fit_for_instance(self, instance):
+        """The fit of a model instance (e.g. for its visualization or the result of a phase), which is the best fit \
+        computed by the analysis if it has the same parameters and the analysis has a likelihood cache."""
+
+        if self.likelihood_cache is not None:
+
+            fit = self.likelihood_cache.fit_for_instance(instance=instance)
+
+            if fit is not None:
+                return fit
+
+        return self.fit_for_instance_and_tracer(
+            instance=instance, tracer=self.tracer_for_instance(instance=instance)
+        )
+
+    @abstractmethod
+    def fit_for_instance_and_tracer(self, instance, tracer):
+        """The fit of a model instance and its tracer to the masked dataset, which is implemented by the analysis \
+        of every type of dataset."""
+
     def associate_hyper_images(self, instance: af.ModelInstance) -> af.ModelInstance:
         """
         Takes images from the last result, if there is one, and associates them with galaxies in this phase
@@ -0,0 +1,295 @@
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+import weakref
+
+import numpy as np
+
+
+class StoredArray:
+    def __init__(self, file_name, cls, attributes):
+        """An array of a dataset written to a .npy file of a dataset store, which is restored as a memory-mapped \
+        array of its original class (e.g. an *aa.Array* or *aa.Kernel*) with the same attributes (e.g. its mask).
+
+        Parameters
+        ----------
+        file_name : str
+            The name of the .npy file (without its extension) the array is written to.
+        cls : type
+            The class of the array, which is a subclass of (or is) *np.ndarray*.
+        attributes : dict
+            The attributes of the array, which are themselves stored arrays if they are arrays.
+        """
+        self.file_name = file_name
+        self.cls = cls
+        self.attributes = attributes
+
+
+def stored_value_from_value(value, name, arrays):
+    """The value of an attribute of a dataset as it is stored, where arrays (including autoarray structures and \
+    the arrays of their attributes, e.g. masks) are replaced by *StoredArray*'s and every other value is unchanged.
+
+    An array shared by several attributes (e.g. the mask of the image and noise-map) is stored once.
+
+    Parameters
+    ----------
+    value : object
+        The value that is stored.
+    name : str
+        The name of the attribute, used as the file name of an array.
+    arrays : dict
+        The stored arrays and their values, keyed on the id of the arrays, which are added to.
+    """
+    if not isinstance(value, np.ndarray):
+        return value
+
+    if id(value) in arrays:
+        return arrays[id(value)][0]
+
+    stored_array = StoredArray(file_name=name, cls=type(value), attributes={})
+
+    arrays[id(value)] = (stored_array, np.asarray(value))
+
+    for attribute_name, attribute in getattr(value, "__dict__", {}).items():
+        stored_array.attributes[attribute_name] = stored_value_from_value(
+            value=attribute, name=f"{name}.{attribute_name}", arrays=arrays
+        )
+
+    return stored_array
+
+
+def value_from_stored_value(stored_value, directory, values):
+    """The value of an attribute of a dataset restored from how it is stored, where the arrays are memory-mapped \
+    read-only from their .npy files instead of being read into memory, such that the store cannot be modified via \
+    a restored dataset.
+
+    Parameters
+    ----------
+    stored_value : object
+        The stored value (see *stored_value_from_value*).
+    directory : str
+        The directory of the dataset in the store.
+    values : dict
+        The arrays already restored, keyed on their file names, such that an array shared by several attributes \
+        is restored once and shared again.
+    """
+    if not isinstance(stored_value, StoredArray):
+        return stored_value
+
+    if stored_value.file_name in values:
+        return values[stored_value.file_name]
+
+    value = np.load(
+        os.path.join(directory, f"{stored_value.file_name}.npy"), mmap_mode="r"
+    ).view(stored_value.cls)
+
+    values[stored_value.file_name] = value
+
+    for attribute_name, attribute in stored_value.attributes.items():
+        setattr(
+            value,
+            attribute_name,
+            value_from_stored_value(
+                stored_value=attribute, directory=directory, values=values
+            ),
+        )
+
+    return value
+
+
+def save_dataset_to_store(dataset, store_path):
+    """Write a dataset to a dataset store, as a .npy file for every array and a pickle of its class and other \
+    attributes, in a directory named by a hash of its contents.
+
+    A dataset whose directory already exists in the store is not written again. The directory is written under a \
+    temporary name and renamed once complete, such that a partially written dataset is never loaded.
+
+    Parameters
+    ----------
+    dataset : aa.Imaging or aa.Interferometer
+        The dataset that is written.
+    store_path : str
+        The directory of the store.
+
+    Returns
+    -------
+    str
+        The directory of the dataset in the store.
+    """
+    arrays = {}
+
+    stored_attributes = {
+        name: stored_value_from_value(value=value, name=name, arrays=arrays)
+        for name, value in dataset.__dict__.items()
+    }
+
+    pickled_attributes = pickle.dumps((type(dataset), stored_attributes))
+
+    digest = hashlib.sha1(pickled_attributes)
+
+    for stored_array, array in arrays.values():
+        digest.update(
+            repr((stored_array.file_name, array.dtype.str, array.shape)).encode()
+        )
+        digest.update(np.ascontiguousarray(array).tobytes())
+
+    directory = os.path.join(store_path, digest.hexdigest())
+
+    if os.path.isdir(directory):
+        return directory
+
+    os.makedirs(store_path, exist_ok=True)
+
+    temporary_directory = tempfile.mkdtemp(dir=store_path)
+
+    for stored_array, array in arrays.values():
+        np.save(
+            os.path.join(temporary_directory, f"{stored_array.file_name}.npy"), array
+        )
+
+    with open(os.path.join(temporary_directory, "dataset.pickle"), "wb") as f:
+        f.write(pickled_attributes)
+
+    try:
+        os.rename(temporary_directory, directory)
+    except OSError:
+        shutil.rmtree(temporary_directory)
+
+    return directory
+
+
+def dataset_from_store(directory):
+    """Restore a dataset from its directory in a dataset store, with its arrays memory-mapped read-only from their \
+    .npy files (see *save_dataset_to_store*)."""
+    with open(os.path.join(directory, "dataset.pickle"), "rb") as f:
+        cls, stored_attributes = pickle.load(f)
+
+    values = {}
+
+    dataset = cls.__new__(cls)
+
+    dataset.__dict__.update(
+        {
+            name: value_from_stored_value(
+                stored_value=stored_value, directory=directory, values=values
+            )
+            for name, stored_value in stored_attributes.items()
+        }
+    )
+
+    return dataset
+
+
+class DatasetReference:
+    def __init__(self, directory):
+        """A reference to a dataset in a dataset store, which is pickled in the output path of a phase in place of \
+        the dataset.
+
+        Unpickling the reference returns the dataset restored from the store (see *dataset_from_store*), such that \
+        the pickle of the dataset in the output path of a phase is loaded as the dataset itself, as it is when the \
+        full dataset is pickled (e.g. by the aggregator).
+
+        Parameters
+        ----------
+        directory : str
+            The absolute directory of the dataset in the store.
+        """
+        self.directory = directory
+
+    def __reduce__(self):
+        return dataset_from_store, (self.directory,)
+
+
+class DatasetStore:
+    def __init__(self, path):
+        """A store the datasets fitted by the phases of a pipeline are written to once, as a .npy file for every \
+        array (see *save_dataset_to_store*), instead of every phase and hyper phase pickling the full dataset in its \
+        output path.
+
+        The store is a setting of the phases of a pipeline, and copies of a phase (e.g. its hyper phases) share its \
+        store. A pickled store is restored empty.
+
+        The datasets are loaded from the output path of a phase with their arrays memory-mapped read-only from the \
+        store, which must therefore not be moved or deleted.
+
+        Parameters
+        -----------
+        path : str
+            The directory of the store.
+        """
+        self.path = path
+        self.stored_dataset_directories = weakref.WeakKeyDictionary()
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __getstate__(self):
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.__init__(path=state["path"])
+
+    def directory_from_dataset(self, dataset):
+        """The directory of a dataset in the store, which is written to the store the first time the dataset is \
+        saved by this store, such that a dataset passed to every phase (and hyper phase) of a pipeline is hashed \
+        and written once.
+
+        The dataset must not be modified in-place once it is saved, as it is not written to the store again.
+        """
+        try:
+            directory = self.stored_dataset_directories.get(dataset)
+        except TypeError:
+            directory = None
+
+        if directory is None or not os.path.isdir(directory):
+
+            directory = save_dataset_to_store(dataset=dataset, store_path=self.path)
+
+            try:
+                self.stored_dataset_directories[dataset] = directory
+            except TypeError:
+                pass
+
+        return directory
+
+    def save_dataset(self, dataset, phase_output_path):
+        """Save the dataset fitted by a phase in its output path, as a pickle of a *DatasetReference* to the \
+        dataset in the store, which is loaded as the dataset with its arrays memory-mapped read-only from the store.
+
+        Parameters
+        ----------
+        dataset : aa.Imaging or aa.Interferometer
+            The dataset fitted by the phase.
+        phase_output_path : str
+            The output path of the phase, which the pickle of its dataset is saved in.
+        """
+        directory = os.path.abspath(self.directory_from_dataset(dataset=dataset))
+
+        with open(os.path.join(phase_output_path, f"{dataset.name}.pickle"), "wb") as f:
+            pickle.dump(DatasetReference(directory=directory), f)
+
+
+def save_dataset(dataset, phase_output_path, dataset_store=None):
+    """Save the dataset fitted by a phase in its output path, which is a pickle of the full dataset or, if the \
+    phase has a dataset store, of a reference to the dataset in the store (see *DatasetStore.save_dataset*).
+
+    Either pickle is loaded as the dataset.
+
+    Parameters
+    ----------
+    dataset : aa.Imaging or aa.Interferometer
+        The dataset fitted by the phase.
+    phase_output_path : str
+        The output path of the phase, which the pickle of its dataset is saved in.
+    dataset_store : DatasetStore or None
+        The dataset store of the phase, if any.
+    """
+    if dataset_store is None:
+        dataset.save(phase_output_path)
+    else:
+        dataset_store.save_dataset(dataset=dataset, phase_output_path=phase_output_path)
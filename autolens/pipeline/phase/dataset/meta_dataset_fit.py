@@ -1,6 +1,9 @@
 import autofit as af
 import autoarray as aa
+from autoastro.profiles import light_profiles as lp
+from autoastro.profiles import mass_profiles as mp
 from autolens import exc
+from autolens.lens import ray_tracing
 from autoarray.operators.inversion import pixelizations as pix
 from autolens.pipeline.phase.dataset.phase import isinstance_or_prior
 
@@ -76,6 +79,49 @@ class MetaDatasetFit:
                     return True
         return False
 
+    @property
+    def profiles_are_fixed(self):
+        """Whether the redshift, light profiles and mass profiles of every galaxy of the model are fixed (e.g. in an \
+        inversion phase, where every galaxy is fixed to the previous phase's result except for its pixelization and \
+        regularization), such that every model fitted has the same profile image and traced grids."""
+
+        if not self.model.galaxies:
+            return False
+
+        for galaxy in self.model.galaxies:
+
+            if not isinstance(galaxy, af.PriorModel):
+                continue
+
+            if isinstance(galaxy.redshift, af.Prior):
+                return False
+
+            for name, prior_model in galaxy.prior_model_tuples:
+                if isinstance(prior_model, af.PriorModel) and issubclass(
+                    prior_model.cls, (lp.LightProfile, mp.MassProfile)
+                ):
+                    if prior_model.prior_count > 0:
+                        return False
+
+        return True
+
+    def fixed_profiles_tracer_from_cosmology(self, cosmology):
+        """The tracer of the model's galaxies if their redshifts, light profiles and mass profiles are fixed (see \
+        *profiles_are_fixed*), whose profile image and traced grids are computed once and reused by every fit of \
+        the phase, else *None*.
+
+        The galaxies' other (free) parameters, e.g. their pixelization, are set to their prior medians, which do \
+        not change the profile image or traced grids. A model without free parameters is only fitted once, so no \
+        tracer is returned for it."""
+
+        if self.model.prior_count == 0 or not self.profiles_are_fixed:
+            return None
+
+        return ray_tracing.Tracer.from_galaxies(
+            galaxies=self.model.instance_from_prior_medians().galaxies,
+            cosmology=cosmology,
+        )
+
     def preload_pixelization_grids_of_planes_from_results(self, results):
 
         if self.is_hyper_phase:
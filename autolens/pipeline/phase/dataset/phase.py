@@ -5,6 +5,7 @@ import autoarray as aa
 from autofit.tools.phase import Dataset
 from autolens.pipeline.phase import abstract
 from autolens.pipeline.phase import extensions
+from autolens.pipeline.phase.dataset import dataset_store
 from autolens.pipeline.phase.dataset.result import Result
 
 
@@ -28,6 +29,7 @@ class PhaseDataset(abstract.AbstractPhase):
         galaxies=None,
         optimizer_class=af.MultiNest,
         cosmology=cosmo.Planck15,
+        dataset_store=None,
     ):
         """
 
@@ -38,11 +40,15 @@ class PhaseDataset(abstract.AbstractPhase):
         ----------
         optimizer_class: class
             The class of a non_linear optimizer
+        dataset_store : dataset_store.DatasetStore or None
+            If input, the dataset fitted by the phase is written once to this store and its output path references \
+            it, instead of the phase pickling the full dataset (see *dataset_store.DatasetStore*).
         """
 
         super(PhaseDataset, self).__init__(paths, optimizer_class=optimizer_class)
         self.galaxies = galaxies or []
         self.cosmology = cosmology
+        self.dataset_store = dataset_store
 
         self.is_hyper_phase = False
 
@@ -65,7 +71,11 @@ class PhaseDataset(abstract.AbstractPhase):
         result: AbstractPhase.Result
             A result object comprising the best fit model and other hyper_galaxies.
         """
-        dataset.save(self.paths.phase_output_path)
+        dataset_store.save_dataset(
+            dataset=dataset,
+            phase_output_path=self.paths.phase_output_path,
+            dataset_store=self.dataset_store,
+        )
         self.model = self.model.populate(results)
 
         analysis = self.make_analysis(
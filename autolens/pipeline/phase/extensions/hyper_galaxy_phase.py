@@ -187,6 +187,9 @@ class HyperGalaxyPhase(HyperPhase):
                 imaging.PhaseImaging, phase
             ).meta_imaging_fit.inversion_uses_border,
             preload_sparse_grids_of_planes=None,
+            preprocessing_cache=cast(
+                imaging.PhaseImaging, phase
+            ).meta_imaging_fit.preprocessing_cache,
         )
 
         hyper_result = copy.deepcopy(results.last)
@@ -3,6 +3,7 @@ import copy
 import autofit as af
 from autofit.tools.phase import Dataset
 from autolens.pipeline.phase import abstract
+from autolens.pipeline.phase.dataset import dataset_store
 
 
 class HyperPhase:
@@ -94,7 +95,11 @@ class HyperPhase:
             The result of the phase, with a hyper_galaxies result attached as an attribute with the hyper_name of this
             phase.
         """
-        dataset.save(self.paths.phase_output_path)
+        dataset_store.save_dataset(
+            dataset=dataset,
+            phase_output_path=self.paths.phase_output_path,
+            dataset_store=getattr(self.phase, "dataset_store", None),
+        )
 
         results = (
             copy.deepcopy(results) if results is not None else af.ResultsCollection()
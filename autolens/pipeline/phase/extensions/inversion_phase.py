@@ -9,6 +9,15 @@ from .hyper_phase import HyperPhase
 
 # noinspection PyAbstractClass
 class ModelFixingHyperPhase(HyperPhase):
+
+    # The maximum number of galaxy quantities and mappers memoized while the phase runs (see
+    # *plane.QuantityCache* and *ray_tracing.MapperCache*), where the quantities of the galaxies fixed to the
+    # previous phase's result are computed once and the mapper of every pixelization is reused when only the
+    # regularization changes.
+
+    quantity_cache_maxsize = 32
+    mapper_cache_maxsize = 8
+
     def __init__(
         self, phase: abstract.AbstractPhase, hyper_name: str, model_classes=tuple()
     ):
@@ -34,6 +43,9 @@ class ModelFixingHyperPhase(HyperPhase):
             "MultiNest", "extension_inversion_evidence_tolerance", float
         )
 
+        phase.quantity_cache_maxsize = self.quantity_cache_maxsize
+        phase.mapper_cache_maxsize = self.mapper_cache_maxsize
+
         return phase
 
     def make_model(self, instance):
@@ -43,6 +55,10 @@ class ModelFixingHyperPhase(HyperPhase):
         """
         Run the phase, overriding the optimizer's model instance with one created to
         only fit pixelization hyperparameters.
+
+        The quantities of the galaxies fixed to the previous phase's result and the mappers
+        of their pixelizations are memoized while the phase runs, such that they are
+        computed once instead of for every model.
         """
         phase = self.make_hyper_phase()
         phase.model = self.make_model(results.last.instance)
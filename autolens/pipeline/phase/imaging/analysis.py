@@ -1,42 +1,275 @@
+import heapq
+
+import numpy as np
+
 from autoarray.exc import InversionException, GridException
+from autoarray.util import fit_util
 from autofit.exc import FitException
+from autolens import exc
 from autolens.fit import fit
 from autolens.pipeline import visualizer
 from autolens.pipeline.phase.dataset import analysis as analysis_dataset
 
 
+class DelayedAcceptance:
+    def __init__(
+        self, masked_imaging, bin_up_factor, n_live_points, log_likelihood_margin
+    ):
+        """Screen the samples of a nested sampling non-linear search (e.g. MultiNest) with a two-stage delayed \
+        acceptance test, where every sample is first fitted to a coarse (e.g. binned up) masked imaging and only \
+        the samples which pass this first stage are fitted to the full resolution masked imaging.
+
+        A nested sampler accepts a sample if its figure of merit is above the lowest figure of merit of its live \
+        points, which is the threshold of the second stage (and is applied by the non-linear search to the full \
+        resolution fit). The live points are the *n_live_points* highest figures of merit fitted at full \
+        resolution, which are tracked in a heap of their full resolution and coarse figures of merit (see \
+        *add_figures_of_merit*).
+
+        The first stage rejects a sample if its coarse figure of merit is more than the log likelihood margin below \
+        the lowest coarse figure of merit of the live points, which is the live-point threshold on the coarse \
+        scale. A rejected sample raises a *DelayedAcceptanceException*, such that it is rejected by the non-linear \
+        search in the same way as a sample whose positions do not trace within the positions threshold. No sample \
+        is rejected until *n_live_points* samples have been fitted at full resolution.
+
+        The live points are tracked from the samples this analysis fits, which are a subset of those the non-linear \
+        search evaluated (e.g. if it resumed or samples raised a *FitException*), such that the threshold is never \
+        above that of the non-linear search. A sample is only wrongly rejected if its coarse figure of merit ranks \
+        it more than the margin below where its full resolution figure of merit does, thus the evidence (and \
+        errors) of a phase using delayed acceptance are approximate and should be checked with a larger margin.
+
+        The hyper images of the galaxies (e.g. for their hyper galaxy noise scaling or an adaptive pixelization) are \
+        binned up by the bin up factor for their coarse fit (see *coarse_hyper_image_from_hyper_image*).
+
+        Parameters
+        ----------
+        masked_imaging : MaskedImaging
+            The coarse masked imaging every sample is first fitted to.
+        bin_up_factor : int
+            The factor the coarse masked imaging is binned up by, which the hyper images are binned up by.
+        n_live_points : int
+            The number of live points of the nested sampler.
+        log_likelihood_margin : float
+            How far below the lowest coarse figure of merit of the live points a sample's coarse figure of merit \
+            must be for it to be rejected. A larger margin rejects fewer samples.
+        """
+        self.masked_imaging = masked_imaging
+        self.bin_up_factor = bin_up_factor
+        self.n_live_points = n_live_points
+        self.log_likelihood_margin = log_likelihood_margin
+
+        self.live_figures_of_merit = []
+        self.coarse_hyper_images = {}
+
+        self.evaluations = 0
+        self.rejections = 0
+
+    @property
+    def fraction_of_evaluations_saved(self):
+        """The fraction of samples which were rejected without being fitted at full resolution."""
+        if self.evaluations == 0:
+            return 0.0
+        return self.rejections / self.evaluations
+
+    @property
+    def lowest_live_figure_of_merit(self):
+        """The lowest full resolution figure of merit of the live points, which is the threshold a sample must be \
+        above to be accepted by the non-linear search (and is -np.inf until there are *n_live_points*)."""
+        if len(self.live_figures_of_merit) < self.n_live_points:
+            return -np.inf
+        return self.live_figures_of_merit[0][0]
+
+    @property
+    def lowest_live_coarse_figure_of_merit(self):
+        """The lowest coarse figure of merit of the live points, which is the first stage threshold (and is -np.inf \
+        until there are *n_live_points*)."""
+        if len(self.live_figures_of_merit) < self.n_live_points:
+            return -np.inf
+        return min(
+            coarse_figure_of_merit
+            for _, coarse_figure_of_merit in self.live_figures_of_merit
+        )
+
+    def check_coarse_figure_of_merit(self, coarse_figure_of_merit):
+        """The first stage of the delayed acceptance test, which raises a *DelayedAcceptanceException* if a \
+        sample's coarse figure of merit is more than the log likelihood margin below the lowest coarse figure of \
+        merit of the live points, such that it is rejected without being fitted at full resolution."""
+        self.evaluations += 1
+
+        if (
+            coarse_figure_of_merit
+            < self.lowest_live_coarse_figure_of_merit - self.log_likelihood_margin
+        ):
+            self.rejections += 1
+            raise exc.DelayedAcceptanceException
+
+    def add_figures_of_merit(self, figure_of_merit, coarse_figure_of_merit):
+        """Add the full resolution and coarse figures of merit of a sample which passed the first stage to the live \
+        points, where (as in the nested sampler) it replaces the live point with the lowest figure of merit if \
+        there are *n_live_points* and is discarded if its figure of merit is below all of theirs."""
+        if len(self.live_figures_of_merit) < self.n_live_points:
+            heapq.heappush(
+                self.live_figures_of_merit, (figure_of_merit, coarse_figure_of_merit)
+            )
+        else:
+            heapq.heappushpop(
+                self.live_figures_of_merit, (figure_of_merit, coarse_figure_of_merit)
+            )
+
+    def coarse_hyper_image_from_hyper_image(self, hyper_image):
+        """The hyper image binned up by the bin up factor, which is computed once for every hyper image (the hyper \
+        images of an analysis are the same objects for every instance)."""
+        if hyper_image is None:
+            return None
+
+        if id(hyper_image) not in self.coarse_hyper_images:
+            self.coarse_hyper_images[id(hyper_image)] = (
+                hyper_image,
+                hyper_image.binned_from_bin_up_factor(
+                    bin_up_factor=self.bin_up_factor, method="mean"
+                ),
+            )
+
+        return self.coarse_hyper_images[id(hyper_image)][1]
+
+    def coarse_figure_of_merit_from_tracer(
+        self, tracer, hyper_image_sky, hyper_background_noise
+    ):
+        """The figure of merit of a tracer fitted to the coarse masked imaging, where the hyper images of its \
+        galaxies are replaced by their binned up hyper images for the fit and restored afterwards."""
+
+        galaxies = [
+            galaxy
+            for galaxy in tracer.galaxies
+            if galaxy.hyper_galaxy_image is not None
+            or galaxy.hyper_model_image is not None
+        ]
+
+        hyper_images_of_galaxies = [
+            (galaxy.hyper_model_image, galaxy.hyper_galaxy_image) for galaxy in galaxies
+        ]
+
+        try:
+
+            for galaxy, (hyper_model_image, hyper_galaxy_image) in zip(
+                galaxies, hyper_images_of_galaxies
+            ):
+                galaxy.hyper_model_image = self.coarse_hyper_image_from_hyper_image(
+                    hyper_image=hyper_model_image
+                )
+                galaxy.hyper_galaxy_image = self.coarse_hyper_image_from_hyper_image(
+                    hyper_image=hyper_galaxy_image
+                )
+
+            return self.coarse_figure_of_merit_from_tracer_with_coarse_hyper_images(
+                tracer=tracer,
+                hyper_image_sky=hyper_image_sky,
+                hyper_background_noise=hyper_background_noise,
+            )
+
+        finally:
+
+            for galaxy, (hyper_model_image, hyper_galaxy_image) in zip(
+                galaxies, hyper_images_of_galaxies
+            ):
+                galaxy.hyper_model_image = hyper_model_image
+                galaxy.hyper_galaxy_image = hyper_galaxy_image
+
+    def coarse_figure_of_merit_from_tracer_with_coarse_hyper_images(
+        self, tracer, hyper_image_sky, hyper_background_noise
+    ):
+        """The figure of merit of a tracer fitted to the coarse masked imaging, which is computed from the blurred \
+        profile image and inversion of the tracer without creating an *ImagingFit* or any of its maps.
+
+        For a tracer with a pixelization this is the likelihood including the regularization term, such that the \
+        log determinants of the evidence (which do not depend on how well the model fits the data) are not \
+        computed."""
+        masked_imaging = self.masked_imaging
+
+        image = fit.hyper_image_from_image_and_hyper_image_sky(
+            image=masked_imaging.image, hyper_image_sky=hyper_image_sky
+        )
+
+        noise_map = fit.hyper_noise_map_from_noise_map_tracer_and_hyper_backkground_noise(
+            noise_map=masked_imaging.noise_map,
+            tracer=tracer,
+            hyper_background_noise=hyper_background_noise,
+        )
+
+        model_image = tracer.blurred_profile_image_from_grid_and_convolver(
+            grid=masked_imaging.grid,
+            convolver=masked_imaging.convolver,
+            blurring_grid=masked_imaging.blurring_grid,
+        )
+
+        if not tracer.has_pixelization:
+
+            chi_squared, noise_normalization = fit.chi_squared_and_noise_normalization_from_data_noise_map_and_model_data(
+                data=image, noise_map=noise_map, model_data=model_image
+            )
+
+            return fit_util.likelihood_from_chi_squared_and_noise_normalization(
+                chi_squared=chi_squared, noise_normalization=noise_normalization
+            )
+
+        inversion = tracer.inversion_imaging_from_grid_and_data(
+            grid=masked_imaging.grid,
+            image=image - model_image,
+            noise_map=noise_map,
+            convolver=masked_imaging.convolver,
+            inversion_uses_border=masked_imaging.inversion_uses_border,
+            preload_sparse_grids_of_planes=masked_imaging.preload_sparse_grids_of_planes,
+        )
+
+        chi_squared, noise_normalization = fit.chi_squared_and_noise_normalization_from_data_noise_map_and_model_data(
+            data=image,
+            noise_map=noise_map,
+            model_data=model_image + inversion.mapped_reconstructed_image,
+        )
+
+        return fit_util.likelihood_with_regularization_from_inversion_terms(
+            chi_squared=chi_squared,
+            regularization_term=inversion.regularization_term,
+            noise_normalization=noise_normalization,
+        )
+
+
 class Analysis(analysis_dataset.Analysis):
-    def __init__(self, masked_imaging, cosmology, image_path=None, results=None):
+    def __init__(
+        self,
+        masked_imaging,
+        cosmology,
+        image_path=None,
+        results=None,
+        delayed_acceptance=None,
+        model=None,
+        likelihood_cache_maxsize=None,
+        threads=1,
+        quantity_cache_maxsize=0,
+        mapper_cache_maxsize=0,
+    ):
 
-        super(Analysis, self).__init__(cosmology=cosmology, results=results)
+        super(Analysis, self).__init__(
+            cosmology=cosmology,
+            results=results,
+            model=model,
+            likelihood_cache_maxsize=likelihood_cache_maxsize,
+            threads=threads,
+            quantity_cache_maxsize=quantity_cache_maxsize,
+            mapper_cache_maxsize=mapper_cache_maxsize,
+        )
 
         self.visualizer = visualizer.PhaseImagingVisualizer(
             masked_dataset=masked_imaging, image_path=image_path, results=results
         )
 
         self.masked_dataset = masked_imaging
+        self.delayed_acceptance = delayed_acceptance
 
     @property
     def masked_imaging(self):
         return self.masked_dataset
 
-    def fit(self, instance):
-        """
-        Determine the fit of a lens galaxy and source galaxy to the masked_imaging in this lens.
-
-        Parameters
-        ----------
-        instance
-            A model instance with attributes
-
-        Returns
-        -------
-        fit : Fit
-            A fractional value indicating how well this model fit and the model masked_imaging itself
-        """
-
-        self.associate_hyper_images(instance=instance)
-        tracer = self.tracer_for_instance(instance=instance)
+    def figure_of_merit_for_instance_and_tracer(self, instance, tracer):
 
         self.masked_dataset.check_positions_trace_within_threshold_via_tracer(
             tracer=tracer
@@ -46,23 +279,71 @@ class Analysis(analysis_dataset.Analysis):
             tracer=tracer
         )
 
-        hyper_image_sky = self.hyper_image_sky_for_instance(instance=instance)
+        try:
 
-        hyper_background_noise = self.hyper_background_noise_for_instance(
-            instance=instance
-        )
+            if self.delayed_acceptance is None:
+                return self.full_figure_of_merit_for_instance_and_tracer(
+                    instance=instance, tracer=tracer
+                )
 
-        try:
-            fit = self.masked_imaging_fit_for_tracer(
-                tracer=tracer,
-                hyper_image_sky=hyper_image_sky,
-                hyper_background_noise=hyper_background_noise,
+            return self.delayed_acceptance_figure_of_merit_for_instance_and_tracer(
+                instance=instance, tracer=tracer
             )
 
-            return fit.figure_of_merit
-        except InversionException or GridException as e:
+        except (InversionException, GridException) as e:
             raise FitException from e
 
+    def delayed_acceptance_figure_of_merit_for_instance_and_tracer(
+        self, instance, tracer
+    ):
+        """The figure of merit of an instance screened by the two stages of the delayed acceptance test, where it is \
+        first fitted to the coarse masked imaging and (if it is not rejected) then to the full resolution masked \
+        imaging (see *DelayedAcceptance*)."""
+
+        coarse_figure_of_merit = self.delayed_acceptance.coarse_figure_of_merit_from_tracer(
+            tracer=tracer,
+            hyper_image_sky=self.hyper_image_sky_for_instance(instance=instance),
+            hyper_background_noise=self.hyper_background_noise_for_instance(
+                instance=instance
+            ),
+        )
+
+        self.delayed_acceptance.check_coarse_figure_of_merit(
+            coarse_figure_of_merit=coarse_figure_of_merit
+        )
+
+        figure_of_merit = self.full_figure_of_merit_for_instance_and_tracer(
+            instance=instance, tracer=tracer
+        )
+
+        self.delayed_acceptance.add_figures_of_merit(
+            figure_of_merit=figure_of_merit,
+            coarse_figure_of_merit=coarse_figure_of_merit,
+        )
+
+        return figure_of_merit
+
+    def full_figure_of_merit_for_instance_and_tracer(self, instance, tracer):
+        """The figure of merit of an instance fitted to the full resolution masked imaging, whose fit is stored in \
+        the likelihood cache (if there is one) if it is the best fit so far, for its visualization."""
+
+        fit = self.fit_for_instance_and_tracer(instance=instance, tracer=tracer)
+
+        if self.likelihood_cache is not None:
+            self.likelihood_cache.add_fit(instance=instance, fit=fit)
+
+        return fit.figure_of_merit
+
+    def fit_for_instance_and_tracer(self, instance, tracer):
+
+        return self.masked_imaging_fit_for_tracer(
+            tracer=tracer,
+            hyper_image_sky=self.hyper_image_sky_for_instance(instance=instance),
+            hyper_background_noise=self.hyper_background_noise_for_instance(
+                instance=instance
+            ),
+        )
+
     def masked_imaging_fit_for_tracer(
         self, tracer, hyper_image_sky, hyper_background_noise
     ):
@@ -76,17 +357,8 @@ class Analysis(analysis_dataset.Analysis):
 
     def visualize(self, instance, during_analysis):
         instance = self.associate_hyper_images(instance=instance)
-        tracer = self.tracer_for_instance(instance=instance)
-        hyper_image_sky = self.hyper_image_sky_for_instance(instance=instance)
-        hyper_background_noise = self.hyper_background_noise_for_instance(
-            instance=instance
-        )
-
-        fit = self.masked_imaging_fit_for_tracer(
-            tracer=tracer,
-            hyper_image_sky=hyper_image_sky,
-            hyper_background_noise=hyper_background_noise,
-        )
+        fit = self.fit_for_instance(instance=instance)
+        tracer = fit.tracer
 
         if tracer.has_mass_profile:
 
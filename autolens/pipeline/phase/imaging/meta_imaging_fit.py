@@ -15,6 +15,7 @@ class MetaImagingFit(dataset.MetaDatasetFit):
         inversion_pixel_limit=None,
         psf_shape_2d=None,
         bin_up_factor=None,
+        preprocessing_cache=None,
     ):
         super().__init__(
             model=model,
@@ -28,6 +29,7 @@ class MetaImagingFit(dataset.MetaDatasetFit):
         )
         self.psf_shape_2d = psf_shape_2d
         self.bin_up_factor = bin_up_factor
+        self.preprocessing_cache = preprocessing_cache
 
     def masked_dataset_from(self, dataset, mask, positions, results, modified_image):
 
@@ -49,6 +51,7 @@ class MetaImagingFit(dataset.MetaDatasetFit):
             inversion_pixel_limit=self.inversion_pixel_limit,
             inversion_uses_border=self.inversion_uses_border,
             preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
+            preprocessing_cache=self.preprocessing_cache,
         )
 
         if self.signal_to_noise_limit is not None:
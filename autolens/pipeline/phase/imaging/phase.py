@@ -1,10 +1,11 @@
 from astropy import cosmology as cosmo
 
 import autofit as af
+from autolens import exc
 from autolens.pipeline import phase_tagging
 from autolens.pipeline.phase import dataset
 from autolens.pipeline.phase import extensions
-from autolens.pipeline.phase.imaging.analysis import Analysis
+from autolens.pipeline.phase.imaging.analysis import Analysis, DelayedAcceptance
 from autolens.pipeline.phase.imaging.meta_imaging_fit import MetaImagingFit
 from autolens.pipeline.phase.imaging.result import Result
 
@@ -35,6 +36,14 @@ class PhaseImaging(dataset.PhaseDataset):
         pixel_scale_interpolation_grid=None,
         inversion_uses_border=True,
         inversion_pixel_limit=None,
+        delayed_acceptance_bin_up_factor=None,
+        delayed_acceptance_log_likelihood_margin=50.0,
+        likelihood_cache_maxsize=None,
+        threads=1,
+        quantity_cache_maxsize=0,
+        mapper_cache_maxsize=0,
+        preprocessing_cache=None,
+        dataset_store=None,
     ):
 
         """
@@ -48,6 +57,36 @@ class PhaseImaging(dataset.PhaseDataset):
             The class of a non_linear optimizer
         sub_size: int
             The side length of the subgrid
+        delayed_acceptance_bin_up_factor : int or None
+            If input, every model is first fitted to the masked imaging binned up by this factor, and models whose \
+            binned figure of merit is far below those of the optimizer's live points are rejected without being \
+            fitted at full resolution (see *DelayedAcceptance*). The optimizer must be a nested sampler (e.g. \
+            MultiNest), and the evidence of the phase is approximate.
+        delayed_acceptance_log_likelihood_margin : float
+            How far below the lowest binned figure of merit of the live points a model's binned figure of merit must \
+            be for it to be rejected.
+        likelihood_cache_maxsize : int or None
+            If input, the figures of merit of up to this many models are cached by the analysis, such that a model \
+            the optimizer fits again is not refitted (see *LikelihoodCache*).
+        threads : int
+            The number of threads the galaxies of every plane are evaluated on in parallel, which speeds up \
+            models with many galaxies in a plane (e.g. line-of-sight halos).
+        quantity_cache_maxsize : int
+            The maximum number of galaxy profile images, convergences, potentials and deflection angles memoized \
+            by the analysis, such that the quantities of galaxies whose parameters are fixed are computed once \
+            (see *plane.QuantityCache*). The cache is switched off for 0.
+        mapper_cache_maxsize : int
+            The maximum number of inversion mappers memoized by the analysis, such that a model which changes only \
+            the regularization of a pixelization reuses the mapper of a previous model (see \
+            *ray_tracing.MapperCache*). The cache is switched off for 0.
+        preprocessing_cache : masked_dataset.PreprocessingCache or None
+            If input, the grids, blurring grid, PSF and convolver of the masked imaging are reused from (or stored \
+            in) this cache, which can be input to every phase of a pipeline fitted to the same mask and PSF such \
+            that they are computed once (see *masked_dataset.PreprocessingCache*).
+        dataset_store : dataset_store.DatasetStore or None
+            If input, the dataset fitted by the phase is written once to this store and its output path references \
+            it, instead of the phase pickling the full dataset (see *dataset_store.DatasetStore*). The store can be \
+            input to every phase of a pipeline, such that a dataset is written once for the pipeline.
         """
 
         phase_tag = phase_tagging.phase_tag_from_phase_settings(
@@ -65,6 +104,7 @@ class PhaseImaging(dataset.PhaseDataset):
             galaxies=galaxies,
             optimizer_class=optimizer_class,
             cosmology=cosmology,
+            dataset_store=dataset_store,
         )
 
         self.hyper_image_sky = hyper_image_sky
@@ -72,6 +112,15 @@ class PhaseImaging(dataset.PhaseDataset):
 
         self.is_hyper_phase = False
 
+        self.delayed_acceptance_bin_up_factor = delayed_acceptance_bin_up_factor
+        self.delayed_acceptance_log_likelihood_margin = (
+            delayed_acceptance_log_likelihood_margin
+        )
+        self.likelihood_cache_maxsize = likelihood_cache_maxsize
+        self.threads = threads
+        self.quantity_cache_maxsize = quantity_cache_maxsize
+        self.mapper_cache_maxsize = mapper_cache_maxsize
+
         self.meta_imaging_fit = MetaImagingFit(
             model=self.model,
             bin_up_factor=bin_up_factor,
@@ -82,6 +131,7 @@ class PhaseImaging(dataset.PhaseDataset):
             pixel_scale_interpolation_grid=pixel_scale_interpolation_grid,
             inversion_uses_border=inversion_uses_border,
             inversion_pixel_limit=inversion_pixel_limit,
+            preprocessing_cache=preprocessing_cache,
         )
 
     # noinspection PyMethodMayBeStatic,PyUnusedLocal
@@ -134,6 +184,15 @@ class PhaseImaging(dataset.PhaseDataset):
             modified_image=modified_image,
         )
 
+        fixed_profiles_tracer = self.meta_imaging_fit.fixed_profiles_tracer_from_cosmology(
+            cosmology=self.cosmology
+        )
+
+        if fixed_profiles_tracer is not None:
+            masked_imaging.preload_profile_quantities_from_tracer(
+                tracer=fixed_profiles_tracer
+            )
+
         self.output_phase_info()
 
         analysis = self.Analysis(
@@ -141,10 +200,85 @@ class PhaseImaging(dataset.PhaseDataset):
             cosmology=self.cosmology,
             image_path=self.optimizer.paths.image_path,
             results=results,
+            delayed_acceptance=self.delayed_acceptance_from_masked_imaging(
+                masked_imaging=masked_imaging
+            ),
+            model=self.model,
+            likelihood_cache_maxsize=self.likelihood_cache_maxsize,
+            threads=self.threads,
+            quantity_cache_maxsize=self.quantity_cache_maxsize,
+            mapper_cache_maxsize=self.mapper_cache_maxsize,
         )
 
         return analysis
 
+    def delayed_acceptance_from_masked_imaging(self, masked_imaging):
+        """The *DelayedAcceptance* screening the models of the phase by their fit to the binned up masked imaging, \
+        which is *None* if no bin up factor is input.
+
+        Raises
+        ------
+        exc.PhaseException
+            If a bin up factor is input and the optimizer is not a nested sampler (i.e. it has no live points).
+        """
+
+        if self.delayed_acceptance_bin_up_factor is None:
+            return None
+
+        if not hasattr(self.optimizer, "n_live_points"):
+            raise exc.PhaseException(
+                "Delayed acceptance (delayed_acceptance_bin_up_factor) can only be used with a nested sampling "
+                "optimizer (e.g. MultiNest)"
+            )
+
+        return DelayedAcceptance(
+            masked_imaging=masked_imaging.binned_from_bin_up_factor(
+                bin_up_factor=self.delayed_acceptance_bin_up_factor
+            ),
+            bin_up_factor=self.delayed_acceptance_bin_up_factor,
+            n_live_points=self.optimizer.n_live_points,
+            log_likelihood_margin=self.delayed_acceptance_log_likelihood_margin,
+        )
+
+    def make_result(self, result, analysis):
+
+        delayed_acceptance = getattr(analysis, "delayed_acceptance", None)
+
+        if delayed_acceptance is not None:
+            self.output_delayed_acceptance_info(delayed_acceptance=delayed_acceptance)
+
+        return super().make_result(result=result, analysis=analysis)
+
+    def output_delayed_acceptance_info(self, delayed_acceptance):
+
+        file_delayed_acceptance_info = "{}/{}".format(
+            self.optimizer.paths.phase_output_path, "delayed_acceptance.info"
+        )
+
+        with open(file_delayed_acceptance_info, "w") as delayed_acceptance_info:
+            delayed_acceptance_info.write(
+                "Bin up factor = {} \n".format(self.delayed_acceptance_bin_up_factor)
+            )
+            delayed_acceptance_info.write(
+                "Log likelihood margin = {} \n".format(
+                    delayed_acceptance.log_likelihood_margin
+                )
+            )
+            delayed_acceptance_info.write(
+                "Evaluations = {} \n".format(delayed_acceptance.evaluations)
+            )
+            delayed_acceptance_info.write(
+                "Rejections = {} \n".format(delayed_acceptance.rejections)
+            )
+            delayed_acceptance_info.write(
+                "Fraction of evaluations saved = {} \n".format(
+                    delayed_acceptance.fraction_of_evaluations_saved
+                )
+            )
+            delayed_acceptance_info.write(
+                "The evidence of a phase using delayed acceptance is approximate \n"
+            )
+
     def output_phase_info(self):
 
         file_phase_info = "{}/{}".format(
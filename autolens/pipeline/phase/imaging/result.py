@@ -7,23 +7,6 @@ from autolens.pipeline.phase import dataset
 
 
 class Result(dataset.Result):
-    @property
-    def most_likely_fit(self):
-
-        hyper_image_sky = self.analysis.hyper_image_sky_for_instance(
-            instance=self.instance
-        )
-
-        hyper_background_noise = self.analysis.hyper_background_noise_for_instance(
-            instance=self.instance
-        )
-
-        return self.analysis.masked_imaging_fit_for_tracer(
-            tracer=self.most_likely_tracer,
-            hyper_image_sky=hyper_image_sky,
-            hyper_background_noise=hyper_background_noise,
-        )
-
     @property
     def unmasked_model_image(self):
         return self.most_likely_fit.unmasked_blurred_profile_image
@@ -8,9 +8,28 @@ from autolens.pipeline.phase.dataset import analysis as analysis_data
 
 
 class Analysis(analysis_data.Analysis):
-    def __init__(self, masked_interferometer, cosmology, image_path=None, results=None):
-
-        super(Analysis, self).__init__(cosmology=cosmology, results=results)
+    def __init__(
+        self,
+        masked_interferometer,
+        cosmology,
+        image_path=None,
+        results=None,
+        model=None,
+        likelihood_cache_maxsize=None,
+        threads=1,
+        quantity_cache_maxsize=0,
+        mapper_cache_maxsize=0,
+    ):
+
+        super(Analysis, self).__init__(
+            cosmology=cosmology,
+            results=results,
+            model=model,
+            likelihood_cache_maxsize=likelihood_cache_maxsize,
+            threads=threads,
+            quantity_cache_maxsize=quantity_cache_maxsize,
+            mapper_cache_maxsize=mapper_cache_maxsize,
+        )
 
         self.visualizer = visualizer.PhaseInterferometerVisualizer(
             masked_dataset=masked_interferometer, image_path=image_path
@@ -30,23 +49,7 @@ class Analysis(analysis_data.Analysis):
     def masked_interferometer(self):
         return self.masked_dataset
 
-    def fit(self, instance):
-        """
-        Determine the fit of a lens galaxy and source galaxy to the masked_interferometer in this lens.
-
-        Parameters
-        ----------
-        instance
-            A model instance with attributes
-
-        Returns
-        -------
-        fit : Fit
-            A fractional value indicating how well this model fit and the model masked_interferometer itself
-        """
-
-        self.associate_hyper_images(instance=instance)
-        tracer = self.tracer_for_instance(instance=instance)
+    def figure_of_merit_for_instance_and_tracer(self, instance, tracer):
 
         self.masked_dataset.check_positions_trace_within_threshold_via_tracer(
             tracer=tracer
@@ -55,14 +58,11 @@ class Analysis(analysis_data.Analysis):
             tracer=tracer
         )
 
-        hyper_background_noise = self.hyper_background_noise_for_instance(
-            instance=instance
-        )
-
         try:
-            fit = self.masked_interferometer_fit_for_tracer(
-                tracer=tracer, hyper_background_noise=hyper_background_noise
-            )
+            fit = self.fit_for_instance_and_tracer(instance=instance, tracer=tracer)
+
+            if self.likelihood_cache is not None:
+                self.likelihood_cache.add_fit(instance=instance, fit=fit)
 
             return fit.figure_of_merit
         except InversionException as e:
@@ -106,6 +106,15 @@ class Analysis(analysis_data.Analysis):
 
         return instance
 
+    def fit_for_instance_and_tracer(self, instance, tracer):
+
+        return self.masked_interferometer_fit_for_tracer(
+            tracer=tracer,
+            hyper_background_noise=self.hyper_background_noise_for_instance(
+                instance=instance
+            ),
+        )
+
     def masked_interferometer_fit_for_tracer(self, tracer, hyper_background_noise):
 
         return fit.InterferometerFit(
@@ -116,14 +125,8 @@ class Analysis(analysis_data.Analysis):
 
     def visualize(self, instance, during_analysis):
         instance = self.associate_hyper_visibilities(instance=instance)
-        tracer = self.tracer_for_instance(instance=instance)
-        hyper_background_noise = self.hyper_background_noise_for_instance(
-            instance=instance
-        )
-
-        fit = self.masked_interferometer_fit_for_tracer(
-            tracer=tracer, hyper_background_noise=hyper_background_noise
-        )
+        fit = self.fit_for_instance(instance=instance)
+        tracer = fit.tracer
 
         visualizer = self.visualizer.new_visualizer_with_preloaded_critical_curves_and_caustics(
             preloaded_critical_curves=tracer.critical_curves,
@@ -34,6 +34,11 @@ class PhaseInterferometer(dataset.PhaseDataset):
         pixel_scale_interpolation_grid=None,
         inversion_uses_border=True,
         inversion_pixel_limit=None,
+        likelihood_cache_maxsize=None,
+        threads=1,
+        quantity_cache_maxsize=0,
+        mapper_cache_maxsize=0,
+        dataset_store=None,
     ):
 
         """
@@ -47,6 +52,24 @@ class PhaseInterferometer(dataset.PhaseDataset):
             The class of a non_linear optimizer
         sub_size: int
             The side length of the subgrid
+        likelihood_cache_maxsize : int or None
+            If input, the figures of merit of up to this many models are cached by the analysis, such that a model \
+            the optimizer fits again is not refitted (see *LikelihoodCache*).
+        threads : int
+            The number of threads the galaxies of every plane are evaluated on in parallel, which speeds up \
+            models with many galaxies in a plane (e.g. line-of-sight halos).
+        quantity_cache_maxsize : int
+            The maximum number of galaxy profile images, convergences, potentials and deflection angles memoized \
+            by the analysis, such that the quantities of galaxies whose parameters are fixed are computed once \
+            (see *plane.QuantityCache*). The cache is switched off for 0.
+        mapper_cache_maxsize : int
+            The maximum number of inversion mappers memoized by the analysis, such that a model which changes only \
+            the regularization of a pixelization reuses the mapper of a previous model (see \
+            *ray_tracing.MapperCache*). The cache is switched off for 0.
+        dataset_store : dataset_store.DatasetStore or None
+            If input, the dataset fitted by the phase is written once to this store and its output path references \
+            it, instead of the phase pickling the full dataset (see *dataset_store.DatasetStore*). The store can be \
+            input to every phase of a pipeline, such that a dataset is written once for the pipeline.
         """
 
         paths.phase_tag = phase_tagging.phase_tag_from_phase_settings(
@@ -63,12 +86,18 @@ class PhaseInterferometer(dataset.PhaseDataset):
             galaxies=galaxies,
             optimizer_class=optimizer_class,
             cosmology=cosmology,
+            dataset_store=dataset_store,
         )
 
         self.hyper_background_noise = hyper_background_noise
 
         self.is_hyper_phase = False
 
+        self.likelihood_cache_maxsize = likelihood_cache_maxsize
+        self.threads = threads
+        self.quantity_cache_maxsize = quantity_cache_maxsize
+        self.mapper_cache_maxsize = mapper_cache_maxsize
+
         self.meta_interferometer_fit = MetaInterferometerFit(
             model=self.model,
             sub_size=sub_size,
@@ -139,6 +168,11 @@ class PhaseInterferometer(dataset.PhaseDataset):
             cosmology=self.cosmology,
             image_path=self.optimizer.paths.image_path,
             results=results,
+            model=self.model,
+            likelihood_cache_maxsize=self.likelihood_cache_maxsize,
+            threads=self.threads,
+            quantity_cache_maxsize=self.quantity_cache_maxsize,
+            mapper_cache_maxsize=self.mapper_cache_maxsize,
         )
 
         return analysis
@@ -7,18 +7,6 @@ from autolens.pipeline.phase import dataset
 
 
 class Result(dataset.Result):
-    @property
-    def most_likely_fit(self):
-
-        hyper_background_noise = self.analysis.hyper_background_noise_for_instance(
-            instance=self.instance
-        )
-
-        return self.analysis.masked_interferometer_fit_for_tracer(
-            tracer=self.most_likely_tracer,
-            hyper_background_noise=hyper_background_noise,
-        )
-
     @property
     def real_space_mask(self):
         return self.most_likely_fit.masked_interferometer.real_space_mask
@@ -1,4 +1,6 @@
 from autoarray.structures import grids
+from autoastro.util import cosmology_util
+from autolens import decorator_util
 from autolens import exc
 from autolens.lens import plane as pl
 
@@ -37,19 +39,7 @@ def ordered_plane_redshifts_from_galaxies(galaxies):
     galaxies : [Galaxy]
         The list of galaxies in the ray-tracing calculation.
     """
-    ordered_galaxies = sorted(
-        galaxies, key=lambda galaxy: galaxy.redshift, reverse=False
-    )
-
-    # Ideally we'd extract the planes_red_Shfit order from the list above. However, I dont know how to extract it
-    # Using a list of class attributes so make a list of redshifts for now.
-
-    galaxy_redshifts = list(map(lambda galaxy: galaxy.redshift, ordered_galaxies))
-    return [
-        redshift
-        for i, redshift in enumerate(galaxy_redshifts)
-        if redshift not in galaxy_redshifts[:i]
-    ]
+    return sorted(set([galaxy.redshift for galaxy in galaxies]))
 
 
 def ordered_plane_redshifts_from_lens_source_plane_redshifts_and_slice_sizes(
@@ -123,10 +113,477 @@ def galaxies_in_redshift_ordered_planes_from_galaxies(galaxies, plane_redshifts)
 
     galaxies_in_redshift_ordered_planes = [[] for i in range(len(plane_redshifts))]
 
-    for galaxy in galaxies:
+    for galaxy, plane_index in zip(
+        galaxies,
+        plane_indexes_of_galaxies_from_galaxies(
+            galaxies=galaxies, plane_redshifts=plane_redshifts
+        ),
+    ):
+        galaxies_in_redshift_ordered_planes[plane_index].append(galaxy)
 
-        index = (np.abs(np.asarray(plane_redshifts) - galaxy.redshift)).argmin()
+    return galaxies_in_redshift_ordered_planes
 
-        galaxies_in_redshift_ordered_planes[index].append(galaxy)
 
-    return galaxies_in_redshift_ordered_planes
+def plane_indexes_of_galaxies_from_galaxies(galaxies, plane_redshifts):
+    """Given a list of galaxies (with redshifts) and the redshifts of a set of planes, return the index of the plane \
+    closest in redshift to every galaxy.
+
+    Parameters
+    -----------
+    galaxies : [Galaxy]
+        The list of galaxies in the ray-tracing calculation.
+    plane_redshifts : [float]
+        The redshifts of the planes, in ascending redshift order.
+    """
+
+    if len(galaxies) == 0:
+        return []
+
+    galaxy_redshifts = np.asarray([galaxy.redshift for galaxy in galaxies])
+
+    return (
+        np.abs(galaxy_redshifts[:, None] - np.asarray(plane_redshifts)[None, :])
+        .argmin(axis=1)
+        .tolist()
+    )
+
+
+def scaling_factors_of_planes_from_plane_redshifts_and_cosmology(
+    plane_redshifts, cosmology
+):
+    """Given the redshifts of every plane in a strong lens system and a cosmology, return a 2D matrix of the \
+    multi-plane deflection-angle scaling factors between every pair of planes, where entry [i, j] gives the factor \
+    by which the deflection angles of plane i are rescaled when ray-tracing to plane j (for i < j). All other \
+    entries are zeros.
+
+    The ray-tracing is performed to the final plane, whose redshift is therefore used as the final redshift of \
+    every scaling factor.
+
+    The matrix is read-only, such that it can be computed once and shared by every tracer with the same plane \
+    redshifts and cosmology (e.g. by the *TracerPlan* of a non-linear search, see \
+    *TracerPlan.scaling_factors_of_planes*).
+
+    Parameters
+    -----------
+    plane_redshifts : [float]
+        The redshifts of the planes of the strong lens system, in ascending redshift order.
+    cosmology : astropy.cosmology
+        The cosmology of the ray-tracing calculation.
+    """
+
+    total_planes = len(plane_redshifts)
+
+    scaling_factors = np.zeros(shape=(total_planes, total_planes))
+
+    for plane_index in range(1, total_planes):
+        for previous_plane_index in range(plane_index):
+            scaling_factors[
+                previous_plane_index, plane_index
+            ] = cosmology_util.scaling_factor_between_redshifts_from_redshifts_and_cosmology(
+                redshift_0=plane_redshifts[previous_plane_index],
+                redshift_1=plane_redshifts[plane_index],
+                redshift_final=plane_redshifts[-1],
+                cosmology=cosmology,
+            )
+
+    scaling_factors.setflags(write=False)
+
+    return scaling_factors
+
+
+def scaling_factors_of_planes_to_redshifts_from_plane_redshifts_and_cosmology(
+    plane_redshifts, redshifts, cosmology
+):
+    """Given the redshifts of every plane in a strong lens system, a set of redshifts and a cosmology, return a 2D \
+    matrix of the multi-plane deflection-angle scaling factors by which the deflection angles of every plane are \
+    rescaled when ray-tracing to every redshift, where entry [i, j] is the scaling factor of plane j when \
+    ray-tracing to redshift i. Planes at a redshift equal to or above the redshift have a scaling factor of zero.
+
+    The deflection angles of every plane are computed for ray-tracing to the final plane, whose redshift is \
+    therefore used as the final redshift of every scaling factor (see \
+    *scaling_factors_of_planes_from_plane_redshifts_and_cosmology*).
+
+    Parameters
+    -----------
+    plane_redshifts : [float]
+        The redshifts of the planes of the strong lens system, in ascending redshift order.
+    redshifts : [float]
+        The redshifts to which the scaling factors of every plane are computed.
+    cosmology : astropy.cosmology
+        The cosmology of the ray-tracing calculation.
+    """
+
+    scaling_factors = np.zeros(shape=(len(redshifts), len(plane_redshifts)))
+
+    for redshift_index, redshift in enumerate(redshifts):
+        for plane_index, plane_redshift in enumerate(plane_redshifts):
+            if plane_redshift < redshift:
+                scaling_factors[
+                    redshift_index, plane_index
+                ] = cosmology_util.scaling_factor_between_redshifts_from_redshifts_and_cosmology(
+                    redshift_0=plane_redshift,
+                    redshift_1=redshift,
+                    redshift_final=plane_redshifts[-1],
+                    cosmology=cosmology,
+                )
+
+    return scaling_factors
+
+
+def multi_plane_recursion_factors_from_scaling_factors(scaling_factors):
+    """Given the matrix of multi-plane scaling factors between every pair of planes (see \
+    *scaling_factors_of_planes_from_plane_redshifts_and_cosmology*), return the factors used to ray-trace a grid \
+    recursively through the planes.
+
+    Using the recursive multi-plane lens equation, the traced grid of plane j is computed from the traced grids and \
+    deflections of only the two planes before it:
+
+    grid_j = (1 - factor_j) * grid_(j-2) + factor_j * grid_(j-1) - scaling_factor_(j-1, j) * deflections_(j-1)
+
+    where factor_j = scaling_factor_(j-2, j) / scaling_factor_(j-2, j-1). For the first plane after the image-plane \
+    there is no plane j-2 and the factor is 1.0. The factors for the image-plane is unused and set to 1.0.
+
+    Parameters
+    -----------
+    scaling_factors : ndarray
+        The 2D matrix of scaling factors between every pair of planes.
+    """
+
+    total_planes = scaling_factors.shape[0]
+
+    recursion_factors = np.ones(shape=total_planes)
+
+    for plane_index in range(2, total_planes):
+        recursion_factors[plane_index] = (
+            scaling_factors[plane_index - 2, plane_index]
+            / scaling_factors[plane_index - 2, plane_index - 1]
+        )
+
+    return recursion_factors
+
+
+@decorator_util.jit()
+def traced_grid_1d_via_multi_plane_recursion(
+    grid_1d_of_plane_before_previous,
+    grid_1d_of_previous_plane,
+    deflections_1d_of_previous_plane,
+    recursion_factor,
+    scaling_factor,
+    traced_grid_1d,
+):
+    """Ray-trace a grid of (y,x) coordinates to the next plane in a multi-plane lens system, using the traced grids \
+    of the two planes before it and the deflection angles of the previous plane (see \
+    *multi_plane_recursion_factors_from_scaling_factors*).
+
+    The traced grid is written into the input *traced_grid_1d*, such that every plane is computed in a single pass \
+    over the coordinates without allocating any temporary arrays.
+
+    Parameters
+    -----------
+    grid_1d_of_plane_before_previous : ndarray
+        The traced grid of the plane two planes before the plane being traced to.
+    grid_1d_of_previous_plane : ndarray
+        The traced grid of the plane before the plane being traced to.
+    deflections_1d_of_previous_plane : ndarray
+        The deflection angles of the plane before the plane being traced to, computed on its traced grid.
+    recursion_factor : float
+        The multi-plane recursion factor of the plane being traced to.
+    scaling_factor : float
+        The scaling factor of the previous plane's deflection angles.
+    traced_grid_1d : ndarray
+        The array the traced grid is written to.
+    """
+
+    for coordinate_index in range(traced_grid_1d.shape[0]):
+        for dimension in range(2):
+            traced_grid_1d[coordinate_index, dimension] = (
+                (1.0 - recursion_factor)
+                * grid_1d_of_plane_before_previous[coordinate_index, dimension]
+                + recursion_factor
+                * grid_1d_of_previous_plane[coordinate_index, dimension]
+                - scaling_factor
+                * deflections_1d_of_previous_plane[coordinate_index, dimension]
+            )
+
+    return traced_grid_1d
+
+
+@decorator_util.jit()
+def maximum_separations_from_grid_1d_and_set_sizes(grid_1d, set_sizes, threshold):
+    """Compute the maximum separation between any two (y,x) coordinates of every set of coordinates, where the sets \
+    are stored contiguously in one 1D grid (e.g. the traced positions of every multiple image of a source).
+
+    The calculation stops as soon as the separation of any pair of coordinates exceeds the *threshold*, in which \
+    case only the maximum separations of the sets up to and including that set are returned, with the final value \
+    being the separation which exceeded the threshold. Pass a threshold of *np.inf* to compute every set in full.
+
+    Parameters
+    -----------
+    grid_1d : ndarray
+        The (y,x) coordinates of every set, with the coordinates of the first set first, the second set second and \
+        so on.
+    set_sizes : ndarray
+        The number of coordinates in every set.
+    threshold : float
+        The separation above which the calculation exits early.
+    """
+
+    maximum_separations = np.zeros(set_sizes.shape[0])
+    threshold_squared = threshold ** 2.0
+
+    set_start = 0
+
+    for set_index in range(set_sizes.shape[0]):
+
+        set_end = set_start + set_sizes[set_index]
+        maximum_separation_squared = 0.0
+
+        for coordinate_index in range(set_start, set_end):
+            for other_index in range(coordinate_index + 1, set_end):
+
+                y_separation = grid_1d[coordinate_index, 0] - grid_1d[other_index, 0]
+                x_separation = grid_1d[coordinate_index, 1] - grid_1d[other_index, 1]
+
+                separation_squared = y_separation ** 2.0 + x_separation ** 2.0
+
+                if separation_squared > maximum_separation_squared:
+                    maximum_separation_squared = separation_squared
+
+                    if maximum_separation_squared > threshold_squared:
+                        maximum_separations[set_index] = np.sqrt(
+                            maximum_separation_squared
+                        )
+                        return maximum_separations[: set_index + 1]
+
+        maximum_separations[set_index] = np.sqrt(maximum_separation_squared)
+        set_start = set_end
+
+    return maximum_separations
+
+
+def positions_within_threshold_from_grid_1d_and_set_sizes(
+    grid_1d, set_sizes, threshold
+):
+    """Whether the maximum separation between any two (y,x) coordinates of every set of coordinates is within a \
+    threshold (see *maximum_separations_from_grid_1d_and_set_sizes*), which stops computing separations as soon \
+    as any pair of coordinates exceeds it.
+
+    This is the check of a *PositionsFit* and of the positions threshold a phase rejects models with (see \
+    *AbstractLensMasked.check_positions_trace_within_threshold_via_tracer*).
+
+    Parameters
+    -----------
+    grid_1d : ndarray
+        The (y,x) coordinates of every set, with the coordinates of the first set first, the second set second and \
+        so on.
+    set_sizes : ndarray
+        The number of coordinates in every set.
+    threshold : float
+        The maximum separation of the coordinates of every set.
+    """
+    maximum_separations = maximum_separations_from_grid_1d_and_set_sizes(
+        grid_1d=np.asarray(grid_1d), set_sizes=set_sizes, threshold=threshold
+    )
+
+    return maximum_separations[-1] <= threshold
+
+
+def grid_1d_of_windows_from_centres_half_width_and_upscale_factor(
+    centres, half_width, upscale_factor
+):
+    """Given a set of (y,x) centres, return a grid of the (y,x) coordinates of a square window of \
+    upscale_factor x upscale_factor uniformly spaced coordinates around every centre, which extend a distance \
+    half_width from the centre in every direction.
+
+    The returned grid is an ndarray of shape [total_centres * upscale_factor ** 2, 2], where the coordinates of the \
+    window of every centre are contiguous and in the same order as the centres.
+
+    Parameters
+    -----------
+    centres : ndarray
+        The (y,x) centres of every window, as an ndarray of shape [total_centres, 2].
+    half_width : float
+        The distance the window extends from its centre in the y and x directions.
+    upscale_factor : int
+        The number of coordinates of the window in the y and x directions.
+    """
+    offsets = np.linspace(-half_width, half_width, upscale_factor)
+
+    offsets_y, offsets_x = np.meshgrid(offsets, offsets, indexing="ij")
+
+    window = np.stack((offsets_y.ravel(), offsets_x.ravel()), axis=-1)
+
+    return (np.asarray(centres)[:, None, :] + window[None, :, :]).reshape(-1, 2)
+
+
+def interpolated_values_and_error_from_grid_and_func_via_adaptive_lattice(
+    grid, func, pixel_scale, tolerance, refinements
+):
+    """Compute the values of a function of (y,x) coordinates (e.g. the deflection angles of a mass profile) at every \
+    coordinate of a grid, by evaluating the function on an adaptive lattice of coordinates and bilinearly \
+    interpolating its values to the grid.
+
+    The lattice begins as a uniform square lattice with a spacing of pixel_scale. The function is evaluated at the \
+    corners of every lattice cell which contains a grid coordinate and at the cell's centre, where it is compared \
+    to the bilinear interpolation of the corners. If they differ by more than the tolerance the cell is split into \
+    four cells, which are checked in the same way, up to the input number of refinements. The function is therefore \
+    evaluated on a finer lattice only where its values change rapidly, and every coordinate of the grid is \
+    interpolated from the corners of the finest cell it is in. The coordinates of a cell which contains too few of \
+    them for splitting it to be cheaper than evaluating the function at them are evaluated exactly instead.
+
+    The largest difference measured at the centre of a cell which is not split is returned as the (measured) \
+    interpolation error.
+
+    Parameters
+    -----------
+    grid : ndarray
+        The (y,x) coordinates the function's values are interpolated to, of shape [total_coordinates, 2].
+    func : func
+        The function, which given an ndarray of (y,x) coordinates of shape [total_coordinates, 2] returns its \
+        values as an ndarray of shape [total_coordinates, total_values].
+    pixel_scale : float
+        The spacing of the coarsest lattice.
+    tolerance : float
+        The maximum difference between the function and its interpolation at the centre of a cell, above which \
+        the cell is split.
+    refinements : int
+        The maximum number of times a cell of the coarsest lattice is split.
+    """
+    grid = np.asarray(grid)
+
+    origin = np.min(grid, axis=0) - pixel_scale
+
+    values_of_grid = None
+    error = 0.0
+
+    coordinate_indexes = np.arange(grid.shape[0])
+    cell_coordinates = (grid - origin) / pixel_scale
+    cells = np.floor(cell_coordinates).astype("int")
+
+    # Every cell and corner of the lattice is indexed by its key y * width + x, where width is above the largest x
+    # index of a corner. The corners are stored as a sorted array of keys with an array of the function's values at
+    # them, such that the values of the corners of every cell are looked up together via a binary search.
+
+    width = int(np.max(cells[:, 1])) + 2
+
+    corner_keys = np.zeros(shape=(0,), dtype="int64")
+    corner_values = None
+
+    for refinement in range(refinements + 1):
+
+        cell_spacing = pixel_scale / 2 ** refinement
+
+        cell_keys, cell_indexes = np.unique(
+            cells[:, 0].astype("int64") * width + cells[:, 1], return_inverse=True
+        )
+        cell_indexes = cell_indexes.ravel()
+
+        active_cells = np.stack([cell_keys // width, cell_keys % width], axis=1)
+
+        keys_of_cells = (
+            cell_keys[None, :]
+            + np.array([0, 1, width, width + 1], dtype="int64")[:, None]
+        )
+
+        new_keys = np.setdiff1d(keys_of_cells, corner_keys)
+
+        if len(new_keys) > 0:
+
+            new_values = func(
+                origin
+                + np.stack([new_keys // width, new_keys % width], axis=1) * cell_spacing
+            )
+
+            corner_keys = np.concatenate([corner_keys, new_keys])
+            corner_values = (
+                new_values
+                if corner_values is None
+                else np.concatenate([corner_values, new_values])
+            )
+
+            order = np.argsort(corner_keys)
+            corner_keys = corner_keys[order]
+            corner_values = corner_values[order]
+
+        values_of_corners = corner_values[np.searchsorted(corner_keys, keys_of_cells)]
+
+        values_of_centres = func(origin + (active_cells + 0.5) * cell_spacing)
+
+        errors = np.max(
+            np.abs(np.mean(values_of_corners, axis=0) - values_of_centres), axis=1
+        )
+
+        if refinement == refinements:
+            split = np.full(fill_value=False, shape=errors.shape)
+        else:
+            split = errors > tolerance
+
+        if values_of_grid is None:
+            values_of_grid = np.zeros(shape=(grid.shape[0], values_of_centres.shape[1]))
+
+        # Splitting a cell evaluates the function at (at least) 5 new coordinates, so the grid coordinates of a cell \
+        # to be split which contains no more than 5 of them are evaluated exactly instead.
+
+        exact = split & (np.bincount(cell_indexes, minlength=split.shape[0]) <= 5)
+
+        if np.any(exact):
+            split &= ~exact
+            exact_coordinates = exact[cell_indexes]
+            values_of_grid[coordinate_indexes[exact_coordinates]] = func(
+                grid[coordinate_indexes[exact_coordinates]]
+            )
+        else:
+            exact_coordinates = np.full(fill_value=False, shape=cell_indexes.shape)
+
+        leaf = ~split[cell_indexes] & ~exact_coordinates
+
+        if np.any(~split & ~exact):
+            error = max(error, np.max(errors[~split & ~exact]))
+
+        fractions = cell_coordinates[leaf] - cells[leaf]
+        leaf_cell_indexes = cell_indexes[leaf]
+
+        values_of_grid[coordinate_indexes[leaf]] = (
+            ((1.0 - fractions[:, 0]) * (1.0 - fractions[:, 1]))[:, None]
+            * values_of_corners[0, leaf_cell_indexes]
+            + ((1.0 - fractions[:, 0]) * fractions[:, 1])[:, None]
+            * values_of_corners[1, leaf_cell_indexes]
+            + (fractions[:, 0] * (1.0 - fractions[:, 1]))[:, None]
+            * values_of_corners[2, leaf_cell_indexes]
+            + (fractions[:, 0] * fractions[:, 1])[:, None]
+            * values_of_corners[3, leaf_cell_indexes]
+        )
+
+        done = leaf | exact_coordinates
+
+        if np.all(done):
+            break
+
+        # The corners and centre of a split cell are corners of the cells it is split into, so are carried over to
+        # the refined lattice, whose corner indexes (and therefore width) are doubled.
+
+        refined_width = 2 * width - 1
+
+        centre_keys = (
+            2 * active_cells[split, 0].astype("int64") + 1
+        ) * refined_width + (2 * active_cells[split, 1] + 1)
+
+        corner_keys = np.concatenate(
+            [
+                2 * (corner_keys // width) * refined_width + 2 * (corner_keys % width),
+                centre_keys,
+            ]
+        )
+        corner_values = np.concatenate([corner_values, values_of_centres[split]])
+
+        order = np.argsort(corner_keys)
+        corner_keys = corner_keys[order]
+        corner_values = corner_values[order]
+
+        width = refined_width
+
+        coordinate_indexes = coordinate_indexes[~done]
+        cell_coordinates = 2.0 * cell_coordinates[~done]
+        cells = np.floor(cell_coordinates).astype("int")
+
+    return values_of_grid, error
@@ -1,3 +1,4 @@
+from autoarray.fit import fit as aa_fit
 from autoarray.operators.inversion import inversions
 from autoarray.operators import transformer as trans
 import autolens as al
@@ -60,6 +61,44 @@ class TestImagingFit:
 
             assert fit.total_inversions == 3
 
+        def test__figure_of_merit__computed_without_residual_and_chi_squared_maps(
+            self, masked_imaging_7x7, monkeypatch
+        ):
+
+            g0 = al.Galaxy(
+                redshift=0.5, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+            )
+            g1 = al.Galaxy(
+                redshift=1.0,
+                pixelization=al.pix.Rectangular(shape=(3, 3)),
+                regularization=al.reg.Constant(coefficient=1.0),
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+            fit = ImagingFit(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+            chi_squared = np.sum(fit.chi_squared_map)
+            noise_normalization = np.sum(
+                np.log(2 * np.pi * masked_imaging_7x7.noise_map ** 2.0)
+            )
+
+            def raise_error(self):
+                raise AttributeError
+
+            for map_name in [
+                "residual_map",
+                "normalized_residual_map",
+                "chi_squared_map",
+            ]:
+                monkeypatch.setattr(aa_fit.DatasetFit, map_name, property(raise_error))
+
+            fit = ImagingFit(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+            assert fit.chi_squared == chi_squared
+            assert fit.noise_normalization == noise_normalization
+            assert fit.figure_of_merit == fit.evidence
+
     class TestLikelihood:
         def test__1x2_image__no_psf_blurring__tracing_fits_data_with_chi_sq_5(self):
             # The image plane image generated by the galaxy is [1.0, 1.0]
@@ -1490,6 +1529,170 @@ class TestImagingFit:
                 fit.model_images_of_planes[1].in_2d, 1.0e-4
             )
 
+    class TestPreloadedProfileQuantities:
+        def test__preloaded_from_same_tracer__fit_identical__preloads_reused_only_for_same_profiles(
+            self, masked_imaging_7x7
+        ):
+            def tracer_with_lens_intensity(intensity):
+                return al.Tracer.from_galaxies(
+                    galaxies=[
+                        al.Galaxy(
+                            redshift=0.5,
+                            light_profile=al.lp.EllipticalSersic(intensity=intensity),
+                            mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                        ),
+                        al.Galaxy(
+                            redshift=1.0,
+                            pixelization=al.pix.Rectangular(shape=(3, 3)),
+                            regularization=al.reg.Constant(coefficient=1.0),
+                        ),
+                    ]
+                )
+
+            fit = ImagingFit(
+                masked_imaging=masked_imaging_7x7,
+                tracer=tracer_with_lens_intensity(intensity=1.0),
+            )
+
+            masked_imaging_7x7.preload_profile_quantities_from_tracer(
+                tracer=tracer_with_lens_intensity(intensity=1.0)
+            )
+
+            preloaded_fit = ImagingFit(
+                masked_imaging=masked_imaging_7x7,
+                tracer=tracer_with_lens_intensity(intensity=1.0),
+            )
+
+            assert preloaded_fit.likelihood == pytest.approx(fit.likelihood, 1.0e-8)
+            assert (
+                preloaded_fit.blurred_profile_image
+                is masked_imaging_7x7.preload_blurred_profile_image
+            )
+            assert (
+                preloaded_fit.tracer.traced_grids_of_planes_from_grid(
+                    grid=masked_imaging_7x7.grid
+                )[1]
+                is masked_imaging_7x7.preload_traced_grids_of_planes[1]
+            )
+
+            fit = ImagingFit(
+                masked_imaging=masked_imaging_7x7,
+                tracer=tracer_with_lens_intensity(intensity=2.0),
+            )
+
+            assert (
+                fit.blurred_profile_image
+                is not masked_imaging_7x7.preload_blurred_profile_image
+            )
+            assert fit.blurred_profile_image == pytest.approx(
+                2.0 * masked_imaging_7x7.preload_blurred_profile_image, 1.0e-4
+            )
+
+    class TestMultipleInversions:
+        def test___two_pixelized_planes__reconstructed_jointly_and_split_across_planes(
+            self, masked_imaging_7x7
+        ):
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+            galaxy_pix_0 = al.Galaxy(
+                redshift=1.0,
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=0.5),
+                pixelization=al.pix.Rectangular(shape=(3, 3)),
+                regularization=al.reg.Constant(coefficient=1.0),
+            )
+            galaxy_pix_1 = al.Galaxy(
+                redshift=2.0,
+                pixelization=al.pix.Rectangular(shape=(4, 4)),
+                regularization=al.reg.Constant(coefficient=2.0),
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, galaxy_pix_0, galaxy_pix_1])
+
+            fit = ImagingFit(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+            assert fit.total_inversions == 2
+            assert fit.inversion.reconstruction.shape == (25,)
+            assert fit.inversion.mappers[0].pixels == 9
+            assert fit.inversion.mappers[1].pixels == 16
+
+            (
+                image_pix_0,
+                image_pix_1,
+            ) = fit.inversion.mapped_reconstructed_images_of_mappers
+
+            assert (fit.galaxy_model_image_dict[g0] == np.zeros(9)).all()
+            assert fit.galaxy_model_image_dict[galaxy_pix_0] == pytest.approx(
+                image_pix_0, 1.0e-4
+            )
+            assert fit.galaxy_model_image_dict[galaxy_pix_1] == pytest.approx(
+                image_pix_1, 1.0e-4
+            )
+            assert fit.model_images_of_planes[1] == pytest.approx(image_pix_0, 1.0e-4)
+            assert fit.model_images_of_planes[2] == pytest.approx(image_pix_1, 1.0e-4)
+            assert fit.model_image == pytest.approx(image_pix_0 + image_pix_1, 1.0e-4)
+
+    class TestPrecision:
+        def test__float32_grids__likelihood_same_as_float64_to_within_tolerance(
+            self, imaging_7x7, sub_mask_7x7
+        ):
+
+            galaxies_of_fits = [
+                [
+                    al.Galaxy(
+                        redshift=0.5,
+                        light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                        mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(
+                        redshift=1.0,
+                        light_profile=al.lp.EllipticalSersic(intensity=2.0),
+                    ),
+                ],
+                [
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass_profile=al.mp.SphericalIsothermal(
+                            centre=(0.1, 0.05), einstein_radius=1.0
+                        ),
+                    ),
+                    al.Galaxy(
+                        redshift=1.0,
+                        pixelization=al.pix.Rectangular(shape=(3, 3)),
+                        regularization=al.reg.Constant(coefficient=1.0),
+                    ),
+                ],
+            ]
+
+            masked_imaging_64 = al.masked.imaging(
+                imaging=imaging_7x7, mask=sub_mask_7x7
+            )
+            masked_imaging_32 = al.masked.imaging(
+                imaging=imaging_7x7, mask=sub_mask_7x7, precision="float32"
+            )
+
+            for galaxies in galaxies_of_fits:
+
+                fit_64 = ImagingFit(
+                    masked_imaging=masked_imaging_64,
+                    tracer=al.Tracer.from_galaxies(galaxies=galaxies),
+                )
+                fit_32 = ImagingFit(
+                    masked_imaging=masked_imaging_32,
+                    tracer=al.Tracer.from_galaxies(galaxies=galaxies),
+                )
+
+                traced_grids_of_planes = fit_32.tracer.traced_grids_of_planes_from_grid(
+                    grid=masked_imaging_32.grid
+                )
+
+                assert traced_grids_of_planes[1].dtype == np.float32
+                assert fit_32.figure_of_merit == pytest.approx(
+                    fit_64.figure_of_merit, 1.0e-4
+                )
+
 
 class TestInterferometerFit:
     class TestFitProperties:
@@ -1548,6 +1751,43 @@ class TestInterferometerFit:
 
             assert fit.total_inversions == 3
 
+        def test__figure_of_merit__computed_without_residual_and_chi_squared_maps(
+            self, masked_interferometer_7, monkeypatch
+        ):
+
+            g0 = al.Galaxy(
+                redshift=0.5, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, al.Galaxy(redshift=1.0)])
+
+            fit = InterferometerFit(
+                masked_interferometer=masked_interferometer_7, tracer=tracer
+            )
+
+            chi_squared = np.sum(fit.chi_squared_map)
+            noise_normalization = np.sum(
+                np.log(2 * np.pi * masked_interferometer_7.noise_map ** 2.0)
+            )
+
+            def raise_error(self):
+                raise AttributeError
+
+            for map_name in [
+                "residual_map",
+                "normalized_residual_map",
+                "chi_squared_map",
+            ]:
+                monkeypatch.setattr(aa_fit.DatasetFit, map_name, property(raise_error))
+
+            fit = InterferometerFit(
+                masked_interferometer=masked_interferometer_7, tracer=tracer
+            )
+
+            assert fit.chi_squared == chi_squared
+            assert fit.noise_normalization == noise_normalization
+            assert fit.figure_of_merit == fit.likelihood
+
     class TestLikelihood:
         def test__1x2_image__1x2_visibilities__simple_fourier_transform(self):
             # The image plane image generated by the galaxy is [1.0, 1.0]
@@ -0,0 +1,205 @@
+import numpy as np
+import pytest
+
+import autoarray as aa
+import autolens as al
+from autolens.lens import inversions
+
+
+def mappers_and_regularizations_from_grid(grid, coefficients=(1.0,)):
+
+    galaxies = [al.Galaxy(redshift=0.5, mass=al.mp.SphericalIsothermal())]
+
+    for index, coefficient in enumerate(coefficients):
+        galaxies.append(
+            al.Galaxy(
+                redshift=1.0 + index,
+                mass=al.mp.SphericalIsothermal(einstein_radius=0.5),
+                pixelization=al.pix.Rectangular(shape=(3, 3)),
+                regularization=al.reg.Constant(coefficient=coefficient),
+            )
+        )
+
+    tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+    mappers = list(
+        filter(
+            None,
+            tracer.mappers_of_planes_from_grid(grid=grid, inversion_uses_border=False),
+        )
+    )
+
+    return mappers, list(filter(None, tracer.regularizations_of_planes))
+
+
+class TestJointInversionImaging:
+    def test__single_mapper__identical_to_inversion_of_one_plane(
+        self, sub_grid_7x7, masked_imaging_7x7
+    ):
+
+        mappers, regularizations = mappers_and_regularizations_from_grid(
+            grid=sub_grid_7x7
+        )
+
+        inversion = aa.inversion(
+            masked_dataset=masked_imaging_7x7,
+            mapper=mappers[0],
+            regularization=regularizations[0],
+        )
+
+        joint_inversion = inversions.JointInversionImaging.from_data_mappers_and_regularizations(
+            image=masked_imaging_7x7.image,
+            noise_map=masked_imaging_7x7.noise_map,
+            convolver=masked_imaging_7x7.convolver,
+            mappers=mappers,
+            regularizations=regularizations,
+        )
+
+        assert joint_inversion.reconstruction == pytest.approx(
+            inversion.reconstruction, 1.0e-8
+        )
+        assert joint_inversion.regularization_matrix == pytest.approx(
+            inversion.regularization_matrix, 1.0e-8
+        )
+        assert joint_inversion.mapped_reconstructed_image == pytest.approx(
+            inversion.mapped_reconstructed_image, 1.0e-8
+        )
+        assert joint_inversion.residual_map == pytest.approx(
+            inversion.residual_map, 1.0e-8
+        )
+        assert joint_inversion.chi_squared_map == pytest.approx(
+            inversion.chi_squared_map, 1.0e-8
+        )
+        assert joint_inversion.log_det_curvature_reg_matrix_term == pytest.approx(
+            inversion.log_det_curvature_reg_matrix_term, 1.0e-8
+        )
+        assert joint_inversion.mapper is mappers[0]
+
+    def test__two_mappers__stacked_into_one_linear_system(
+        self, sub_grid_7x7, masked_imaging_7x7
+    ):
+
+        mappers, regularizations = mappers_and_regularizations_from_grid(
+            grid=sub_grid_7x7, coefficients=(1.0, 2.0)
+        )
+
+        joint_inversion = inversions.JointInversionImaging.from_data_mappers_and_regularizations(
+            image=masked_imaging_7x7.image,
+            noise_map=masked_imaging_7x7.noise_map,
+            convolver=masked_imaging_7x7.convolver,
+            mappers=mappers,
+            regularizations=regularizations,
+        )
+
+        assert joint_inversion.blurred_mapping_matrix.shape == (9, 18)
+        assert joint_inversion.reconstruction.shape == (18,)
+        assert joint_inversion.pixel_slices_of_mappers == [slice(0, 9), slice(9, 18)]
+        assert joint_inversion.mapper is mappers[1]
+        assert joint_inversion.regularization is regularizations[1]
+
+        regularization_matrix_0 = regularizations[0].regularization_matrix_from_mapper(
+            mapper=mappers[0]
+        )
+        regularization_matrix_1 = regularizations[1].regularization_matrix_from_mapper(
+            mapper=mappers[1]
+        )
+
+        assert joint_inversion.regularization_matrix[0:9, 0:9] == pytest.approx(
+            regularization_matrix_0, 1.0e-8
+        )
+        assert joint_inversion.regularization_matrix[9:18, 9:18] == pytest.approx(
+            regularization_matrix_1, 1.0e-8
+        )
+        assert (joint_inversion.regularization_matrix[0:9, 9:18] == 0.0).all()
+
+        curvature_matrix = (
+            joint_inversion.curvature_reg_matrix - joint_inversion.regularization_matrix
+        )
+
+        assert (curvature_matrix[0:9, 9:18] != 0.0).any()
+
+        images_of_mappers = joint_inversion.mapped_reconstructed_images_of_mappers
+
+        assert len(images_of_mappers) == 2
+        assert sum(images_of_mappers) == pytest.approx(
+            joint_inversion.mapped_reconstructed_image, 1.0e-8
+        )
+
+        residual_map = (
+            masked_imaging_7x7.image - joint_inversion.mapped_reconstructed_image
+        )
+
+        assert joint_inversion.residual_map.shape == masked_imaging_7x7.image.shape
+        assert joint_inversion.residual_map == pytest.approx(residual_map, 1.0e-8)
+        assert joint_inversion.normalized_residual_map == pytest.approx(
+            residual_map / masked_imaging_7x7.noise_map, 1.0e-8
+        )
+        assert joint_inversion.chi_squared_map == pytest.approx(
+            (residual_map / masked_imaging_7x7.noise_map) ** 2.0, 1.0e-8
+        )
+
+        log_det = 2.0 * np.sum(
+            np.log(np.diag(np.linalg.cholesky(joint_inversion.regularization_matrix)))
+        )
+
+        assert joint_inversion.log_det_regularization_matrix_term == pytest.approx(
+            log_det, 1.0e-8
+        )
+
+
+class TestJointInversionInterferometer:
+    def test__single_mapper__identical_to_inversion_of_one_plane(
+        self, sub_grid_7x7, masked_interferometer_7
+    ):
+
+        mappers, regularizations = mappers_and_regularizations_from_grid(
+            grid=sub_grid_7x7
+        )
+
+        inversion = aa.inversion(
+            masked_dataset=masked_interferometer_7,
+            mapper=mappers[0],
+            regularization=regularizations[0],
+        )
+
+        joint_inversion = inversions.JointInversionInterferometer.from_data_mappers_and_regularizations(
+            visibilities=masked_interferometer_7.visibilities,
+            noise_map=masked_interferometer_7.noise_map,
+            transformer=masked_interferometer_7.transformer,
+            mappers=mappers,
+            regularizations=regularizations,
+        )
+
+        assert joint_inversion.reconstruction == pytest.approx(
+            inversion.reconstruction, 1.0e-8
+        )
+        assert joint_inversion.mapped_reconstructed_image == pytest.approx(
+            inversion.mapped_reconstructed_image, 1.0e-8
+        )
+        assert joint_inversion.mapped_reconstructed_visibilities == pytest.approx(
+            inversion.mapped_reconstructed_visibilities, 1.0e-8
+        )
+
+    def test__two_mappers__visibilities_of_mappers_sum_to_total(
+        self, sub_grid_7x7, masked_interferometer_7
+    ):
+
+        mappers, regularizations = mappers_and_regularizations_from_grid(
+            grid=sub_grid_7x7, coefficients=(1.0, 2.0)
+        )
+
+        joint_inversion = inversions.JointInversionInterferometer.from_data_mappers_and_regularizations(
+            visibilities=masked_interferometer_7.visibilities,
+            noise_map=masked_interferometer_7.noise_map,
+            transformer=masked_interferometer_7.transformer,
+            mappers=mappers,
+            regularizations=regularizations,
+        )
+
+        assert joint_inversion.reconstruction.shape == (18,)
+        assert sum(
+            joint_inversion.mapped_reconstructed_visibilities_of_mappers
+        ) == pytest.approx(joint_inversion.mapped_reconstructed_visibilities, 1.0e-8)
+        assert sum(
+            joint_inversion.mapped_reconstructed_images_of_mappers
+        ) == pytest.approx(joint_inversion.mapped_reconstructed_image, 1.0e-8)
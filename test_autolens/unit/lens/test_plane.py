@@ -1,3 +1,5 @@
+import copy
+
 import numpy as np
 import pytest
 from astropy import cosmology as cosmo
@@ -9,6 +11,7 @@ import autofit as af
 import autoastro as am
 import autolens as al
 from autolens.lens import plane
+from autolens.lens import plane as plane_module
 from autolens import exc
 import autoarray as aa
 
@@ -1465,6 +1468,209 @@ class TestAbstractPlaneLensing:
                 np.pi * 2.0 ** 2.0, 1.0e-1
             )
 
+    class TestThreadPool:
+        def test__galaxies_evaluated_on_thread_pool__same_as_serial(self, sub_grid_7x7):
+
+            galaxies = [
+                al.Galaxy(
+                    redshift=0.5,
+                    light=al.lp.EllipticalSersic(intensity=1.0 + 0.1 * i),
+                    mass=al.mp.SphericalIsothermal(
+                        centre=(0.1 * i, 0.0), einstein_radius=0.5 + 0.1 * i
+                    ),
+                )
+                for i in range(4)
+            ] + [al.Galaxy(redshift=0.5)]
+
+            plane = al.Plane(galaxies=galaxies)
+
+            profile_image = plane.profile_image_from_grid(grid=sub_grid_7x7)
+            convergence = plane.convergence_from_grid(grid=sub_grid_7x7)
+            potential = plane.potential_from_grid(grid=sub_grid_7x7)
+            deflections = plane.deflections_from_grid(grid=sub_grid_7x7)
+
+            plane_with_thread_pool = al.Plane(
+                galaxies=galaxies,
+                thread_pool=plane_module.thread_pool_from_threads(threads=3),
+            )
+
+            assert plane_with_thread_pool.profile_image_from_grid(
+                grid=sub_grid_7x7
+            ) == pytest.approx(profile_image, 1.0e-12)
+            assert plane_with_thread_pool.convergence_from_grid(
+                grid=sub_grid_7x7
+            ) == pytest.approx(convergence, 1.0e-12)
+            assert plane_with_thread_pool.potential_from_grid(
+                grid=sub_grid_7x7
+            ) == pytest.approx(potential, 1.0e-12)
+            assert plane_with_thread_pool.deflections_from_grid(
+                grid=sub_grid_7x7
+            ) == pytest.approx(deflections, 1.0e-12)
+
+            assert plane_module.thread_pool_from_threads(threads=1) is None
+
+            assert profile_image == pytest.approx(
+                sum(
+                    [
+                        galaxy.profile_image_from_grid(grid=sub_grid_7x7)
+                        for galaxy in galaxies
+                    ]
+                ),
+                1.0e-12,
+            )
+
+        def test__tracer_plan_threads__planes_share_thread_pool_and_copies_get_their_own(
+            self
+        ):
+
+            galaxies = [al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)]
+
+            plan = al.TracerPlan.from_galaxies(galaxies=galaxies, threads=2)
+
+            tracer = plan.tracer_from_galaxies(galaxies=galaxies)
+
+            assert tracer.planes[0].thread_pool is plan.thread_pool
+            assert tracer.planes[1].thread_pool is plan.thread_pool
+
+            plan_copy = copy.deepcopy(plan)
+
+            assert plan_copy.thread_pool is not None
+            assert plan_copy.thread_pool is not plan.thread_pool
+
+    class TestSummedQuantity:
+        def test__dtype_of_quantities_kept(self):
+
+            summed_quantity = plane_module.summed_quantity_of_galaxies_from_func(
+                func=lambda galaxy: np.ones(3, dtype="float32"),
+                galaxies=[1, 2],
+                shape=(3,),
+            )
+
+            assert summed_quantity.dtype == np.float32
+            assert (summed_quantity == 2.0).all()
+
+    class TestQuantityCache:
+        def test__same_profile_parameters_and_grid__quantities_reused(
+            self, sub_grid_7x7
+        ):
+            def galaxies_with_source_intensity(intensity):
+                return [
+                    al.Galaxy(
+                        redshift=0.5,
+                        light=al.lp.EllipticalSersic(intensity=1.0),
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(
+                        redshift=0.5, light=al.lp.EllipticalSersic(intensity=intensity)
+                    ),
+                ]
+
+            plane = al.Plane(galaxies=galaxies_with_source_intensity(intensity=2.0))
+
+            profile_image = plane.profile_image_from_grid(grid=sub_grid_7x7)
+            deflections = plane.deflections_from_grid(grid=sub_grid_7x7)
+
+            cache = plane_module.quantity_cache_from_maxsize(maxsize=10)
+
+            plane = al.Plane(
+                galaxies=galaxies_with_source_intensity(intensity=2.0),
+                quantity_cache=cache,
+            )
+
+            assert plane.profile_image_from_grid(grid=sub_grid_7x7) == pytest.approx(
+                profile_image, 1.0e-12
+            )
+            assert plane.deflections_from_grid(grid=sub_grid_7x7) == pytest.approx(
+                deflections, 1.0e-12
+            )
+            assert (cache.hits, cache.misses) == (0, 3)
+
+            plane = al.Plane(
+                galaxies=galaxies_with_source_intensity(intensity=3.0),
+                quantity_cache=cache,
+            )
+
+            plane.profile_image_from_grid(grid=sub_grid_7x7)
+            plane.deflections_from_grid(grid=sub_grid_7x7)
+
+            assert (cache.hits, cache.misses) == (2, 4)
+
+            plane.profile_image_from_grid(grid=sub_grid_7x7.copy())
+
+            assert (cache.hits, cache.misses) == (2, 6)
+
+            assert plane_module.quantity_cache_from_maxsize(maxsize=0) is None
+
+        def test__cache_bounded__least_recently_used_quantity_removed(
+            self, sub_grid_7x7
+        ):
+
+            cache = plane_module.QuantityCache(maxsize=2)
+
+            galaxies = [
+                al.Galaxy(
+                    redshift=0.5, light=al.lp.EllipticalSersic(intensity=intensity)
+                )
+                for intensity in [1.0, 2.0, 3.0]
+            ]
+
+            for galaxy in galaxies + [galaxies[2], galaxies[0]]:
+                cache.quantity_from_func(
+                    func=lambda galaxy: galaxy.profile_image_from_grid(
+                        grid=sub_grid_7x7
+                    ),
+                    galaxy=galaxy,
+                    name="profile_image",
+                    profiles=galaxy.light_profiles,
+                    grid=sub_grid_7x7,
+                )
+
+            assert len(cache.quantities) == 2
+            assert (cache.hits, cache.misses) == (1, 4)
+
+        def test__grid_deleted__quantities_computed_on_it_removed(self, sub_grid_7x7):
+
+            cache = plane_module.QuantityCache(maxsize=10)
+
+            galaxy = al.Galaxy(
+                redshift=0.5, light=al.lp.EllipticalSersic(intensity=1.0)
+            )
+
+            grid = sub_grid_7x7.copy()
+
+            cache.quantity_from_func(
+                func=lambda galaxy: galaxy.profile_image_from_grid(grid=grid),
+                galaxy=galaxy,
+                name="profile_image",
+                profiles=galaxy.light_profiles,
+                grid=grid,
+            )
+
+            assert len(cache.quantities) == 1
+
+            del grid
+
+            assert len(cache.quantities) == 0
+
+        def test__copied_cache__is_empty(self, sub_grid_7x7):
+
+            cache = plane_module.QuantityCache(maxsize=10)
+
+            plane = al.Plane(
+                galaxies=[
+                    al.Galaxy(redshift=0.5, light=al.lp.EllipticalSersic(intensity=1.0))
+                ],
+                quantity_cache=cache,
+            )
+
+            plane.profile_image_from_grid(grid=sub_grid_7x7)
+
+            plane_copy = copy.deepcopy(plane)
+
+            assert plane_copy.quantity_cache is not cache
+            assert plane_copy.quantity_cache.maxsize == 10
+            assert len(plane_copy.quantity_cache.quantities) == 0
+
 
 class TestAbstractPlaneData:
     class TestBlurredImagePlaneImage:
@@ -1,8 +1,12 @@
+import copy
+
 import autolens as al
 from skimage import measure
 import numpy as np
 import pytest
 from astropy import cosmology as cosmo
+from autolens import exc
+from autolens.lens import ray_tracing as ray_tracing_module
 from test_autoarray.mock import mock_inversion as mock_inv
 
 
@@ -1153,6 +1157,40 @@ class TestAbstractTracerCosmology:
         assert tracer.planes[2].galaxies == [g0, g1]
         assert tracer.planes[3].galaxies == [g3, g5]
 
+    def test__scaling_factors_of_planes__match_scaling_factors_and_shared_by_tracers_of_a_plan(
+        self
+    ):
+
+        g0 = al.Galaxy(redshift=0.1)
+        g1 = al.Galaxy(redshift=1.0)
+        g2 = al.Galaxy(redshift=2.0)
+        g3 = al.Galaxy(redshift=3.0)
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[g0, g1, g2, g3], cosmology=cosmo.Planck15
+        )
+
+        for i in range(3):
+            for j in range(i + 1, 4):
+                assert tracer.scaling_factors_of_planes[i, j] == pytest.approx(
+                    tracer.scaling_factor_between_planes(i=i, j=j), 1.0e-8
+                )
+
+        assert tracer.scaling_factors_of_planes is tracer.scaling_factors_of_planes
+
+        plan = al.TracerPlan.from_galaxies(
+            galaxies=[g0, g1, g2, g3], cosmology=cosmo.Planck15
+        )
+
+        tracer_0 = plan.tracer_from_galaxies(galaxies=[g0, g1, g2, g3])
+        tracer_1 = plan.tracer_from_galaxies(galaxies=[g0, g1, g2, g3])
+
+        assert (
+            tracer_0.scaling_factors_of_planes == tracer.scaling_factors_of_planes
+        ).all()
+        assert tracer_0.scaling_factors_of_planes is plan.scaling_factors_of_planes
+        assert tracer_1.scaling_factors_of_planes is plan.scaling_factors_of_planes
+
 
 class TestAbstractTracerLensing:
     class TestTracedGridsFromGrid:
@@ -1358,6 +1396,260 @@ class TestAbstractTracerLensing:
                 np.array([1.0, 0.0]), 1e-4
             )
 
+        def test__image_plane_grid_is_input_grid__traced_grids_match_direct_sum_of_deflections(
+            self, sub_grid_7x7
+        ):
+
+            galaxies = [
+                al.Galaxy(
+                    redshift=redshift,
+                    mass_profile=al.mp.SphericalIsothermal(
+                        centre=(0.1 * index, 0.0), einstein_radius=0.5
+                    ),
+                )
+                for index, redshift in enumerate([0.2, 0.4, 0.6, 0.8, 1.0])
+            ]
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=galaxies + [al.Galaxy(redshift=2.0)]
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert traced_grids_of_planes[0] is sub_grid_7x7
+
+            deflections_of_planes = []
+
+            for plane_index, plane in enumerate(tracer.planes):
+
+                traced_grid = sub_grid_7x7 - sum(
+                    [
+                        tracer.scaling_factor_between_planes(
+                            i=previous_plane_index, j=plane_index
+                        )
+                        * deflections_of_planes[previous_plane_index]
+                        for previous_plane_index in range(plane_index)
+                    ]
+                )
+
+                assert traced_grids_of_planes[plane_index] == pytest.approx(
+                    traced_grid, 1.0e-6
+                )
+                assert (
+                    traced_grids_of_planes[plane_index].mask == sub_grid_7x7.mask
+                ).all()
+
+                deflections_of_planes.append(
+                    plane.deflections_from_grid(grid=traced_grid)
+                )
+
+        def test__planes_without_mass_profiles__skipped_and_traced_grids_match_direct_sum(
+            self, sub_grid_7x7
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(redshift=0.2, light=al.lp.SphericalSersic(intensity=1.0)),
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(redshift=0.8),
+                    al.Galaxy(
+                        redshift=1.0,
+                        mass=al.mp.SphericalIsothermal(
+                            centre=(0.1, 0.1), einstein_radius=0.5
+                        ),
+                    ),
+                    al.Galaxy(redshift=2.0),
+                ]
+            )
+
+            assert tracer.plane_indexes_with_mass_profile == [1, 3]
+            assert tracer.plane_indexes_with_light_profile == [0]
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert (traced_grids_of_planes[1] == sub_grid_7x7).all()
+            assert traced_grids_of_planes[1] is not sub_grid_7x7
+
+            deflections_of_planes = []
+
+            for plane_index, plane in enumerate(tracer.planes):
+
+                traced_grid = sub_grid_7x7 - sum(
+                    [
+                        tracer.scaling_factor_between_planes(
+                            i=previous_plane_index, j=plane_index
+                        )
+                        * deflections_of_planes[previous_plane_index]
+                        for previous_plane_index in range(plane_index)
+                    ]
+                )
+
+                assert traced_grids_of_planes[plane_index] == pytest.approx(
+                    traced_grid, 1.0e-6
+                )
+
+                deflections_of_planes.append(
+                    plane.deflections_from_grid(grid=traced_grid)
+                )
+
+        def test__same_grid_traced_twice__traced_grids_reused_from_cache(
+            self, sub_grid_7x7, blurring_grid_7x7, gal_x1_mp
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            traced_grids_of_planes_cached = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert traced_grids_of_planes_cached[1] is traced_grids_of_planes[1]
+
+            traced_grids_of_planes_limit = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7, plane_index_limit=0
+            )
+
+            assert len(traced_grids_of_planes_limit) == 1
+
+            traced_blurring_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=blurring_grid_7x7
+            )
+
+            assert traced_blurring_grids_of_planes[1] is not traced_grids_of_planes[1]
+            assert traced_blurring_grids_of_planes[1].shape == blurring_grid_7x7.shape
+
+            new_tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            new_traced_grids_of_planes = new_tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert new_traced_grids_of_planes[1] is not traced_grids_of_planes[1]
+            assert (new_traced_grids_of_planes[1] == traced_grids_of_planes[1]).all()
+
+        def test__plane_index_limit_traced_first__full_trace_computes_remaining_planes(
+            self, sub_grid_7x7, gal_x1_mp
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            traced_grids_of_planes_limit = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7, plane_index_limit=0
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert len(traced_grids_of_planes_limit) == 1
+            assert len(traced_grids_of_planes) == 2
+            assert (
+                traced_grids_of_planes[1]
+                == sub_grid_7x7 - gal_x1_mp.deflections_from_grid(grid=sub_grid_7x7)
+            ).all()
+
+        def test__grid_deleted__removed_from_cache(self, gal_x1_mp):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            grid = al.grid.uniform(shape_2d=(3, 3), pixel_scales=1.0, sub_size=1)
+
+            tracer.traced_grids_of_planes_from_grid(grid=grid)
+
+            assert len(tracer._traced_grids_of_planes_cache) == 1
+
+            del grid
+
+            assert len(tracer._traced_grids_of_planes_cache) == 0
+
+        def test__traced_grid_of_plane__same_as_plane_of_all_traced_grids__not_cached(
+            self
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(
+                        redshift=1.0,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=0.5),
+                    ),
+                    al.Galaxy(redshift=2.0),
+                ]
+            )
+
+            grid = al.grid_irregular.manual_1d(grid=[[1.0, 0.0], [-1.0, 0.5]])
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_via_recursion_from_grid(
+                grid=grid, total_planes=3
+            )
+
+            traced_grid = tracer.traced_grid_of_plane_from_grid(
+                grid=grid, plane_index=1
+            )
+
+            assert traced_grid == pytest.approx(traced_grids_of_planes[1], 1.0e-8)
+
+            traced_grid = tracer.traced_grid_of_plane_from_grid(
+                grid=grid, plane_index=-1
+            )
+
+            assert traced_grid == pytest.approx(traced_grids_of_planes[2], 1.0e-8)
+            assert len(tracer._traced_grids_of_planes_cache) == 0
+
+        def test__precision_float32__traced_grids_stored_in_single_precision(
+            self, sub_grid_7x7
+        ):
+
+            galaxies = [
+                al.Galaxy(
+                    redshift=0.5,
+                    light=al.lp.EllipticalSersic(intensity=1.0),
+                    mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                ),
+                al.Galaxy(redshift=1.0, light=al.lp.EllipticalSersic(intensity=2.0)),
+            ]
+
+            tracer_64 = al.Tracer.from_galaxies(galaxies=galaxies)
+            tracer_32 = al.Tracer.from_galaxies(galaxies=galaxies, precision="float32")
+
+            traced_grids_64 = tracer_64.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+            traced_grids_32 = tracer_32.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert traced_grids_64[1].dtype == np.float64
+            assert traced_grids_32[1].dtype == np.float32
+            assert traced_grids_32[1] == pytest.approx(traced_grids_64[1], 1.0e-4)
+
+            assert tracer_32.profile_image_from_grid(
+                grid=sub_grid_7x7
+            ) == pytest.approx(
+                tracer_64.profile_image_from_grid(grid=sub_grid_7x7), 1.0e-4
+            )
+
         def test__same_as_above_but_multiple_sets_of_positions(self):
             import math
 
@@ -1657,6 +1949,74 @@ class TestAbstractTracerLensing:
 
             assert len(traced_grids_of_planes) == 2
 
+    class TestDeflectionsInterpolation:
+        def test__interpolated_traced_grids_within_tolerance_of_exact(self):
+
+            grid = al.grid.uniform(shape_2d=(40, 40), pixel_scales=0.05, sub_size=2)
+
+            galaxies = [
+                al.Galaxy(
+                    redshift=0.5,
+                    mass=al.mp.SphericalCoredIsothermal(
+                        centre=(0.1, 0.0), einstein_radius=0.6, core_radius=0.1
+                    ),
+                ),
+                al.Galaxy(redshift=1.0),
+            ]
+
+            traced_grids_of_planes = al.Tracer.from_galaxies(
+                galaxies=galaxies
+            ).traced_grids_of_planes_from_grid(grid=grid)
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=galaxies,
+                deflections_interpolation=al.DeflectionsInterpolation(
+                    pixel_scale=0.2, tolerance=1.0e-4
+                ),
+            )
+
+            assert tracer.deflections_interpolation_error is None
+
+            interpolated_traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=grid
+            )
+
+            assert interpolated_traced_grids_of_planes[0] is grid
+            assert isinstance(interpolated_traced_grids_of_planes[1], al.grid)
+            assert 0.0 < tracer.deflections_interpolation_error <= 1.0e-4
+            assert (
+                np.max(
+                    np.abs(
+                        interpolated_traced_grids_of_planes[1]
+                        - traced_grids_of_planes[1]
+                    )
+                )
+                < 5.0e-4
+            )
+
+        def test__grid_irregular__traced_exactly(self):
+
+            galaxies = [
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                ),
+                al.Galaxy(redshift=1.0),
+            ]
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=galaxies,
+                deflections_interpolation=al.DeflectionsInterpolation(pixel_scale=0.2),
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=al.grid_irregular.manual_1d([[1.0, 0.0]])
+            )
+
+            assert traced_grids_of_planes[1] == pytest.approx(
+                np.array([[0.0, 0.0]]), 1.0e-8
+            )
+            assert tracer.deflections_interpolation_error is None
+
     class TestProfileImages:
         def test__x1_plane__single_plane_tracer(self, sub_grid_7x7):
             g0 = al.Galaxy(
@@ -1900,6 +2260,44 @@ class TestAbstractTracerLensing:
             assert image.shape_2d == (7, 7)
             assert image == pytest.approx(tracer_profile_image, 1.0e-4)
 
+        def test__profile_images_of_planes__light_only_in_middle_plane__other_planes_separate_zeros(
+            self, sub_grid_7x7
+        ):
+
+            g0 = al.Galaxy(
+                redshift=0.1, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+            )
+            g1 = al.Galaxy(
+                redshift=1.0, light_profile=al.lp.EllipticalSersic(intensity=0.2)
+            )
+            g2 = al.Galaxy(redshift=2.0)
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1, g2])
+
+            profile_images_of_planes = tracer.profile_images_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert len(profile_images_of_planes) == 3
+            assert (profile_images_of_planes[0] == 0.0).all()
+            assert profile_images_of_planes[1] == pytest.approx(
+                g1.profile_image_from_grid(grid=traced_grids_of_planes[1]), 1.0e-8
+            )
+            assert (profile_images_of_planes[2] == 0.0).all()
+            assert profile_images_of_planes[0] is not profile_images_of_planes[2]
+
+            profile_images_of_planes[0] += 1.0
+
+            assert (profile_images_of_planes[2] == 0.0).all()
+
+            profile_image = tracer.profile_image_from_grid(grid=sub_grid_7x7)
+
+            assert profile_image == pytest.approx(profile_images_of_planes[1], 1.0e-8)
+
         def test__profile_images_of_planes__planes_without_light_profiles_are_all_zeros(
             self, sub_grid_7x7
         ):
@@ -2580,6 +2978,122 @@ class TestAbstractTracerLensing:
 
             assert (grid_at_redshift == sub_grid_7x7.geometry.unmasked_grid).all()
 
+        def test__grids_at_multiple_redshifts__match_tracers_with_plane_inserted_at_each_redshift(
+            self, sub_grid_7x7
+        ):
+
+            galaxies = [
+                al.Galaxy(
+                    redshift=0.5,
+                    mass_profile=al.mp.SphericalIsothermal(
+                        centre=(0.0, 0.0), einstein_radius=1.0
+                    ),
+                ),
+                al.Galaxy(
+                    redshift=0.75,
+                    mass_profile=al.mp.SphericalIsothermal(
+                        centre=(0.1, 0.2), einstein_radius=0.5
+                    ),
+                ),
+                al.Galaxy(redshift=1.0),
+                al.Galaxy(
+                    redshift=1.5,
+                    mass_profile=al.mp.SphericalIsothermal(
+                        centre=(-0.1, 0.2), einstein_radius=0.3
+                    ),
+                ),
+                al.Galaxy(redshift=2.0),
+            ]
+
+            tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+            redshifts = [0.3, 0.6, 0.75, 1.2, 1.9, 2.5]
+
+            grids_at_redshifts = tracer.grids_at_redshifts_from_grid_and_redshifts(
+                grid=sub_grid_7x7, redshifts=redshifts
+            )
+
+            assert tracer.plane_redshifts == [0.5, 0.75, 1.0, 1.5, 2.0]
+            assert (grids_at_redshifts[0] == sub_grid_7x7).all()
+            assert (
+                grids_at_redshifts[2]
+                == tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)[1]
+            ).all()
+
+            for redshift_index in [1, 3, 4]:
+
+                tracer_with_plane = al.Tracer.from_galaxies(
+                    galaxies=galaxies + [al.Galaxy(redshift=redshifts[redshift_index])]
+                )
+
+                grid_at_redshift = tracer_with_plane.traced_grids_of_planes_from_grid(
+                    grid=sub_grid_7x7
+                )[tracer_with_plane.plane_redshifts.index(redshifts[redshift_index])]
+
+                assert grids_at_redshifts[redshift_index] == pytest.approx(
+                    grid_at_redshift, 1.0e-8
+                )
+                assert (
+                    tracer.grid_at_redshift_from_grid_and_redshift(
+                        grid=sub_grid_7x7, redshift=redshifts[redshift_index]
+                    )
+                    == grids_at_redshifts[redshift_index]
+                ).all()
+
+            assert (grids_at_redshifts[5] != grids_at_redshifts[4]).all()
+
+        def test__grid_at_plane_redshift_modified_in_place__traced_grids_of_tracer_unchanged(
+            self, sub_grid_7x7
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(redshift=1.0),
+                ]
+            )
+
+            traced_grid = tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)[1]
+            traced_grid_before = np.array(traced_grid)
+
+            grid_at_redshift = tracer.grid_at_redshift_from_grid_and_redshift(
+                grid=sub_grid_7x7, redshift=1.0
+            )
+
+            assert grid_at_redshift is not traced_grid
+
+            grid_at_redshift += 1.0
+
+            assert (
+                tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)[1]
+                == traced_grid_before
+            ).all()
+
+        def test__redshift_above_final_plane_with_mass_profile__raises_exception(
+            self, sub_grid_7x7
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(
+                        redshift=1.0,
+                        mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                ]
+            )
+
+            with pytest.raises(exc.RayTracingException):
+                tracer.grids_at_redshifts_from_grid_and_redshifts(
+                    grid=sub_grid_7x7, redshifts=[0.75, 1.5]
+                )
+
     class TestMultipleImages:
         def test__simple_isothermal_case_positions_are_correct(self):
 
@@ -2639,6 +3153,76 @@ class TestAbstractTracerLensing:
                 == tracer.image_plane_multiple_image_positions_of_galaxies(grid=grid)[0]
             )
 
+        def test__multiple_images_refined__within_a_pixel_of_grid_positions_and_trace_to_source_coordinate(
+            self
+        ):
+
+            grid = al.grid.uniform(shape_2d=(100, 100), pixel_scales=0.05, sub_size=1)
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.EllipticalIsothermal(
+                    centre=(0.001, 0.001), einstein_radius=1.0, axis_ratio=0.8
+                ),
+            )
+
+            g1 = al.Galaxy(
+                redshift=1.0, light=al.lp.SphericalGaussian(centre=(0.0, 0.0))
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+            coordinates = tracer.image_plane_multiple_image_positions_of_galaxies(
+                grid=grid, pixel_scale_precision=1.0e-4
+            )[0]
+
+            coordinates_grid = tracer.image_plane_multiple_image_positions(
+                grid=grid, source_plane_coordinate=(0.0, 0.0)
+            )
+
+            assert len(coordinates[0]) == 4
+
+            for coordinate, coordinate_grid in zip(coordinates[0], coordinates_grid[0]):
+                assert abs(coordinate[0] - coordinate_grid[0]) < 0.05
+                assert abs(coordinate[1] - coordinate_grid[1]) < 0.05
+
+            traced_coordinates = tracer.traced_grids_of_planes_from_grid(
+                grid=al.grid_irregular.manual_1d(grid=np.asarray(coordinates[0]))
+            )[-1]
+
+            assert np.max(np.abs(traced_coordinates)) < 1.0e-4
+
+            traced_coordinates_grid = tracer.traced_grids_of_planes_from_grid(
+                grid=al.grid_irregular.manual_1d(grid=np.asarray(coordinates_grid[0]))
+            )[-1]
+
+            assert np.max(np.abs(traced_coordinates_grid)) > 1.0e-3
+
+            coordinates = tracer.image_plane_multiple_image_positions_of_galaxies(
+                grid=grid, pixel_scale_precision=1.0e-4, upscale_factor=4
+            )[0]
+
+            assert len(coordinates[0]) == 4
+
+            traced_coordinates = tracer.traced_grids_of_planes_from_grid(
+                grid=al.grid_irregular.manual_1d(grid=np.asarray(coordinates[0]))
+            )[-1]
+
+            assert np.max(np.abs(traced_coordinates)) < 1.0e-4
+
+        def test__upscale_factor_below_4__raises_exception(self):
+
+            grid = al.grid.uniform(shape_2d=(10, 10), pixel_scales=0.05)
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)]
+            )
+
+            with pytest.raises(exc.RayTracingException):
+                tracer.image_plane_multiple_image_positions_of_source_plane_coordinates(
+                    grid=grid, source_plane_coordinates=[(0.0, 0.0)], upscale_factor=3
+                )
+
     class TestContributionMap:
         def test__contribution_maps_are_same_as_hyper_galaxy_calculation(self):
 
@@ -2986,6 +3570,64 @@ class TestAbstractTracerData:
             assert (blurred_image_dict[g2].in_1d == g2_blurred_image.in_1d).all()
             assert (blurred_image_dict[g3].in_1d == g3_blurred_image.in_1d).all()
 
+        def test__profile_image_and_blurring_image__same_as_separate_grids__traced_grids_cached(
+            self, sub_grid_7x7, blurring_grid_7x7
+        ):
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+            g1 = al.Galaxy(
+                redshift=1.0,
+                light_profile=al.lp.EllipticalSersic(intensity=2.0),
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=0.5),
+            )
+            g2 = al.Galaxy(
+                redshift=2.0, light_profile=al.lp.EllipticalSersic(intensity=3.0)
+            )
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[g0, g1, g2], cosmology=cosmo.Planck15
+            )
+
+            profile_image = tracer.profile_image_from_grid(grid=sub_grid_7x7)
+            blurring_image = tracer.profile_image_from_grid(grid=blurring_grid_7x7)
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[g0, g1, g2], cosmology=cosmo.Planck15
+            )
+
+            fused_profile_image, fused_blurring_image = tracer.profile_image_and_blurring_image_from_grid_and_blurring_grid(
+                grid=sub_grid_7x7, blurring_grid=blurring_grid_7x7
+            )
+
+            assert fused_profile_image.shape == profile_image.shape
+            assert fused_profile_image.in_1d_binned == pytest.approx(
+                profile_image.in_1d_binned, 1.0e-8
+            )
+            assert fused_blurring_image.in_1d_binned == pytest.approx(
+                blurring_image.in_1d_binned, 1.0e-8
+            )
+
+            traced_grids_of_planes, traced_blurring_grids_of_planes = tracer.traced_grids_of_planes_from_grid_and_blurring_grid(
+                grid=sub_grid_7x7, blurring_grid=blurring_grid_7x7
+            )
+
+            assert (
+                tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)[2]
+                is traced_grids_of_planes[2]
+            )
+            assert (
+                tracer.traced_grids_of_planes_from_grid(grid=blurring_grid_7x7)[2]
+                is traced_blurring_grids_of_planes[2]
+            )
+            assert isinstance(traced_grids_of_planes[2], al.grid)
+            assert traced_grids_of_planes[2].shape == sub_grid_7x7.shape
+            assert traced_blurring_grids_of_planes[2].shape == blurring_grid_7x7.shape
+            assert traced_blurring_grids_of_planes[2].mask is blurring_grid_7x7.mask
+
     class TestUnmaskedBlurredProfileImages:
         def test__unmasked_images_of_tracer_planes_and_galaxies(self):
 
@@ -3490,6 +4132,88 @@ class TestAbstractTracerData:
 
             assert mappers_of_planes == [None, None, 1, None, 2]
 
+        def test__mapper_cache__mapper_reused_if_mass_pixelization_and_grid_unchanged(
+            self, sub_grid_7x7
+        ):
+            cache = ray_tracing_module.mapper_cache_from_maxsize(maxsize=2)
+
+            def mapper_from(
+                einstein_radius=1.0,
+                shape=(3, 3),
+                coefficient=1.0,
+                inversion_uses_border=True,
+                grid=sub_grid_7x7,
+            ):
+                tracer = al.Tracer.from_galaxies(
+                    galaxies=[
+                        al.Galaxy(
+                            redshift=0.5,
+                            mass=al.mp.SphericalIsothermal(
+                                einstein_radius=einstein_radius
+                            ),
+                        ),
+                        al.Galaxy(
+                            redshift=1.0,
+                            pixelization=al.pix.Rectangular(shape=shape),
+                            regularization=al.reg.Constant(coefficient=coefficient),
+                        ),
+                    ],
+                    mapper_cache=cache,
+                )
+
+                return tracer.mappers_of_planes_from_grid(
+                    grid=grid, inversion_uses_border=inversion_uses_border
+                )[1]
+
+            mapper = mapper_from()
+
+            assert mapper_from(coefficient=2.0) is mapper
+
+            assert mapper_from(einstein_radius=1.1) is not mapper
+            assert mapper_from(shape=(4, 4)) is not mapper
+            assert mapper_from(inversion_uses_border=False) is not mapper
+
+            grid = sub_grid_7x7.copy()
+
+            assert mapper_from(grid=grid) is not mapper
+
+            assert (cache.hits, cache.misses) == (1, 5)
+            assert len(cache.mappers) == 2
+
+            del grid
+
+            assert len(cache.mappers) == 1
+
+            assert ray_tracing_module.mapper_cache_from_maxsize(maxsize=0) is None
+
+        def test__tracer_plan__tracers_share_mapper_cache_and_copies_get_empty_cache(
+            self
+        ):
+            galaxies = [
+                al.Galaxy(redshift=0.5, mass=al.mp.SphericalIsothermal()),
+                al.Galaxy(
+                    redshift=1.0,
+                    pixelization=al.pix.Rectangular(shape=(3, 3)),
+                    regularization=al.reg.Constant(coefficient=1.0),
+                ),
+            ]
+
+            plan = al.TracerPlan.from_galaxies(
+                galaxies=galaxies, mapper_cache_maxsize=4
+            )
+
+            assert (
+                plan.tracer_from_galaxies(galaxies=galaxies).mapper_cache
+                is plan.mapper_cache
+            )
+
+            plan.mapper_cache.mappers["key"] = ([], None)
+
+            plan_copy = copy.deepcopy(plan)
+
+            assert plan_copy.mapper_cache.maxsize == 4
+            assert len(plan_copy.mapper_cache.mappers) == 0
+
     class TestInversion:
         def test__x1_inversion_imaging_in_tracer__performs_inversion_correctly(
             self, sub_grid_7x7, masked_imaging_7x7
@@ -3608,6 +4332,65 @@ class TestAbstractTracerData:
             assert (hyper_noise_maps[0].in_1d == hyper_noise_map_0).all()
             assert (hyper_noise_maps[1].in_1d == hyper_noise_map_1).all()
 
+        def test__hyper_noise_map__only_galaxies_with_hyper_galaxies_summed(self):
+
+            noise_map_1d = al.array.manual_2d([[5.0, 3.0, 1.0]])
+
+            hyper_model_image = al.array.manual_2d([[2.0, 4.0, 10.0]])
+            hyper_galaxy_image = al.array.manual_2d([[1.0, 5.0, 8.0]])
+
+            galaxies = [
+                al.Galaxy(redshift=0.5),
+                al.Galaxy(
+                    redshift=0.5,
+                    hyper_galaxy=al.HyperGalaxy(contribution_factor=5.0),
+                    hyper_model_image=hyper_model_image,
+                    hyper_galaxy_image=hyper_galaxy_image,
+                ),
+                al.Galaxy(redshift=1.0),
+                al.Galaxy(
+                    redshift=2.0,
+                    hyper_galaxy=al.HyperGalaxy(contribution_factor=10.0),
+                    hyper_model_image=hyper_model_image,
+                    hyper_galaxy_image=hyper_galaxy_image,
+                ),
+            ]
+
+            hyper_noise_map_of_galaxies = [
+                galaxy.hyper_galaxy.hyper_noise_map_from_hyper_images_and_noise_map(
+                    noise_map=noise_map_1d,
+                    hyper_model_image=hyper_model_image,
+                    hyper_galaxy_image=hyper_galaxy_image,
+                )
+                for galaxy in [galaxies[1], galaxies[3]]
+            ]
+
+            tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+            plan_tracer = al.TracerPlan.from_galaxies(
+                galaxies=galaxies
+            ).tracer_from_galaxies(galaxies=galaxies)
+
+            for tracer in [tracer, plan_tracer]:
+
+                assert tracer.plane_indexes_with_hyper_galaxy == [0, 2]
+                assert tracer.galaxies_with_hyper_galaxy == [galaxies[1], galaxies[3]]
+
+                hyper_noise_map = tracer.hyper_noise_map_from_noise_map(
+                    noise_map=noise_map_1d
+                )
+
+                assert hyper_noise_map.in_1d == pytest.approx(
+                    sum(hyper_noise_map_of_galaxies), 1.0e-8
+                )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[galaxies[0], galaxies[2]])
+
+            assert tracer.galaxies_with_hyper_galaxy == []
+            assert (
+                tracer.hyper_noise_map_from_noise_map(noise_map=noise_map_1d).in_1d
+                == np.zeros(3)
+            ).all()
+
 
 class TestTracer:
     class TestTracedDeflectionsFromGrid:
@@ -4134,3 +4917,149 @@ class TestTacerFixedSlices:
                 np.array([-2.5355, -2.5355]), 1e-4
             )
             assert traced_grids[3][1] == pytest.approx(np.array([2.0, 0.0]), 1e-4)
+
+
+class TestTracerPlan:
+    def test__plan_from_galaxies__stores_planes_and_plane_indexes_of_galaxies(self):
+
+        galaxies = [
+            al.Galaxy(
+                redshift=2.0,
+                pixelization=al.pix.Pixelization(),
+                regularization=al.reg.Constant(),
+            ),
+            al.Galaxy(redshift=0.5, light=al.lp.SphericalSersic(intensity=1.0)),
+            al.Galaxy(
+                redshift=1.0, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+            ),
+            al.Galaxy(
+                redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+            ),
+        ]
+
+        plan = al.TracerPlan.from_galaxies(galaxies=galaxies)
+
+        assert plan.plane_redshifts == [0.5, 1.0, 2.0]
+        assert plan.total_planes == 3
+        assert plan.plane_indexes_of_galaxies == [2, 0, 1, 0]
+        assert plan.galaxy_redshifts == (2.0, 0.5, 1.0, 0.5)
+        assert plan.plane_indexes_with_light_profile == [0]
+        assert plan.plane_indexes_with_mass_profile == [0, 1]
+        assert plan.plane_indexes_with_pixelizations == [2]
+
+    def test__tracer_from_plan__same_planes_and_images_as_tracer_from_galaxies(
+        self, sub_grid_7x7
+    ):
+
+        plan = al.TracerPlan.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5,
+                    light=al.lp.SphericalSersic(intensity=1.0),
+                    mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                ),
+                al.Galaxy(redshift=1.0, light=al.lp.SphericalSersic(intensity=1.0)),
+            ]
+        )
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5,
+                light=al.lp.SphericalSersic(intensity=2.0),
+                mass=al.mp.SphericalIsothermal(einstein_radius=1.5),
+            ),
+            al.Galaxy(redshift=1.0, light=al.lp.SphericalSersic(intensity=3.0)),
+        ]
+
+        tracer_via_plan = plan.tracer_from_galaxies(galaxies=galaxies)
+        tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+        assert tracer_via_plan.plan is plan
+        assert tracer.plan is None
+        assert tracer_via_plan.plane_redshifts == tracer.plane_redshifts
+        assert tracer_via_plan.planes[0].galaxies == [galaxies[0]]
+        assert tracer_via_plan.planes[1].galaxies == [galaxies[1]]
+        assert tracer_via_plan.has_light_profile is True
+        assert tracer_via_plan.has_pixelization is False
+        assert (
+            tracer_via_plan.plane_indexes_with_mass_profile
+            == tracer.plane_indexes_with_mass_profile
+        )
+
+        assert tracer_via_plan.profile_image_from_grid(
+            grid=sub_grid_7x7
+        ) == pytest.approx(tracer.profile_image_from_grid(grid=sub_grid_7x7), 1.0e-8)
+
+    def test__galaxy_redshifts_differ_from_plan__tracer_created_without_plan(self):
+
+        plan = al.TracerPlan.from_galaxies(
+            galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)]
+        )
+
+        tracer = plan.tracer_from_galaxies(
+            galaxies=[al.Galaxy(redshift=0.6), al.Galaxy(redshift=1.0)]
+        )
+
+        assert tracer.plan is None
+        assert tracer.plane_redshifts == [0.6, 1.0]
+
+    def test__tracers_of_plan__share_combined_grid_and_copies_get_empty_cache(
+        self, sub_grid_7x7, blurring_grid_7x7
+    ):
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5,
+                light=al.lp.SphericalSersic(intensity=1.0),
+                mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            ),
+            al.Galaxy(redshift=1.0, light=al.lp.SphericalSersic(intensity=1.0)),
+        ]
+
+        plan = al.TracerPlan.from_galaxies(galaxies=galaxies)
+
+        tracer_0 = plan.tracer_from_galaxies(galaxies=galaxies)
+        tracer_1 = plan.tracer_from_galaxies(galaxies=galaxies)
+        tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+        assert tracer_0.combined_grid_cache is plan.combined_grid_cache
+        assert tracer_1.combined_grid_cache is plan.combined_grid_cache
+        assert tracer.combined_grid_cache is not plan.combined_grid_cache
+
+        combined_grid = tracer_0.combined_grid_cache.combined_grid_from_grid_and_blurring_grid(
+            grid=sub_grid_7x7, blurring_grid=blurring_grid_7x7
+        )
+
+        assert (
+            tracer_1.combined_grid_cache.combined_grid_from_grid_and_blurring_grid(
+                grid=sub_grid_7x7, blurring_grid=blurring_grid_7x7
+            )
+            is combined_grid
+        )
+        assert (
+            np.asarray(combined_grid)
+            == np.concatenate((np.asarray(sub_grid_7x7), np.asarray(blurring_grid_7x7)))
+        ).all()
+
+        assert tracer_0.profile_image_and_blurring_image_from_grid_and_blurring_grid(
+            grid=sub_grid_7x7, blurring_grid=blurring_grid_7x7
+        )[0] == pytest.approx(
+            tracer.profile_image_and_blurring_image_from_grid_and_blurring_grid(
+                grid=sub_grid_7x7, blurring_grid=blurring_grid_7x7
+            )[0],
+            1.0e-8,
+        )
+
+        assert len(copy.deepcopy(plan).combined_grid_cache.combined_grids) == 0
+
+        blurring_grid = copy.copy(blurring_grid_7x7)
+
+        plan.combined_grid_cache.combined_grid_from_grid_and_blurring_grid(
+            grid=sub_grid_7x7, blurring_grid=blurring_grid
+        )
+
+        assert len(plan.combined_grid_cache.combined_grids) == 2
+
+        del blurring_grid
+
+        assert len(plan.combined_grid_cache.combined_grids) == 1
@@ -1,4 +1,5 @@
 import numpy as np
+from astropy import cosmology as cosmo
 import pytest
 
 import autolens as al
@@ -404,3 +405,230 @@ class TestGalaxyOrdering:
         assert galaxies_in_redshift_ordered_planes[4][0].redshift == 1.45
         assert galaxies_in_redshift_ordered_planes[4][1].redshift == 1.55
         assert galaxies_in_redshift_ordered_planes[6][0].redshift == 1.9
+
+    def test__plane_indexes_of_galaxies__index_of_nearest_plane_in_input_order(self):
+        galaxies = [
+            al.Galaxy(redshift=1.0),
+            al.Galaxy(redshift=0.1),
+            al.Galaxy(redshift=1.04),
+            al.Galaxy(redshift=2.0),
+        ]
+
+        plane_indexes_of_galaxies = al.util.lens.plane_indexes_of_galaxies_from_galaxies(
+            galaxies=galaxies, plane_redshifts=[0.1, 1.0, 2.0]
+        )
+
+        assert plane_indexes_of_galaxies == [1, 0, 1, 2]
+
+        plane_indexes_of_galaxies = al.util.lens.plane_indexes_of_galaxies_from_galaxies(
+            galaxies=[], plane_redshifts=[0.1, 1.0, 2.0]
+        )
+
+        assert plane_indexes_of_galaxies == []
+
+
+class TestScalingFactors:
+    def test__3_planes__matrix_entries_match_scaling_factor_between_redshifts(self):
+
+        scaling_factors = al.util.lens.scaling_factors_of_planes_from_plane_redshifts_and_cosmology(
+            plane_redshifts=[0.1, 1.0, 2.0], cosmology=cosmo.Planck15
+        )
+
+        assert scaling_factors.shape == (3, 3)
+
+        assert scaling_factors[0, 1] == pytest.approx(0.9500, 1e-4)
+        assert scaling_factors[0, 2] == pytest.approx(1.0, 1e-4)
+        assert scaling_factors[1, 2] == pytest.approx(1.0, 1e-4)
+
+        assert scaling_factors[0, 1] == pytest.approx(
+            al.util.cosmology.scaling_factor_between_redshifts_from_redshifts_and_cosmology(
+                redshift_0=0.1,
+                redshift_1=1.0,
+                redshift_final=2.0,
+                cosmology=cosmo.Planck15,
+            ),
+            1.0e-8,
+        )
+
+        assert (np.tril(scaling_factors) == 0.0).all()
+
+    def test__matrix_is_read_only__such_that_it_can_be_shared(self):
+
+        scaling_factors = al.util.lens.scaling_factors_of_planes_from_plane_redshifts_and_cosmology(
+            plane_redshifts=[0.5, 1.0, 1.5], cosmology=cosmo.Planck15
+        )
+
+        assert scaling_factors.flags.writeable is False
+
+        with pytest.raises(ValueError):
+            scaling_factors[0, 1] = 0.0
+
+
+class TestMultiPlaneRecursion:
+    def test__recursion_factors__reproduce_direct_sum_of_scaled_deflections(self):
+
+        plane_redshifts = [0.1, 0.5, 1.0, 1.5, 2.0]
+
+        scaling_factors = al.util.lens.scaling_factors_of_planes_from_plane_redshifts_and_cosmology(
+            plane_redshifts=plane_redshifts, cosmology=cosmo.Planck15
+        )
+
+        recursion_factors = al.util.lens.multi_plane_recursion_factors_from_scaling_factors(
+            scaling_factors=scaling_factors
+        )
+
+        assert recursion_factors[0] == 1.0
+        assert recursion_factors[1] == 1.0
+        assert recursion_factors[2] == pytest.approx(
+            scaling_factors[0, 2] / scaling_factors[0, 1], 1.0e-8
+        )
+
+        grid = np.array([[1.0, 1.0], [0.5, -0.3], [-2.0, 0.1]])
+
+        deflections_of_planes = [
+            np.array([[0.1, 0.2], [0.3, -0.1], [0.2, 0.2]]) * (plane_index + 1)
+            for plane_index in range(len(plane_redshifts))
+        ]
+
+        traced_grids = [grid]
+
+        for plane_index in range(1, len(plane_redshifts)):
+
+            traced_grid = np.zeros(shape=grid.shape)
+
+            al.util.lens.traced_grid_1d_via_multi_plane_recursion(
+                grid_1d_of_plane_before_previous=traced_grids[max(plane_index - 2, 0)],
+                grid_1d_of_previous_plane=traced_grids[plane_index - 1],
+                deflections_1d_of_previous_plane=deflections_of_planes[plane_index - 1],
+                recursion_factor=recursion_factors[plane_index],
+                scaling_factor=scaling_factors[plane_index - 1, plane_index],
+                traced_grid_1d=traced_grid,
+            )
+
+            traced_grids.append(traced_grid)
+
+        for plane_index in range(1, len(plane_redshifts)):
+
+            traced_grid_direct = grid - sum(
+                [
+                    scaling_factors[previous_plane_index, plane_index]
+                    * deflections_of_planes[previous_plane_index]
+                    for previous_plane_index in range(plane_index)
+                ]
+            )
+
+            assert traced_grids[plane_index] == pytest.approx(
+                traced_grid_direct, 1.0e-8
+            )
+
+
+class TestWindows:
+    def test__2_centres__3x3_windows_around_each_centre(self):
+
+        grid = al.util.lens.grid_1d_of_windows_from_centres_half_width_and_upscale_factor(
+            centres=np.array([[0.0, 0.0], [1.0, 2.0]]), half_width=0.5, upscale_factor=3
+        )
+
+        assert grid.shape == (18, 2)
+        assert grid[0:3] == pytest.approx(
+            np.array([[-0.5, -0.5], [-0.5, 0.0], [-0.5, 0.5]]), 1.0e-8
+        )
+        assert grid[4] == pytest.approx(np.array([0.0, 0.0]), 1.0e-8)
+        assert grid[9] == pytest.approx(np.array([0.5, 1.5]), 1.0e-8)
+        assert grid[13] == pytest.approx(np.array([1.0, 2.0]), 1.0e-8)
+        assert grid[17] == pytest.approx(np.array([1.5, 2.5]), 1.0e-8)
+
+
+class TestMaximumSeparations:
+    def test__3_sets__maximum_separation_of_every_set(self):
+
+        grid_1d = np.array(
+            [
+                [0.0, 0.0],
+                [0.0, 1.0],
+                [0.0, 0.5],
+                [0.0, 0.0],
+                [3.0, 3.0],
+                [-2.0, -4.0],
+                [1.0, 3.0],
+                [0.1, 0.1],
+            ]
+        )
+
+        maximum_separations = al.util.lens.maximum_separations_from_grid_1d_and_set_sizes(
+            grid_1d=grid_1d, set_sizes=np.array([3, 2, 3]), threshold=np.inf
+        )
+
+        assert maximum_separations == pytest.approx(
+            np.array([1.0, np.sqrt(18.0), np.sqrt(58.0)]), 1.0e-8
+        )
+
+    def test__separation_exceeds_threshold__exits_at_that_set(self):
+
+        grid_1d = np.array(
+            [[0.0, 0.0], [0.0, 1.0], [0.0, 0.0], [3.0, 3.0], [0.0, 0.0], [0.0, 9.0]]
+        )
+
+        maximum_separations = al.util.lens.maximum_separations_from_grid_1d_and_set_sizes(
+            grid_1d=grid_1d, set_sizes=np.array([2, 2, 2]), threshold=2.0
+        )
+
+        assert maximum_separations == pytest.approx(
+            np.array([1.0, np.sqrt(18.0)]), 1.0e-8
+        )
+
+    def test__positions_within_threshold__true_only_if_every_set_within_threshold(self):
+
+        grid_1d = np.array(
+            [[0.0, 0.0], [0.0, 1.0], [0.0, 0.0], [3.0, 3.0], [0.0, 0.0], [0.0, 9.0]]
+        )
+
+        assert al.util.lens.positions_within_threshold_from_grid_1d_and_set_sizes(
+            grid_1d=grid_1d, set_sizes=np.array([2, 2, 2]), threshold=10.0
+        )
+        assert not al.util.lens.positions_within_threshold_from_grid_1d_and_set_sizes(
+            grid_1d=grid_1d, set_sizes=np.array([2, 2, 2]), threshold=5.0
+        )
+        assert not al.util.lens.positions_within_threshold_from_grid_1d_and_set_sizes(
+            grid_1d=grid_1d, set_sizes=np.array([2, 2, 2]), threshold=2.0
+        )
+
+
+class TestAdaptiveLattice:
+    def test__linear_function__interpolated_exactly_without_refinement(self):
+
+        calls = []
+
+        def func(grid):
+            calls.append(grid.shape[0])
+            return np.stack([2.0 * grid[:, 0] + grid[:, 1], grid[:, 1] - 1.0], axis=1)
+
+        grid = np.random.RandomState(1).uniform(low=-1.0, high=1.0, size=(500, 2))
+
+        values, error = al.util.lens.interpolated_values_and_error_from_grid_and_func_via_adaptive_lattice(
+            grid=grid, func=func, pixel_scale=0.5, tolerance=1.0e-4, refinements=3
+        )
+
+        assert len(calls) == 2
+        assert sum(calls) < 100
+        assert values == pytest.approx(func(grid), 1.0e-8)
+        assert error == pytest.approx(0.0, abs=1.0e-8)
+
+    def test__cusp__lattice_refined_until_error_within_tolerance(self):
+        def func(grid):
+            return np.sqrt(grid[:, 0] ** 2 + grid[:, 1] ** 2 + 0.01)[:, None]
+
+        grid = np.random.RandomState(1).uniform(low=-1.0, high=1.0, size=(5000, 2))
+
+        values, error = al.util.lens.interpolated_values_and_error_from_grid_and_func_via_adaptive_lattice(
+            grid=grid, func=func, pixel_scale=0.5, tolerance=1.0e-3, refinements=5
+        )
+
+        assert error <= 1.0e-3
+        assert np.max(np.abs(values - func(grid))) < 2.0e-3
+
+        values, error = al.util.lens.interpolated_values_and_error_from_grid_and_func_via_adaptive_lattice(
+            grid=grid, func=func, pixel_scale=0.5, tolerance=1.0e-3, refinements=0
+        )
+
+        assert error > 1.0e-3
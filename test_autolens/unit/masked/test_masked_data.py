@@ -1,6 +1,10 @@
+import copy
+import pickle
+
 from autoarray.operators import convolver, transformer
 import autolens as al
 import numpy as np
+import pytest
 
 
 class TestMaskedImaging:
@@ -130,6 +134,95 @@ class TestMaskedImaging:
             )
         ).all()
 
+    def test__signal_to_noise_limited__shares_grids_and_convolver__cached_per_limit(
+        self, imaging_7x7, sub_mask_7x7
+    ):
+
+        masked_imaging_7x7 = al.masked.imaging(imaging=imaging_7x7, mask=sub_mask_7x7)
+
+        masked_imaging_7x7.preload_blurred_profile_image = 1
+
+        masked_imaging_limited = masked_imaging_7x7.signal_to_noise_limited_from_signal_to_noise_limit(
+            signal_to_noise_limit=0.25
+        )
+
+        masked_imaging_direct = al.masked.imaging(
+            imaging=imaging_7x7.signal_to_noise_limited_from_signal_to_noise_limit(
+                signal_to_noise_limit=0.25
+            ),
+            mask=sub_mask_7x7,
+        )
+
+        assert (masked_imaging_limited.noise_map == 4.0 * np.ones(9)).all()
+        assert (
+            masked_imaging_limited.noise_map.in_2d
+            == masked_imaging_direct.noise_map.in_2d
+        ).all()
+        assert (
+            masked_imaging_limited.imaging.noise_map.in_2d
+            == masked_imaging_direct.imaging.noise_map.in_2d
+        ).all()
+        assert (masked_imaging_limited.image == masked_imaging_direct.image).all()
+        assert (masked_imaging_7x7.noise_map == 2.0 * np.ones(9)).all()
+
+        assert masked_imaging_limited.grid.base is masked_imaging_7x7.grid
+        assert (
+            masked_imaging_limited.blurring_grid.base
+            is masked_imaging_7x7.blurring_grid
+        )
+        assert masked_imaging_limited.psf.base is masked_imaging_7x7.psf
+        assert (
+            masked_imaging_limited.convolver.image_frame_1d_indexes.base
+            is masked_imaging_7x7.convolver.image_frame_1d_indexes
+        )
+        assert masked_imaging_limited.grid.mask is masked_imaging_7x7.grid.mask
+        assert masked_imaging_limited.preload_blurred_profile_image is None
+
+        assert not masked_imaging_limited.grid.flags.writeable
+        assert not masked_imaging_limited.blurring_grid.flags.writeable
+        assert not masked_imaging_limited.psf.flags.writeable
+        assert (
+            not masked_imaging_limited.convolver.image_frame_1d_indexes.flags.writeable
+        )
+
+        assert masked_imaging_7x7.grid.flags.writeable
+        assert masked_imaging_7x7.convolver.image_frame_1d_indexes.flags.writeable
+
+        with pytest.raises(ValueError):
+            masked_imaging_limited.grid[0, 0] = 1.0
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(redshift=0.5, light=al.lp.SphericalSersic(intensity=1.0))
+            ]
+        )
+
+        assert tracer.blurred_profile_image_from_grid_and_convolver(
+            grid=masked_imaging_limited.grid,
+            convolver=masked_imaging_limited.convolver,
+            blurring_grid=masked_imaging_limited.blurring_grid,
+        ) == pytest.approx(
+            tracer.blurred_profile_image_from_grid_and_convolver(
+                grid=masked_imaging_direct.grid,
+                convolver=masked_imaging_direct.convolver,
+                blurring_grid=masked_imaging_direct.blurring_grid,
+            ),
+            1.0e-8,
+        )
+
+        assert (
+            masked_imaging_7x7.signal_to_noise_limited_from_signal_to_noise_limit(
+                signal_to_noise_limit=0.25
+            )
+            is masked_imaging_limited
+        )
+        assert (
+            masked_imaging_7x7.signal_to_noise_limited_from_signal_to_noise_limit(
+                signal_to_noise_limit=0.1
+            )
+            is not masked_imaging_limited
+        )
+
     def test__methods_for_new_data_pass_lensing_only_attributes(
         self, imaging_7x7, sub_mask_7x7
     ):
@@ -158,6 +251,134 @@ class TestMaskedImaging:
         assert masked_imaging_new.positions_threshold == 2
         assert masked_imaging_new.preload_sparse_grids_of_planes == 3
 
+    def test__precision_float32__grids_stored_in_single_precision_and_passed_to_new_data(
+        self, imaging_7x7, sub_mask_7x7
+    ):
+
+        masked_imaging_7x7 = al.masked.imaging(imaging=imaging_7x7, mask=sub_mask_7x7)
+
+        assert masked_imaging_7x7.precision == "float64"
+        assert masked_imaging_7x7.grid.dtype == np.float64
+
+        masked_imaging_7x7 = al.masked.imaging(
+            imaging=imaging_7x7, mask=sub_mask_7x7, precision="float32"
+        )
+
+        assert masked_imaging_7x7.grid.dtype == np.float32
+        assert masked_imaging_7x7.blurring_grid.dtype == np.float32
+        assert masked_imaging_7x7.grid.sub_size == sub_mask_7x7.sub_size
+        assert masked_imaging_7x7.image.dtype == np.float64
+
+        masked_imaging_new = masked_imaging_7x7.signal_to_noise_limited_from_signal_to_noise_limit(
+            signal_to_noise_limit=0.25
+        )
+
+        assert masked_imaging_new.precision == "float32"
+        assert masked_imaging_new.grid.dtype == np.float32
+
+
+class TestPreprocessingCache:
+    def test__same_mask_and_psf__preprocessing_reused_and_image_not_in_key(
+        self, imaging_7x7, sub_mask_7x7
+    ):
+
+        masked_imaging_7x7 = al.masked.imaging(imaging=imaging_7x7, mask=sub_mask_7x7)
+
+        cache = al.masked.preprocessing_cache(maxsize=2)
+
+        masked_imaging_0 = al.masked.imaging(
+            imaging=imaging_7x7, mask=sub_mask_7x7, preprocessing_cache=cache
+        )
+
+        assert (masked_imaging_0.grid == masked_imaging_7x7.grid).all()
+        assert (
+            masked_imaging_0.blurring_grid == masked_imaging_7x7.blurring_grid
+        ).all()
+        assert (masked_imaging_0.psf == masked_imaging_7x7.psf).all()
+        assert (masked_imaging_0.image == masked_imaging_7x7.image).all()
+        assert (
+            masked_imaging_0.convolver.image_frame_1d_indexes
+            == masked_imaging_7x7.convolver.image_frame_1d_indexes
+        ).all()
+        assert masked_imaging_0.psf_shape_2d == (3, 3)
+        assert (cache.hits, cache.misses) == (0, 1)
+
+        imaging_7x7.image[:] = 2.0
+
+        masked_imaging_1 = al.masked.imaging(
+            imaging=imaging_7x7, mask=sub_mask_7x7, preprocessing_cache=cache
+        )
+
+        assert masked_imaging_1.convolver is masked_imaging_0.convolver
+        assert masked_imaging_1.grid is masked_imaging_0.grid
+        assert masked_imaging_1.blurring_grid is masked_imaging_0.blurring_grid
+        assert masked_imaging_1.psf is masked_imaging_0.psf
+        assert masked_imaging_1.psf_shape_2d == (3, 3)
+        assert masked_imaging_1.imaging is imaging_7x7
+        assert (masked_imaging_1.image == 2.0 * np.ones(9)).all()
+        assert (masked_imaging_1.noise_map == masked_imaging_7x7.noise_map).all()
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        al.masked.imaging(
+            imaging=imaging_7x7,
+            mask=sub_mask_7x7,
+            psf_shape_2d=(1, 1),
+            preprocessing_cache=cache,
+        )
+
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test__path_input__preprocessing_loaded_from_disk_by_new_cache(
+        self, imaging_7x7, sub_mask_7x7, tmp_path
+    ):
+
+        masked_imaging_7x7 = al.masked.imaging(imaging=imaging_7x7, mask=sub_mask_7x7)
+
+        al.masked.imaging(
+            imaging=imaging_7x7,
+            mask=sub_mask_7x7,
+            preprocessing_cache=al.masked.preprocessing_cache(
+                maxsize=2, path=str(tmp_path)
+            ),
+        )
+
+        assert len(list(tmp_path.glob("*.pickle"))) == 1
+
+        cache = al.masked.preprocessing_cache(maxsize=2, path=str(tmp_path))
+
+        masked_imaging = al.masked.imaging(
+            imaging=imaging_7x7, mask=sub_mask_7x7, preprocessing_cache=cache
+        )
+
+        assert (cache.hits, cache.disk_hits, cache.misses) == (0, 1, 0)
+        assert (masked_imaging.grid == masked_imaging_7x7.grid).all()
+        assert (masked_imaging.blurring_grid == masked_imaging_7x7.blurring_grid).all()
+        assert (
+            masked_imaging.convolver.image_frame_1d_indexes
+            == masked_imaging_7x7.convolver.image_frame_1d_indexes
+        ).all()
+        assert (
+            masked_imaging.convolver.blurring_frame_1d_kernels
+            == masked_imaging_7x7.convolver.blurring_frame_1d_kernels
+        ).all()
+
+    def test__copies_share_cache_and_pickled_cache_is_empty(
+        self, imaging_7x7, sub_mask_7x7
+    ):
+
+        cache = al.masked.preprocessing_cache(maxsize=2)
+
+        al.masked.imaging(
+            imaging=imaging_7x7, mask=sub_mask_7x7, preprocessing_cache=cache
+        )
+
+        assert copy.deepcopy(cache) is cache
+
+        cache = pickle.loads(pickle.dumps(cache))
+
+        assert cache.maxsize == 2
+        assert len(cache.preprocessings) == 0
+
 
 class TestMaskedInterferometer:
     def test__masked_dataset_via_autoarray(
@@ -1,4 +1,6 @@
+import copy
 import os
+import pickle
 from os import path
 
 import numpy as np
@@ -96,6 +98,50 @@ class TestPhase:
             )
             phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
 
+    def test__positions_threshold_check__agrees_with_positions_fit(
+        self, imaging_7x7, mask_7x7
+    ):
+        positions = [[(1.0, 1.0), (2.0, 2.0), (-1.0, 0.5)], [(0.5, 0.5), (0.0, 1.5)]]
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                ),
+                al.Galaxy(redshift=1.0),
+            ]
+        )
+
+        maximum_separation = max(
+            al.fit_positions(
+                positions=al.coordinates(coordinates=positions),
+                tracer=tracer,
+                noise_map=1.0,
+            ).maximum_separations
+        )
+
+        for threshold, within_threshold in [
+            (1.01 * maximum_separation, True),
+            (0.99 * maximum_separation, False),
+        ]:
+
+            masked_imaging = al.masked.imaging(
+                imaging=imaging_7x7,
+                mask=mask_7x7,
+                positions=positions,
+                positions_threshold=threshold,
+            )
+
+            if within_threshold:
+                masked_imaging.check_positions_trace_within_threshold_via_tracer(
+                    tracer=tracer
+                )
+            else:
+                with pytest.raises(exc.RayTracingException):
+                    masked_imaging.check_positions_trace_within_threshold_via_tracer(
+                        tracer=tracer
+                    )
+
     def test__make_analysis__positions_do_not_trace_within_threshold__raises_exception(
         self, phase_imaging_7x7, imaging_7x7, mask_7x7
     ):
@@ -413,6 +459,84 @@ class TestPhase:
 
         assert phase_imaging_7x7.meta_imaging_fit.uses_cluster_inversion is True
 
+    def test__profiles_are_fixed__profile_quantities_preloaded_in_analysis(
+        self, imaging_7x7, mask_7x7
+    ):
+        lens_galaxy = al.Galaxy(
+            redshift=0.5,
+            light=al.lp.EllipticalSersic(intensity=1.0),
+            mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+        )
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            phase_name="test_phase",
+            galaxies=dict(
+                lens=al.GalaxyModel(
+                    redshift=0.5, light=al.lp.EllipticalSersic, mass=lens_galaxy.mass
+                ),
+                source=al.GalaxyModel(
+                    redshift=1.0,
+                    pixelization=al.pix.Rectangular,
+                    regularization=al.reg.Constant,
+                ),
+            ),
+        )
+
+        assert phase_imaging_7x7.meta_imaging_fit.profiles_are_fixed is False
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        assert analysis.masked_imaging.preload_blurred_profile_image is None
+        assert analysis.masked_imaging.preload_traced_grids_of_planes is None
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            phase_name="test_phase",
+            galaxies=dict(
+                lens=lens_galaxy,
+                source=al.GalaxyModel(
+                    redshift=1.0,
+                    pixelization=al.pix.Rectangular,
+                    regularization=al.reg.Constant,
+                ),
+            ),
+        )
+
+        assert phase_imaging_7x7.meta_imaging_fit.profiles_are_fixed is True
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[lens_galaxy, al.Galaxy(redshift=1.0)]
+        )
+
+        assert analysis.masked_imaging.preload_blurred_profile_image == pytest.approx(
+            tracer.blurred_profile_image_from_grid_and_convolver(
+                grid=analysis.masked_imaging.grid,
+                convolver=analysis.masked_imaging.convolver,
+                blurring_grid=analysis.masked_imaging.blurring_grid,
+            ),
+            1.0e-8,
+        )
+        assert analysis.masked_imaging.preload_traced_grids_of_planes[
+            1
+        ] == pytest.approx(
+            tracer.traced_grids_of_planes_from_grid(grid=analysis.masked_imaging.grid)[
+                1
+            ],
+            1.0e-8,
+        )
+
+        fit = analysis.fit_for_instance(
+            instance=phase_imaging_7x7.model.instance_from_unit_vector(
+                [0.3] * phase_imaging_7x7.model.prior_count
+            )
+        )
+
+        assert (
+            fit.blurred_profile_image
+            is analysis.masked_imaging.preload_blurred_profile_image
+        )
+
     def test__use_border__determines_if_border_pixel_relocation_is_used(
         self, imaging_7x7, mask_7x7
     ):
@@ -756,3 +880,101 @@ class TestPhasePickle:
 
         # with pytest.raises(af.exc.PipelineException):
         #     phase_imaging_7x7.run(data_type=imaging_7x7, results=None, mask=None, positions=None)
+
+
+class TestDatasetStore:
+    def test__dataset_written_once__pickles_load_memory_mapped_dataset(
+        self, imaging_7x7, tmp_path
+    ):
+
+        store = al.DatasetStore(path=str(tmp_path / "dataset_store"))
+
+        for phase_name in ("phase_0", "phase_1"):
+
+            os.makedirs(str(tmp_path / phase_name))
+
+            store.save_dataset(
+                dataset=imaging_7x7, phase_output_path=str(tmp_path / phase_name)
+            )
+
+        assert len(os.listdir(store.path)) == 1
+
+        with open(str(tmp_path / "phase_1" / "mock_imaging_7x7.pickle"), "rb") as f:
+            imaging = pickle.load(f)
+
+        assert isinstance(imaging, al.imaging)
+        assert isinstance(imaging.image, al.array)
+        assert isinstance(imaging.image.base, np.memmap)
+        assert imaging.name == "mock_imaging_7x7"
+        assert (imaging.image.in_2d == imaging_7x7.image.in_2d).all()
+        assert (imaging.noise_map == imaging_7x7.noise_map).all()
+        assert (imaging.psf.in_2d == imaging_7x7.psf.in_2d).all()
+        assert imaging.image.mask.pixel_scales == imaging_7x7.image.mask.pixel_scales
+        assert imaging.image.mask.sub_size == imaging_7x7.image.mask.sub_size
+
+        with pytest.raises(ValueError):
+            imaging.image[0] = 10.0
+
+    def test__copies_share_store__pickled_store_is_empty(self, imaging_7x7, tmp_path):
+
+        store = al.DatasetStore(path=str(tmp_path / "dataset_store"))
+
+        store.save_dataset(dataset=imaging_7x7, phase_output_path=str(tmp_path))
+
+        assert copy.deepcopy(store) is store
+
+        store_unpickled = pickle.loads(pickle.dumps(store))
+
+        assert store_unpickled.path == store.path
+        assert len(store_unpickled.stored_dataset_directories) == 0
+
+    def test__phase_run__dataset_pickle_loads_dataset_from_store(
+        self, imaging_7x7, mask_7x7, tmp_path
+    ):
+        clean_images()
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            optimizer_class=mock_pipeline.MockNLO,
+            galaxies=[
+                al.Galaxy(redshift=0.5, light=al.lp.EllipticalSersic(intensity=1.0))
+            ],
+            phase_name="test_phase_dataset_store",
+            dataset_store=al.DatasetStore(path=str(tmp_path / "dataset_store")),
+        )
+
+        phase_imaging_7x7.run(dataset=imaging_7x7, mask=mask_7x7)
+
+        with open(
+            os.path.join(
+                phase_imaging_7x7.paths.phase_output_path, "mock_imaging_7x7.pickle"
+            ),
+            "rb",
+        ) as f:
+            imaging = pickle.load(f)
+
+        assert isinstance(imaging.image.base, np.memmap)
+        assert (imaging.image == imaging_7x7.image).all()
+
+    def test__phase_run__no_store__full_dataset_pickled(self, imaging_7x7, mask_7x7):
+        clean_images()
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            optimizer_class=mock_pipeline.MockNLO,
+            galaxies=[
+                al.Galaxy(redshift=0.5, light=al.lp.EllipticalSersic(intensity=1.0))
+            ],
+            phase_name="test_phase_dataset_store",
+        )
+
+        phase_imaging_7x7.run(dataset=imaging_7x7, mask=mask_7x7)
+
+        with open(
+            os.path.join(
+                phase_imaging_7x7.paths.phase_output_path, "mock_imaging_7x7.pickle"
+            ),
+            "rb",
+        ) as f:
+            imaging = pickle.load(f)
+
+        assert not isinstance(imaging.image.base, np.memmap)
+        assert (imaging.image == imaging_7x7.image).all()
@@ -1,3 +1,4 @@
+import copy
 import os
 from os import path
 
@@ -6,8 +7,12 @@ import pytest
 from astropy import cosmology as cosmo
 
 import autofit as af
+from autoarray.fit import fit as aa_fit
 import autolens as al
+from autolens import exc
 from autolens.fit.fit import ImagingFit
+from autolens.pipeline.phase.dataset.analysis import LikelihoodCache
+from autolens.pipeline.phase.imaging.analysis import DelayedAcceptance
 from test_autolens.mock import mock_pipeline
 
 pytestmark = pytest.mark.filterwarnings(
@@ -207,6 +212,33 @@ class TestPhase:
             == binned_up_masked_imaging.noise_map.in_1d
         ).all()
 
+    def test__preprocessing_cache__shared_by_phases_and_their_copies(
+        self, imaging_7x7, mask_7x7
+    ):
+        preprocessing_cache = al.masked.preprocessing_cache(maxsize=2)
+
+        phase_0 = al.PhaseImaging(
+            phase_name="phase_0", preprocessing_cache=preprocessing_cache
+        )
+        phase_1 = al.PhaseImaging(
+            phase_name="phase_1", preprocessing_cache=preprocessing_cache
+        )
+
+        analysis_0 = phase_0.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        assert (preprocessing_cache.hits, preprocessing_cache.misses) == (0, 1)
+
+        analysis_1 = phase_1.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        assert (preprocessing_cache.hits, preprocessing_cache.misses) == (1, 1)
+        assert (
+            analysis_1.masked_imaging.convolver is analysis_0.masked_imaging.convolver
+        )
+
+        phase_copy = copy.deepcopy(phase_1)
+
+        assert phase_copy.meta_imaging_fit.preprocessing_cache is preprocessing_cache
+
     def test__phase_can_receive_hyper_image_and_noise_maps(self):
         phase_imaging_7x7 = al.PhaseImaging(
             galaxies=dict(
@@ -310,6 +342,45 @@ class TestPhase:
 
         assert fit.likelihood == fit_figure_of_merit
 
+    def test__fit_figure_of_merit__with_inversion__computed_without_residual_and_chi_squared_maps(
+        self, imaging_7x7, mask_7x7, monkeypatch
+    ):
+        lens_galaxy = al.Galaxy(
+            redshift=0.5,
+            light=al.lp.EllipticalSersic(intensity=0.1),
+            mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+        )
+        source_galaxy = al.Galaxy(
+            redshift=1.0,
+            pixelization=al.pix.Rectangular(shape=(3, 3)),
+            regularization=al.reg.Constant(coefficient=1.0),
+        )
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=[lens_galaxy, source_galaxy], sub_size=1, phase_name="test_phase"
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+        instance = phase_imaging_7x7.model.instance_from_unit_vector([])
+
+        masked_imaging = al.masked.imaging(imaging=imaging_7x7, mask=mask_7x7)
+        fit = al.fit(
+            masked_dataset=masked_imaging,
+            tracer=analysis.tracer_for_instance(instance=instance),
+        )
+
+        evidence = fit.evidence
+        chi_squared = np.sum(fit.chi_squared_map)
+
+        def raise_error(self):
+            raise AttributeError
+
+        for map_name in ["residual_map", "normalized_residual_map", "chi_squared_map"]:
+            monkeypatch.setattr(aa_fit.DatasetFit, map_name, property(raise_error))
+
+        assert analysis.fit(instance=instance) == evidence
+        assert fit.chi_squared == chi_squared
+
     def test__fit_figure_of_merit__includes_hyper_image_and_noise__matches_fit(
         self, imaging_7x7, mask_7x7
     ):
@@ -348,3 +419,307 @@ class TestPhase:
         )
 
         assert fit.likelihood == fit_figure_of_merit
+
+
+class TestDelayedAcceptance:
+    def test__coarse_figure_of_merit_far_below_those_of_live_points__rejected(self):
+
+        delayed_acceptance = DelayedAcceptance(
+            masked_imaging=None,
+            bin_up_factor=2,
+            n_live_points=3,
+            log_likelihood_margin=1.0,
+        )
+
+        delayed_acceptance.check_coarse_figure_of_merit(coarse_figure_of_merit=-100.0)
+
+        delayed_acceptance.add_figures_of_merit(
+            figure_of_merit=20.0, coarse_figure_of_merit=6.0
+        )
+        delayed_acceptance.add_figures_of_merit(
+            figure_of_merit=10.0, coarse_figure_of_merit=5.0
+        )
+
+        assert delayed_acceptance.lowest_live_figure_of_merit == -np.inf
+
+        delayed_acceptance.check_coarse_figure_of_merit(coarse_figure_of_merit=-100.0)
+
+        delayed_acceptance.add_figures_of_merit(
+            figure_of_merit=30.0, coarse_figure_of_merit=7.0
+        )
+
+        assert delayed_acceptance.lowest_live_figure_of_merit == 10.0
+        assert delayed_acceptance.lowest_live_coarse_figure_of_merit == 5.0
+
+        with pytest.raises(exc.DelayedAcceptanceException):
+            delayed_acceptance.check_coarse_figure_of_merit(coarse_figure_of_merit=3.5)
+
+        delayed_acceptance.check_coarse_figure_of_merit(coarse_figure_of_merit=4.5)
+
+        delayed_acceptance.add_figures_of_merit(
+            figure_of_merit=5.0, coarse_figure_of_merit=4.5
+        )
+
+        assert delayed_acceptance.lowest_live_figure_of_merit == 10.0
+        assert delayed_acceptance.lowest_live_coarse_figure_of_merit == 5.0
+
+        delayed_acceptance.add_figures_of_merit(
+            figure_of_merit=25.0, coarse_figure_of_merit=8.0
+        )
+
+        assert delayed_acceptance.lowest_live_figure_of_merit == 20.0
+        assert delayed_acceptance.lowest_live_coarse_figure_of_merit == 6.0
+
+        with pytest.raises(exc.DelayedAcceptanceException):
+            delayed_acceptance.check_coarse_figure_of_merit(coarse_figure_of_merit=4.5)
+
+        assert delayed_acceptance.evaluations == 5
+        assert delayed_acceptance.rejections == 2
+        assert delayed_acceptance.fraction_of_evaluations_saved == pytest.approx(
+            2.0 / 5.0, 1.0e-8
+        )
+
+    def test__coarse_figure_of_merit__uses_binned_hyper_images_and_restores_them(
+        self, masked_imaging_7x7, hyper_model_image_7x7, hyper_galaxy_image_0_7x7
+    ):
+        galaxy = al.Galaxy(
+            redshift=0.5,
+            light=al.lp.EllipticalSersic(intensity=0.1),
+            hyper_galaxy=al.HyperGalaxy(
+                contribution_factor=1.0, noise_factor=1.0, noise_power=1.0
+            ),
+            hyper_model_image=hyper_model_image_7x7,
+            hyper_galaxy_image=hyper_galaxy_image_0_7x7,
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[galaxy])
+
+        delayed_acceptance = DelayedAcceptance(
+            masked_imaging=masked_imaging_7x7,
+            bin_up_factor=1,
+            n_live_points=1,
+            log_likelihood_margin=0.0,
+        )
+
+        coarse_figure_of_merit = delayed_acceptance.coarse_figure_of_merit_from_tracer(
+            tracer=tracer, hyper_image_sky=None, hyper_background_noise=None
+        )
+
+        fit = ImagingFit(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+        assert coarse_figure_of_merit == pytest.approx(fit.likelihood, 1.0e-8)
+        assert galaxy.hyper_model_image is hyper_model_image_7x7
+        assert galaxy.hyper_galaxy_image is hyper_galaxy_image_0_7x7
+        assert (
+            delayed_acceptance.coarse_hyper_image_from_hyper_image(
+                hyper_image=hyper_galaxy_image_0_7x7
+            )
+            == hyper_galaxy_image_0_7x7
+        ).all()
+
+    def test__analysis_fit__rejected_samples_raise_fit_exception_and_are_not_cached(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, light=al.lp.EllipticalSersic)
+            ),
+            sub_size=1,
+            likelihood_cache_maxsize=10,
+            phase_name="test_phase",
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        assert analysis.delayed_acceptance is None
+
+        instances = [
+            phase_imaging_7x7.model.instance_from_unit_vector(
+                [unit_value] * phase_imaging_7x7.model.prior_count
+            )
+            for unit_value in [0.5, 0.9]
+        ]
+
+        figures_of_merit = [analysis.fit(instance=instance) for instance in instances]
+
+        assert figures_of_merit[1] < figures_of_merit[0]
+
+        analysis.likelihood_cache.figures_of_merit.clear()
+
+        analysis.delayed_acceptance = DelayedAcceptance(
+            masked_imaging=analysis.masked_imaging,
+            bin_up_factor=1,
+            n_live_points=1,
+            log_likelihood_margin=0.0,
+        )
+
+        assert analysis.fit(instance=instances[0]) == pytest.approx(
+            figures_of_merit[0], 1.0e-8
+        )
+        assert analysis.delayed_acceptance.rejections == 0
+        assert analysis.delayed_acceptance.lowest_live_figure_of_merit == pytest.approx(
+            figures_of_merit[0], 1.0e-8
+        )
+
+        with pytest.raises(af.exc.FitException):
+            analysis.fit(instance=instances[1])
+
+        assert analysis.delayed_acceptance.rejections == 1
+        assert analysis.delayed_acceptance.fraction_of_evaluations_saved == 0.5
+        assert len(analysis.likelihood_cache.figures_of_merit) == 1
+
+    def test__optimizer_without_live_points__raises_phase_exception(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = al.PhaseImaging(
+            optimizer_class=mock_pipeline.MockNLO,
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, light=al.lp.EllipticalSersic)
+            ),
+            delayed_acceptance_bin_up_factor=2,
+            phase_name="test_phase",
+        )
+
+        with pytest.raises(exc.PhaseException):
+            phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+
+class TestLikelihoodCache:
+    def test__parameter_vector_from_instance__physical_vector_of_model(self):
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, light=al.lp.EllipticalSersic),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.SphericalExponential),
+            ),
+            phase_name="test_phase",
+        )
+
+        model = phase_imaging_7x7.model
+
+        likelihood_cache = LikelihoodCache(maxsize=10, model=model)
+
+        unit_vectors = [
+            [unit_value] * model.prior_count for unit_value in [0.5, 0.5, 0.9]
+        ]
+
+        instances = [
+            model.instance_from_unit_vector(unit_vector) for unit_vector in unit_vectors
+        ]
+
+        instances[1].galaxies.lens.hyper_galaxy_image = np.ones(3)
+
+        parameter_vectors = [
+            likelihood_cache.parameter_vector_from_instance(instance=instance)
+            for instance in instances
+        ]
+
+        assert parameter_vectors[0] == pytest.approx(
+            tuple(model.physical_vector_from_hypercube_vector(unit_vectors[0])), 1.0e-8
+        )
+        assert parameter_vectors[0] == parameter_vectors[1]
+        assert parameter_vectors[0] != parameter_vectors[2]
+
+    def test__parameter_vector_from_instance__parameter_not_an_attribute__is_none(self):
+
+        model = af.ModelMapper()
+        model.galaxies = af.CollectionPriorModel(
+            lens=al.GalaxyModel(
+                redshift=0.5, mass=al.mp.SphericalTruncatedNFWMassToConcentration
+            )
+        )
+
+        likelihood_cache = LikelihoodCache(maxsize=10, model=model)
+
+        instance = model.instance_from_unit_vector([0.5] * model.prior_count)
+
+        assert (
+            likelihood_cache.parameter_vector_from_instance(instance=instance) is None
+        )
+
+    def test__lru_cache_bounded_by_maxsize(self):
+
+        likelihood_cache = LikelihoodCache(maxsize=2, model=af.ModelMapper())
+
+        likelihood_cache.add_figure_of_merit(
+            parameter_vector=(1.0,), figure_of_merit=1.0
+        )
+        likelihood_cache.add_figure_of_merit(
+            parameter_vector=(2.0,), figure_of_merit=2.0
+        )
+
+        assert (
+            likelihood_cache.figure_of_merit_for_parameter_vector(
+                parameter_vector=(1.0,)
+            )
+            == 1.0
+        )
+
+        likelihood_cache.add_figure_of_merit(
+            parameter_vector=(3.0,), figure_of_merit=3.0
+        )
+
+        assert list(likelihood_cache.figures_of_merit.keys()) == [(1.0,), (3.0,)]
+        assert (
+            likelihood_cache.figure_of_merit_for_parameter_vector(
+                parameter_vector=(2.0,)
+            )
+            is None
+        )
+        assert likelihood_cache.hits == 1
+        assert likelihood_cache.misses == 1
+
+    def test__analysis_fit__repeated_instances_not_refitted_and_fit_reused(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, light=al.lp.EllipticalSersic)
+            ),
+            sub_size=1,
+            likelihood_cache_maxsize=10,
+            phase_name="test_phase",
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        instances = [
+            phase_imaging_7x7.model.instance_from_unit_vector(
+                [unit_value] * phase_imaging_7x7.model.prior_count
+            )
+            for unit_value in [0.5, 0.9, 0.5]
+        ]
+
+        figures_of_merit = [analysis.fit(instance=instance) for instance in instances]
+
+        assert figures_of_merit[2] == figures_of_merit[0]
+        assert figures_of_merit[1] < figures_of_merit[0]
+        assert analysis.likelihood_cache.hits == 1
+        assert analysis.likelihood_cache.misses == 2
+
+        fit = analysis.fit_for_instance(instance=instances[2])
+
+        assert fit.figure_of_merit == pytest.approx(figures_of_merit[0], 1.0e-8)
+        assert analysis.fit_for_instance(instance=instances[0]) is fit
+        assert analysis.likelihood_cache.hits == 3
+
+        fit_worse = analysis.fit_for_instance(instance=instances[1])
+
+        assert fit_worse.figure_of_merit == pytest.approx(figures_of_merit[1], 1.0e-8)
+        assert analysis.likelihood_cache.misses == 3
+        assert analysis.likelihood_cache.fit is fit
+        assert analysis.fit_for_instance(instance=instances[0]) is fit
+        assert analysis.likelihood_cache.hits == 4
+
+        analysis_no_cache = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, light=al.lp.EllipticalSersic)
+            ),
+            sub_size=1,
+            phase_name="test_phase",
+        ).make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        assert analysis_no_cache.likelihood_cache is None
+        assert analysis_no_cache.fit(instance=instances[1]) == pytest.approx(
+            figures_of_merit[1], 1.0e-8
+        )